@@ -4,9 +4,10 @@ import copy
 import inspect
 import logging
 import timeit
+import tracemalloc
 from typing import TYPE_CHECKING, Callable, Final, TypeVar
 
-from tense import TenseParser, model, resolvers
+from tense import TenseParser, model, resolvers, units
 from tense.adapters import repository
 
 if TYPE_CHECKING:
@@ -21,8 +22,12 @@ _BASIC_UNRESOLVED_STR2: Final[str] = "1day 2seconds"
 
 _COMPLEX_UNRESOLVED_STR: Final[str] = "1day and 2minutes + 5 seconds"
 
+_VIRTUAL_UNIT_COUNT: Final[int] = 10_000
+
 _TENSE = model.Tense.from_repository(repository.TenseRepository())
 _BASIC_TENSE_DIGIT_PARSER = TenseParser(TenseParser.DIGIT, iteration_speedup=True)
+_REGEX_TENSE_PARSER = TenseParser(TenseParser.REGEX)
+_COMPILED_TENSE_PARSER = TenseParser(TenseParser.COMPILED)
 _SMART_TENSE_DIGIT_PARSER = TenseParser(
     TenseParser.DIGIT,
     iteration_speedup=True,
@@ -55,6 +60,46 @@ def benchmark(*, number: int) -> Callable[[_BT], _BT]:
     return inner
 
 
+def memory_benchmark(fn: _BT) -> _BT:
+    def _code(_str: str) -> str:  # type: ignore[return]
+        for substr in (lst := _str.split("\n")):
+            if "def" not in substr:
+                continue
+            return "\n".join(map(str.strip, lst[lst.index(substr) + 1 :]))
+
+    _BENCHMARK.info(f"Running memory benchmark for {fn.__name__}.")
+    namespace = copy.copy(globals())
+    tracemalloc.start()
+    exec(_code(inspect.getsource(fn)), namespace)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    _BENCHMARK.info(
+        f"The memory benchmark for {fn.__name__} kept {current:,} bytes "
+        f"(peak {peak:,} bytes)."
+    )
+    return fn
+
+
+@memory_benchmark
+def virtual_units_as_objects_memory() -> None:
+    virtual = [
+        {"aliases": [f"virtual{n}", "virtual"], "duration": n + 1}
+        for n in range(_VIRTUAL_UNIT_COUNT)
+    ]
+    virtual_units = [units.VirtualUnit(**unit) for unit in virtual]
+
+
+@memory_benchmark
+def virtual_units_in_registry_memory() -> None:
+    tense = model.Tense(
+        *list(_TENSE)[:6],
+        virtual=[
+            {"aliases": [f"virtual{n}", "virtual"], "duration": n + 1}
+            for n in range(_VIRTUAL_UNIT_COUNT)
+        ],
+    )
+
+
 @benchmark(number=1)
 def basic_resolver_one_time1() -> None:
     resolvers.basic_resolver(_BASIC_UNRESOLVED_STR1, _TENSE)
@@ -103,3 +148,18 @@ def smart_tense_parser_one_time() -> None:
 @benchmark(number=1_000_000)
 def smart_tense_parser_1million_times() -> None:
     _SMART_TENSE_DIGIT_PARSER.parse(_COMPLEX_UNRESOLVED_STR)
+
+
+@benchmark(number=1)
+def regex_tense_parser_one_time() -> None:
+    _REGEX_TENSE_PARSER.parse(_BASIC_UNRESOLVED_STR1)
+
+
+@benchmark(number=1_000_000)
+def regex_tense_parser_1million_times() -> None:
+    _REGEX_TENSE_PARSER.parse(_BASIC_UNRESOLVED_STR1)
+
+
+@benchmark(number=1_000_000)
+def compiled_tense_parser_1million_times() -> None:
+    _COMPILED_TENSE_PARSER.parse(_BASIC_UNRESOLVED_STR1)
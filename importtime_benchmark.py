@@ -0,0 +1,117 @@
+"""Import time benchmark of `import tense`, based on `python -X importtime`.
+
+Exits with status 1 if the best cumulative import time of the package
+exceeds the budget, or if a bare import loads an optional module:
+
+    python importtime_benchmark.py [--budget MILLISECONDS] [--runs N] [--top N]
+
+The budget is enforced by the `importtime` nox session (`nox -s importtime`).
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import subprocess
+import sys
+from typing import Final
+
+logging.basicConfig()
+_BENCHMARK: logging.Logger = logging.getLogger(__file__)
+_BENCHMARK.setLevel(logging.INFO)
+
+_PACKAGE: Final[str] = "tense"
+# Budget of `import tense` in milliseconds (best of runs, cold interpreter),
+# just above the time measured after optional subsystems were made lazy.
+_BUDGET_MS: Final[float] = 70.0
+# Modules that are imported only on first use of the features that need them.
+_OPTIONAL_MODULES: Final[tuple[str, ...]] = (
+    "tense.service_layer.dot_tense",
+    "tense.service_layer.directory",
+    "tense.service_layer.safe_eval",
+    "tense.service_layer.unit_of_work",
+    "concurrent.futures",
+    "difflib",
+    "hashlib",
+    "importlib.metadata",
+    "json",
+)
+_RUNS: Final[int] = 5
+_TOP: Final[int] = 10
+
+
+def _import_times(package: str, /) -> dict[str, int]:
+    """Imports package in a fresh interpreter and returns cumulative
+    import time of every module in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {package}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header.
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def _eager_modules(package: str, /) -> list[str]:
+    """Imports package in a fresh interpreter and returns optional
+    modules that were imported with it.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {package}\n"
+            f"print(*[m for m in {_OPTIONAL_MODULES!r} if m in sys.modules])",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+def main() -> int:
+    argparser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argparser.add_argument("--budget", type=float, default=_BUDGET_MS)
+    argparser.add_argument("--runs", type=int, default=_RUNS)
+    argparser.add_argument("--top", type=int, default=_TOP)
+    args = argparser.parse_args()
+
+    best = min(
+        (_import_times(_PACKAGE) for _ in range(max(args.runs, 1))),
+        key=lambda times: times[_PACKAGE],
+    )
+    elapsed_ms = best[_PACKAGE] / 1000
+    _BENCHMARK.info(
+        f"`import {_PACKAGE}` took {elapsed_ms:.2f}ms "
+        f"(best of {args.runs}, budget {args.budget:.2f}ms)."
+    )
+    for module, cumulative in sorted(best.items(), key=lambda item: -item[1])[
+        1 : args.top + 1
+    ]:
+        _BENCHMARK.info(f"{cumulative / 1000:>10.2f}ms  {module}")
+
+    status = 0
+    eager = _eager_modules(_PACKAGE)
+    if eager:
+        _BENCHMARK.error(f"Optional modules imported eagerly: {', '.join(eager)}.")
+        status = 1
+    if elapsed_ms > args.budget:
+        _BENCHMARK.error(
+            f"Import time budget exceeded by {elapsed_ms - args.budget:.2f}ms."
+        )
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
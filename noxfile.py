@@ -30,6 +30,12 @@ def pytest(session: nox.Session) -> None:
     session.run("pytest")
 
 
+@nox.session
+def importtime(session: nox.Session) -> None:
+    # Fails if `import tense` exceeds the budget of importtime_benchmark.py.
+    session.run("python", "importtime_benchmark.py", *session.posargs)
+
+
 @nox.session
 def reformat_code(session: nox.Session) -> None:
     session.install(*DEV_REQUIREMENTS)
@@ -11,18 +11,63 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Root package."""
-from tense.application import TenseParser, resolvers
-from tense.domain import model, units
-from tense.service_layer import unit_of_work
-from tense.service_layer.dot_tense import from_tense_file, from_tense_file_source
+"""Root package.
+
+Optional subsystems (`.tense` files compiler, units of work) are imported
+on first attribute access, see PEP 562.
+"""
+from __future__ import annotations
 
 __all__ = [
     "model",
     "units",
     "resolvers",
     "TenseParser",
+    "ParserRegistry",
     "unit_of_work",
     "from_tense_file_source",
     "from_tense_file",
+    "from_tense_directory",
 ]
+
+import importlib
+from typing import TYPE_CHECKING, Any, Final, Optional
+
+from tense.application import ParserRegistry, TenseParser, resolvers
+from tense.domain import model, units
+
+if TYPE_CHECKING:
+    from tense import service_layer
+    from tense.service_layer import unit_of_work
+    from tense.service_layer.directory import from_tense_directory
+    from tense.service_layer.dot_tense import from_tense_file, from_tense_file_source
+
+# Lazy attribute name -> (module, attribute or None for the module itself).
+_LAZY_ATTRS: Final[dict[str, tuple[str, Optional[str]]]] = {
+    "service_layer": ("tense.service_layer", None),
+    "unit_of_work": ("tense.service_layer.unit_of_work", None),
+    "from_tense_file": ("tense.service_layer.dot_tense", "from_tense_file"),
+    "from_tense_file_source": (
+        "tense.service_layer.dot_tense",
+        "from_tense_file_source",
+    ),
+    "from_tense_directory": ("tense.service_layer.directory", "from_tense_directory"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = importlib.import_module(module_name)
+    if attr is not None:
+        value = getattr(value, attr)
+    # Cached, so that next lookups don't call this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
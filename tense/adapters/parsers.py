@@ -14,37 +14,102 @@
 """Adapters of tense.application.ports."""
 from __future__ import annotations
 
-__all__ = ["DigitParser", "TimedeltaParser"]
+__all__ = ["DigitParser", "TimedeltaParser", "RegexParser", "CompiledParser"]
 
-from typing import TYPE_CHECKING, Callable, Optional
+import itertools
+import linecache
+import re
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Final, Iterable, Iterator, Optional
 
+from tense.application import resolvers
 from tense.application.ports import parsers as abc_parsers
 
 from . import converters
 
 if TYPE_CHECKING:
     from tense.application.ports import converters as abc_converters
+    from tense.application.resolvers import RawString
     from tense.domain import model
 
 
+_COMPILED_FILENAME: Final[str] = "<tense-compiled-parser-{}>"
+# Numbers of compiled parsers, for their file names.
+_COMPILED_IDS: Final[Iterator[int]] = itertools.count()
+# Attributes set by `CompiledParser._init_source()`, they are not pickled.
+_COMPILED_STATE: Final[tuple[str, ...]] = (
+    "_filename",
+    "source",
+    "_compiled_parse",
+    "_compiled_parse_and_convert",
+)
+
+_COMPILED_TEMPLATE: Final[
+    str
+] = """\
+_DURATIONS = {durations!r}
+
+
+def _parse(raw_str, /, _durations_get=_DURATIONS.get, {deps}):
+    if raw_str.__class__ is not str:
+        return _fallback(raw_str)
+    duration = 0
+{body}
+    return duration
+
+
+def parse(raw_str, /, _parse=_parse{convert_dep}):
+    return {convert_call}
+"""
+
+# Body for `resolvers.basic_resolver`: split result alternates between
+# non-digit parts (even indexes) and digit parts (odd indexes).
+_BASIC_RESOLVER_BODY: Final[
+    str
+] = """\
+    parts = _split(raw_str.replace(" ", ""))
+    for idx in range(1, len(parts) - 1, 2):
+        duration += int(parts[idx]) * _durations_get(parts[idx + 1], 0)"""
+
+_RESOLVER_BODY: Final[
+    str
+] = """\
+    last_num = None
+    for part in _resolver(raw_str, _tense):
+        if part.isdigit():
+            last_num = int(part)
+            continue
+        if last_num is None:
+            continue
+        duration += last_num * _durations_get(part, 0)"""
+
+
+def _alias_pattern_source(aliases: Iterable[str], /, gap: str = r"\s*") -> str:
+    """Returns source of pattern that matches a quantity (group 1) followed
+    by one of `aliases` (group 2), longest first.
+
+    Parameters:
+    -----------
+    aliases: :class:`Iterable[str]`, /
+        Aliases to match.
+    gap: :class:`str` = r"\\s*"
+        Pattern allowed between quantity and alias.
+    """
+    alternation = "|".join(
+        re.escape(alias) for alias in sorted(aliases, key=len, reverse=True)
+    )
+    if not alternation:
+        # Pattern that never matches.
+        return r"(?!)()()"
+    return rf"(\d+){gap}({alternation})(?![^\W\d_])"
+
+
 class DigitParser(abc_parsers.AbstractParser):
-    def _parse(self, raw_str: str, /) -> int:
-        resolved = self._resolver(raw_str, self._tense)
+    def _parse(self, raw_str: RawString, /) -> int:
+        durations = self._unit_durations
         duration = 0
-        last_num: Optional[int] = None
-        try:
-            while 1:
-                part = next(resolved)
-                if part.isdigit():
-                    last_num = int(part)
-                    continue
-                if last_num is None:
-                    continue
-                for unit in self._iterunits:
-                    if part in unit.aliases:
-                        duration += last_num * (unit.duration * self._tense.multiplier)
-        except StopIteration:
-            return duration
+        for quantity, unit_idx in self._pair_resolver(raw_str, self._tense):
+            duration += quantity * durations[unit_idx]
         return duration
 
 
@@ -56,10 +121,212 @@ class TimedeltaParser(DigitParser):
         resolver: Optional[Callable[[str, model.Tense], list[str]]] = None,
         iteration_speedup: bool = False,
         converter: Optional[abc_converters.AbstractConverter] = None,
+        cache_size: int = 0,
     ) -> None:
         super().__init__(
             tense=tense,
             resolver=resolver,
             iteration_speedup=iteration_speedup,
             converter=converters.TimedeltaConverter(),
+            cache_size=cache_size,
+        )
+
+
+class RegexParser(abc_parsers.AbstractParser):
+    """Parser that scans the raw string with a single regular expression.
+
+    The expression is compiled once per instance from the aliases of
+    `model.Tense`: a quantity followed by an alternation of every alias,
+    longest first. Matches are summed directly, without intermediate
+    tokens.
+
+    !!! note
+        Resolvers are not used by this parser, `resolver` is kept only
+        to match the signature of other parsers.
+
+    !!! note
+        An alias must not be immediately followed by a letter, so "1dayz"
+        is not parsed as "1day".
+
+    !!! info
+        Bytes-like strings are scanned by a bytes pattern compiled from
+        ASCII aliases, without decoding.
+
+    Examples:
+    ---------
+    >>> from tense import TenseParser
+
+    >>> parser = TenseParser(TenseParser.REGEX)
+    >>> parser.parse("1d1min")
+    86460
+    >>> parser.parse("1 hour, 5 seconds")
+    3605
+    >>> parser.parse(b"1 hour, 5 seconds")
+    3605
+    """
+
+    def __init__(
+        self,
+        *,
+        tense: model.Tense,
+        resolver: Optional[Callable[[str, model.Tense], Iterator[str]]] = None,
+        converter: Optional[abc_converters.AbstractConverter[Any]] = None,
+        iteration_speedup: bool = False,
+        cache_size: int = 0,
+    ) -> None:
+        super().__init__(
+            tense=tense,
+            resolver=resolver,
+            converter=converter,
+            iteration_speedup=iteration_speedup,
+            cache_size=cache_size,
+        )
+        aliases = [alias for alias in self._durations if isinstance(alias, str)]
+        self._pattern = re.compile(_alias_pattern_source(aliases))
+        self._bytes_pattern = re.compile(
+            _alias_pattern_source(filter(str.isascii, aliases)).encode("ascii")
+        )
+
+    def _parse(self, raw_str: RawString, /) -> int:
+        pattern: re.Pattern[Any] = (
+            self._pattern if isinstance(raw_str, str) else self._bytes_pattern
         )
+        durations = self._durations
+        return sum(
+            int(quantity) * durations[alias]
+            for quantity, alias in pattern.findall(raw_str)
+        )
+
+
+class CompiledParser(DigitParser):
+    """Parser that generates and executes a specialised parse function.
+
+    The function is generated from the configuration of `model.Tense`:
+    the alias table is inlined as a constant with the multiplier already
+    applied, `resolvers.basic_resolver` is inlined, and the converter is
+    bound directly, so no attribute lookups or abstract dispatch are left
+    on the hot path. Results are the same as `DigitParser` gives.
+
+    !!! info
+        Generated source is available in the `source` attribute, and
+        tracebacks show its lines.
+
+    !!! note
+        Bytes-like strings are parsed by the generic `DigitParser` code.
+
+    Examples:
+    ---------
+    >>> from tense import TenseParser
+
+    >>> parser = TenseParser(TenseParser.COMPILED)
+    >>> parser.parse("1d1min")
+    86460
+    >>> "def parse(" in parser.source
+    True
+    """
+
+    def __init__(
+        self,
+        *,
+        tense: model.Tense,
+        resolver: Optional[Callable[[str, model.Tense], Iterator[str]]] = None,
+        converter: Optional[abc_converters.AbstractConverter[Any]] = None,
+        iteration_speedup: bool = False,
+        cache_size: int = 0,
+    ) -> None:
+        super().__init__(
+            tense=tense,
+            resolver=resolver,
+            converter=converter,
+            iteration_speedup=iteration_speedup,
+            cache_size=cache_size,
+        )
+        self._init_source()
+
+    def _init_source(self) -> None:
+        # One file name per parser, recompiles replace its linecache
+        # entry, and it is removed together with the parser.
+        self._filename = _COMPILED_FILENAME.format(next(_COMPILED_IDS))
+        weakref.finalize(self, linecache.cache.pop, self._filename, None)
+        self._compile()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # <inherited docstring from :class:`AbstractParser`> #
+        state = super().__getstate__()
+        # Generated functions can't be pickled, they are compiled again.
+        for name in _COMPILED_STATE:
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # <inherited docstring from :class:`AbstractParser`> #
+        super().__setstate__(state)
+        self._init_source()
+
+    def _compile(self) -> None:
+        """Generates, executes and installs parse functions."""
+        deps: dict[str, Any] = {"_fallback": super()._parse}
+        if self._resolver is resolvers.basic_resolver:
+            deps["_split"] = resolvers.DIGIT_PATTERN.split
+            body = _BASIC_RESOLVER_BODY
+        else:
+            deps["_resolver"] = self._resolver
+            deps["_tense"] = self._tense
+            body = _RESOLVER_BODY
+
+        namespace = dict(deps)
+        if self._converter is not None:
+            namespace["_convert"] = self._converter.convert
+            convert_dep, convert_call = (
+                ", _convert=_convert",
+                "_convert(_parse(raw_str))",
+            )
+        else:
+            convert_dep, convert_call = "", "_parse(raw_str)"
+
+        source = _COMPILED_TEMPLATE.format(
+            durations={k: v for k, v in self._durations.items() if isinstance(k, str)},
+            deps=", ".join(f"{name}={name}" for name in deps),
+            body=body,
+            convert_dep=convert_dep,
+            convert_call=convert_call,
+        )
+        linecache.cache[self._filename] = (
+            len(source),
+            None,
+            source.splitlines(keepends=True),
+            self._filename,
+        )
+        exec(compile(source, self._filename, "exec"), namespace)
+
+        self.source = source
+        self._compiled_parse: Callable[[RawString], int] = namespace["_parse"]
+        self._compiled_parse_and_convert: Callable[[RawString], Any] = namespace[
+            "parse"
+        ]
+
+    def _parse(self, raw_str: RawString, /) -> int:
+        # <inherited docstring from :class:`AbstractParser`> #
+        return self._compiled_parse(raw_str)
+
+    def _parse_and_convert(self, raw_str: RawString, /) -> Any:
+        return self._compiled_parse_and_convert(raw_str)
+
+    def _batch_parse_function(self) -> Callable[[RawString], Any]:
+        # <inherited docstring from :class:`AbstractParser`> #
+        if self._cached_parse is not None:
+            return super()._batch_parse_function()
+        return self._compiled_parse_and_convert
+
+    @property
+    def resolver(self) -> Optional[Callable[[str, model.Tense], Iterator[str]]]:
+        # <inherited docstring from :class:`AbstractParser`> #
+        return self._resolver
+
+    @resolver.setter
+    def resolver(
+        self, new_resolver: Callable[[str, model.Tense], Iterator[str]], /
+    ) -> None:
+        # <inherited docstring from :class:`AbstractParser`> #
+        self._set_resolver(new_resolver)
+        self._compile()
@@ -13,5 +13,6 @@
 # limitations under the License.
 """Application package."""
 from .factory import *
+from .tenants import *
 
-__all__ = factory.__all__
+__all__ = factory.__all__ + tenants.__all__
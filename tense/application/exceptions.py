@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tense errors."""
-__all__ = ["InvalidParserType", "TenseError"]
+__all__ = ["InvalidParserType", "TenseError", "UnknownTenant"]
 
 
 class TenseError(Exception):
@@ -23,3 +23,7 @@ class TenseError(Exception):
 
 class InvalidParserType(TenseError):
     pass
+
+
+class UnknownTenant(TenseError, KeyError):
+    pass
@@ -16,14 +16,20 @@ from __future__ import annotations
 
 __all__ = ["TenseParser"]
 
+import collections
+import copy
+import threading
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Hashable,
     Iterator,
+    NamedTuple,
     Optional,
     Type,
     Union,
+    cast,
     overload,
 )
 
@@ -37,6 +43,60 @@ if TYPE_CHECKING:
 from . import exceptions, resolvers
 from .ports import parsers as abc_parsers
 
+TensesSource = Union[
+    "abc_repository.AbstractTenseRepository", dict[str, Any], model.Tense
+]
+
+
+class _MemoArgs(NamedTuple):
+    """Constructor arguments of a memoized parser."""
+
+    # Referenced, so that ids in the arguments key are not reused.
+    tenses: Optional[TensesSource]
+    time_resolver: Callable[[str, model.Tense], Iterator[str]]
+    converter: Optional[abc_converters.AbstractConverter[Any]]
+    # Deep copy of the tenses configuration at construction.
+    snapshot: Optional[dict[str, Any]]
+    # Key of the parser in `_MEMO`.
+    key: Hashable
+
+
+# Memoized parsers by config fingerprint, see `TenseParser(..., memoize=True)`.
+_MEMO: collections.OrderedDict[
+    Hashable, abc_parsers.AbstractParser
+] = collections.OrderedDict()
+# Recent constructor arguments by identity, checked before fingerprinting.
+_MEMO_ARGS: collections.OrderedDict[Hashable, _MemoArgs] = collections.OrderedDict()
+_MEMO_LOCK = threading.Lock()
+_MEMO_STATS = {"hits": 0, "misses": 0}
+
+
+def _tenses_config(tenses: Optional[TensesSource], /) -> Optional[dict[str, Any]]:
+    """Returns configuration of tenses without copying it."""
+    if tenses is None or isinstance(tenses, dict):
+        return tenses
+    if isinstance(tenses, model.Tense):
+        # Built tenses are compared by identity.
+        return None
+    return tenses.config
+
+
+def _effective_config(tenses: Optional[TensesSource], /) -> dict[str, Any]:
+    """Returns default configuration updated with tenses configuration."""
+    config = cast("dict[str, Any]", repository.TenseRepository().config)
+    config.update(_tenses_config(tenses) or {})
+    return config
+
+
+def _config_fingerprint(config: dict[str, Any], /) -> str:
+    """Returns stable hash of configuration dictionary."""
+    # Imported here: only memoized parsers of dictionaries need them.
+    import hashlib
+    import json
+
+    dumped = json.dumps(config, sort_keys=True, default=repr)
+    return hashlib.blake2b(dumped.encode(), digest_size=16).hexdigest()
+
 
 class TenseParser:
     """Base parsers factory.
@@ -45,16 +105,36 @@ class TenseParser:
     -----------
     parser_cls: :class:`Type[abc_parsers.AbstractParser]` = parsers.DigitParser
         Concrete parser type.
-    tenses: :class:`Optional[abc_repository.AbstractTenseRepository]` = None, *
-        Configuration repository for time parser.
+    tenses: :class:`Optional[TensesSource]` = None, *
+        Configuration repository for time parser, its configuration
+        dictionary or a built tense (e.g. `model.Tense.overlay()` of
+        a shared tense), which is used as is.
     converter: :class:`Optional[abc_converters.AbstractConverter]` = None, *
         Value converter.
     time_resolver: :class:`Optional[Callable[[str, model.Tense], Iterator[str]]]` = None, *
         Raw string resolver.
     iteration_speedup: :class:`bool` = False, *
-        If True, then part of the logic will be moved to the `__init__` of the class,
-        which will slightly slow down the creation of an instance of the class, but
-        speed up the parsing process.
+        Has no effect, kept for compatibility, see `AbstractParser`.
+    cache_size: :class:`int` = 0, *
+        Maximum number of parse results kept in the parser LRU cache.
+        If 0, results are not cached.
+    memoize: :class:`bool` = False, *
+        If True, parsers are memoized by a fingerprint of the effective
+        config, parser type, resolver, converter and options, so repeated
+        construction returns the same instance. At most `memo_maxsize`
+        parsers are kept, least recently used are evicted first.
+        Resolvers, converters and built tenses are compared by identity,
+        so they don't need to be hashable.
+
+    !!! info
+        Repeated calls with the same `tenses`, resolver and converter
+        objects only compare the tenses configuration with its copy taken
+        on the first call; the configuration is fingerprinted only when it
+        is seen for the first time or has changed since.
+
+    !!! warning
+        Memoized parsers are shared between callers, don't change their
+        state (for example, their resolver).
 
     Raises:
     -------
@@ -64,8 +144,12 @@ class TenseParser:
 
     __slots__ = ()
 
+    memo_maxsize: int = 128
+
     TIMEDELTA = parsers.TimedeltaParser
     DIGIT = parsers.DigitParser
+    REGEX = parsers.RegexParser
+    COMPILED = parsers.CompiledParser
 
     @overload
     def __new__(cls) -> abc_parsers.AbstractParser:
@@ -87,6 +171,8 @@ class TenseParser:
         converter: Optional[abc_converters.AbstractConverter],
         time_resolver: Optional[Callable[[str, model.Tense], Iterator[str]]],
         iteration_speedup: bool,
+        cache_size: int,
+        memoize: bool,
     ) -> abc_parsers.AbstractParser:
         ...
 
@@ -94,18 +180,13 @@ class TenseParser:
         cls,
         parser_cls: Type[abc_parsers.AbstractParser] = DIGIT,
         *,
-        tenses: Optional[
-            Union[abc_repository.AbstractTenseRepository, dict[str, Any]]
-        ] = None,
+        tenses: Optional[TensesSource] = None,
         converter: Optional[abc_converters.AbstractConverter] = None,
         time_resolver: Optional[Callable[[str, model.Tense], Iterator[str]]] = None,
         iteration_speedup: bool = False,
+        cache_size: int = 0,
+        memoize: bool = False,
     ) -> abc_parsers.AbstractParser:
-        tense_repository_cfg = repository.TenseRepository().config
-        if tenses is not None:
-            tenses = tenses if isinstance(tenses, dict) else tenses.config
-            tense_repository_cfg.update(tenses)
-
         if time_resolver is None:
             time_resolver = resolvers.basic_resolver
 
@@ -113,11 +194,123 @@ class TenseParser:
             raise exceptions.InvalidParserType(
                 f"Invalid parser type, you can only use {abc_parsers.AbstractParser.__subclasses__()}."
             )
+
+        if not memoize:
+            return cls._create(
+                parser_cls,
+                tenses
+                if isinstance(tenses, model.Tense)
+                else model.Tense.from_dict(_effective_config(tenses)),
+                time_resolver,
+                converter,
+                iteration_speedup,
+                cache_size,
+            )
+
+        # Objects are keyed by id, as they may be unhashable (dictionaries,
+        # converters), `_MemoArgs` keeps them alive so ids stay unique.
+        args_key = (
+            id(tenses),
+            parser_cls,
+            id(time_resolver),
+            id(converter),
+            iteration_speedup,
+            cache_size,
+        )
+        snapshot = _tenses_config(tenses)
+        with _MEMO_LOCK:
+            args = _MEMO_ARGS.get(args_key)
+            if (
+                args is not None
+                and args.tenses is tenses
+                and args.snapshot == snapshot
+                and args.key in _MEMO
+            ):
+                _MEMO_ARGS.move_to_end(args_key)
+                _MEMO.move_to_end(args.key)
+                _MEMO_STATS["hits"] += 1
+                return _MEMO[args.key]
+
+        tense: Optional[model.Tense] = None
+        fingerprint: Hashable
+        if isinstance(tenses, model.Tense):
+            # Memoized parser references the tense, so its id is not reused.
+            tense = tenses
+            fingerprint = id(tense)
+        else:
+            config = _effective_config(tenses)
+            fingerprint = _config_fingerprint(config)
+        key = (
+            fingerprint,
+            parser_cls,
+            id(time_resolver),
+            id(converter),
+            iteration_speedup,
+            cache_size,
+        )
+        args = _MemoArgs(tenses, time_resolver, converter, copy.deepcopy(snapshot), key)
+        with _MEMO_LOCK:
+            _MEMO_ARGS[args_key] = args
+            _MEMO_ARGS.move_to_end(args_key)
+            while len(_MEMO_ARGS) > max(cls.memo_maxsize, 0):
+                _MEMO_ARGS.popitem(last=False)
+
+            instance = _MEMO.get(key)
+            if instance is not None:
+                _MEMO.move_to_end(key)
+                _MEMO_STATS["hits"] += 1
+                return instance
+            _MEMO_STATS["misses"] += 1
+
+        instance = cls._create(
+            parser_cls,
+            model.Tense.from_dict(config) if tense is None else tense,
+            time_resolver,
+            converter,
+            iteration_speedup,
+            cache_size,
+        )
+        with _MEMO_LOCK:
+            # Another thread may have created the same parser meanwhile.
+            instance = _MEMO.setdefault(key, instance)
+            while len(_MEMO) > max(cls.memo_maxsize, 0):
+                _MEMO.popitem(last=False)
+        return instance
+
+    @staticmethod
+    def _create(
+        parser_cls: Type[abc_parsers.AbstractParser],
+        tense: model.Tense,
+        time_resolver: Callable[[str, model.Tense], Iterator[str]],
+        converter: Optional[abc_converters.AbstractConverter[Any]],
+        iteration_speedup: bool,
+        cache_size: int,
+    ) -> abc_parsers.AbstractParser:
         instance = parser_cls.__new__(parser_cls)  # type: ignore[call-overload]
         instance.__init__(
-            tense=model.Tense.from_dict(tense_repository_cfg),
+            tense=tense,
             resolver=time_resolver,
             converter=converter,
             iteration_speedup=iteration_speedup,
+            cache_size=cache_size,
         )
         return instance
+
+    @classmethod
+    def memo_info(cls) -> abc_parsers.CacheInfo:
+        """Returns statistics of memoized parsers."""
+        with _MEMO_LOCK:
+            return abc_parsers.CacheInfo(
+                hits=_MEMO_STATS["hits"],
+                misses=_MEMO_STATS["misses"],
+                maxsize=cls.memo_maxsize,
+                currsize=len(_MEMO),
+            )
+
+    @staticmethod
+    def clear_memo() -> None:
+        """Removes all memoized parsers and resets their statistics."""
+        with _MEMO_LOCK:
+            _MEMO.clear()
+            _MEMO_ARGS.clear()
+            _MEMO_STATS.update(hits=0, misses=0)
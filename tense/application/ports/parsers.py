@@ -14,15 +14,52 @@
 """Interfaces that are implemented in tense.adapters."""
 from __future__ import annotations
 
-__all__ = ["AbstractParser"]
+__all__ = ["AbstractParser", "CacheInfo"]
 
 import abc
-from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, final
+import codecs
+import functools
+import types
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Final,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    final,
+)
 
+from tense.application import resolvers
 from tense.application.ports import converters
 
 if TYPE_CHECKING:
-    from tense.domain import model
+    from tense.application.resolvers import RawString
+    from tense.domain import model, units
+
+
+_STREAM_BUFFER_SIZE: Final[int] = 1024 * 1024
+_STREAM_ERRORS: Final[tuple[str, ...]] = ("raise", "skip", "sentinel")
+# Bytes-like types that can't be used as cache keys.
+_UNHASHABLE_BYTES: Final = (bytearray, memoryview)
+# Attributes rebuilt by `AbstractParser._build()`, they are not pickled.
+_DERIVED_STATE: Final[frozenset[str]] = frozenset(
+    ("_pair_resolver", "_unit_durations", "_durations", "_cached_parse")
+)
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the parser result cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
 
 
 class AbstractParser(abc.ABC):
@@ -37,9 +74,28 @@ class AbstractParser(abc.ABC):
     converter: :class:`Optional[converters.AbstractConverter]` = None, *
         Value converter.
     iteration_speedup: :class:`bool` = False, *
-        If True, then part of the logic will be moved to the `__init__` of the class,
-        which will slightly slow down the creation of an instance of the class, but
-        speed up the parsing process.
+        Has no effect, kept for compatibility: aliases are always indexed
+        at construction (see below).
+    cache_size: :class:`int` = 0, *
+        Maximum number of parse results kept in the LRU cache.
+        If 0, results are not cached.
+
+    !!! info
+        Aliases of all units are indexed at construction into a frozen
+        mapping of alias to duration, already multiplied by
+        `tense.multiplier`, so lookups on the hot path take constant time.
+        ASCII aliases are indexed as bytes too, so bytes-like strings
+        are parsed without decoding.
+
+    !!! info
+        The resolver is also available as a pair resolver (see
+        `resolvers.as_pair_resolver()`) together with the multiplied
+        durations of units, in `model.Tense` iteration order.
+
+    !!! info
+        Parsers can be pickled (e.g. to be sent to worker processes) if their
+        resolver and converter can. Indexes and the result cache are not
+        pickled, they are rebuilt from the tense, the cache starts empty.
     """
 
     def __init__(
@@ -49,40 +105,251 @@ class AbstractParser(abc.ABC):
         resolver: Optional[Callable[[str, model.Tense], Iterator[str]]] = None,
         converter: Optional[converters.AbstractConverter] = None,
         iteration_speedup: bool = False,
+        cache_size: int = 0,
     ) -> None:
+        if cache_size < 0:
+            raise ValueError("Cache size must be greater than or equal to zero.")
+
         self._tense = tense
         self._converter = converter
         self._resolver = resolver
-        self._iterunits = set(tense) if iteration_speedup else tense
+        self._build(cache_size)
+
+    def _build(self, cache_size: int, /) -> None:
+        """Builds state derived from the tense and the resolver:
+        the pair resolver, the duration tables and the result cache.
+        """
+        resolver = self._resolver
+        self._pair_resolver = (
+            None if resolver is None else resolvers.as_pair_resolver(resolver)
+        )
+        table = self._tense.registry.table
+        self._unit_durations = table.scaled_durations(self._tense.multiplier)
+        self._durations: Mapping[str | bytes, int] = table.alias_durations(
+            self._tense.multiplier
+        )
+        self._cached_parse: Optional[Callable[..., Any]] = (
+            functools.lru_cache(maxsize=cache_size)(self._parse_and_convert)
+            if cache_size
+            else None
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Derived state is shared through the tense or wraps bound methods,
+        # so it is rebuilt on unpickling instead.
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in _DERIVED_STATE
+        }
+        state["_cache_size"] = self.cache_info().maxsize
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        state = dict(state)
+        cache_size = state.pop("_cache_size")
+        self.__dict__.update(state)
+        self._build(cache_size)
 
     @final
-    def parse(self, raw_str: str, /) -> Any:
+    def parse(self, raw_str: RawString, /) -> Any:
         """Base method that calls abstract ._parse().
         If the converter is not equal to None, then the value
         will be converted.
 
+        !!! note
+            This method is final and cannot be overridden.
+
+        !!! info
+            If the parser was created with `cache_size`, converted values
+            are cached, so a converter must return values that are safe
+            to share between calls.
+
+        Parameters:
+        -----------
+        raw_str: :class:`RawString`, /
+            Raw string to parse, bytes-like objects are accepted as well.
+        """
+        if self._cached_parse is not None and not isinstance(
+            raw_str, _UNHASHABLE_BYTES
+        ):
+            return self._cached_parse(raw_str)
+
+        return self._parse_and_convert(raw_str)
+
+    @final
+    def parse_many(
+        self, raw_strs: Iterable[RawString], /, *, unique: bool = False
+    ) -> list[Any]:
+        """Parses every string of iterable, same as calling `.parse()` for each.
+
+        !!! note
+            This method is final and cannot be overridden.
+
+        Parameters:
+        -----------
+        raw_strs: :class:`Iterable[RawString]`, /
+            Raw strings to parse.
+        unique: :class:`bool` = False, *
+            If True, each distinct string is parsed only once and its
+            value is reused for all its occurrences.
+
+        Examples:
+        ---------
+        >>> from tense import TenseParser
+
+        >>> parser = TenseParser()
+        >>> parser.parse_many(["1m", "1h", "1m"], unique=True)
+        [60, 3600, 60]
+        """
+        parse = self._batch_parse_function()
+        if not unique:
+            return list(map(parse, raw_strs))
+
+        keys = [
+            bytes(raw_str) if isinstance(raw_str, _UNHASHABLE_BYTES) else raw_str
+            for raw_str in raw_strs
+        ]
+        parsed = {key: parse(key) for key in dict.fromkeys(keys)}
+        return [parsed[key] for key in keys]
+
+    @final
+    def iter_parse(
+        self,
+        fileobj: IO[Any],
+        /,
+        *,
+        errors: Literal["raise", "skip", "sentinel"] = "raise",
+        sentinel: Any = None,
+        encoding: Optional[str] = "utf-8",
+        buffer_size: int = _STREAM_BUFFER_SIZE,
+    ) -> Iterator[Any]:
+        """Lazily parses a stream, one value per line.
+
+        The stream is read in chunks of `buffer_size`, so memory usage
+        does not depend on the stream size.
+
         !!! note
             This method is final and cannot be overridden.
 
         Parameters:
         -----------
-        raw_str: :class:`str`, /
-            Raw string to parse
+        fileobj: :class:`IO[Any]`, /
+            Text or binary stream (file, socket file, io.StringIO, ...).
+        errors: :class:`Literal["raise", "skip", "sentinel"]` = "raise", *
+            What to do when a line can't be parsed: raise the error, skip
+            the line or yield `sentinel` instead of its value.
+        sentinel: :class:`Any` = None, *
+            Value yielded for invalid lines if `errors` is "sentinel".
+        encoding: :class:`Optional[str]` = "utf-8", *
+            Encoding of binary streams. If None, lines of binary streams
+            are parsed as bytes, without decoding.
+        buffer_size: :class:`int` = 1024 * 1024, *
+            Size of chunks read from the stream.
+
+        Examples:
+        ---------
+        >>> import io
+        >>> from tense import TenseParser
+
+        >>> parser = TenseParser()
+        >>> list(parser.iter_parse(io.StringIO("1m\\n1h\\n")))
+        [60, 3600]
         """
+        if errors not in _STREAM_ERRORS:
+            raise ValueError(f"Errors must be one of {_STREAM_ERRORS}.")
+        if buffer_size <= 0:
+            raise ValueError("Buffer size must be greater than zero.")
+
+        parse = self._batch_parse_function()
+        for line in self._iter_lines(fileobj, encoding, buffer_size):
+            try:
+                value = parse(line)
+            except Exception:
+                if errors == "raise":
+                    raise
+                if errors == "skip":
+                    continue
+                value = sentinel
+            yield value
+
+    @staticmethod
+    def _iter_lines(
+        fileobj: IO[Any], encoding: Optional[str], buffer_size: int
+    ) -> Iterator[Any]:
+        """Yields lines of stream without line endings."""
+        decoder: Optional[codecs.IncrementalDecoder] = None
+        pending: Any = None
+        while True:
+            chunk = fileobj.read(buffer_size)
+            if not chunk:
+                break
+            if not isinstance(chunk, str) and encoding is not None:
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder(encoding)()
+                chunk = decoder.decode(chunk)
+            if pending is None:
+                # Lines are str or bytes, depending on the first chunk.
+                pending = chunk[:0]
+                newline, carriage = (
+                    ("\n", "\r") if isinstance(chunk, str) else (b"\n", b"\r")
+                )
+
+            lines = (pending + chunk).split(newline)
+            pending = lines.pop()
+            for line in lines:
+                yield line.rstrip(carriage)
+
+        if decoder is not None:
+            pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending.rstrip(carriage)
+
+    def _batch_parse_function(self) -> Callable[[RawString], Any]:
+        """Returns function equivalent to `.parse()` with lookups done in advance."""
+        cached_parse = self._cached_parse
+        if cached_parse is not None:
+            parse_and_convert = self._parse_and_convert
+            return lambda raw_str: (
+                parse_and_convert(raw_str)
+                if isinstance(raw_str, _UNHASHABLE_BYTES)
+                else cached_parse(raw_str)
+            )
+
+        _parse = self._parse
+        if self._converter is None:
+            return _parse
+
+        convert = self._converter.convert
+        return lambda raw_str: convert(_parse(raw_str))
+
+    def _parse_and_convert(self, raw_str: RawString, /) -> Any:
         value = self._parse(raw_str)
         if self._converter is not None:
             value = self._converter.convert(value)
 
         return value
 
+    def cache_info(self) -> CacheInfo:
+        """Returns statistics of the parse result cache."""
+        if self._cached_parse is None:
+            return CacheInfo(hits=0, misses=0, maxsize=0, currsize=0)
+
+        return CacheInfo(*self._cached_parse.cache_info())  # type: ignore[attr-defined]
+
+    def cache_clear(self) -> None:
+        """Clears the parse result cache and its statistics."""
+        if self._cached_parse is not None:
+            self._cached_parse.cache_clear()  # type: ignore[attr-defined]
+
     @abc.abstractmethod
-    def _parse(self, raw_str: str, /) -> Any:
+    def _parse(self, raw_str: RawString, /) -> Any:
         """Abstract method that calls in .parse().
         Methods are implemented this way for hooks (converters, etc).
 
         Parameters:
         -----------
-        raw_str: :class:`str`, /
+        raw_str: :class:`RawString`, /
             Raw string to parse.
         """
         ...
@@ -105,7 +372,21 @@ class AbstractParser(abc.ABC):
 
         !!! dunger
             new_resolver must be callable.
+
+        !!! note
+            Parse result cache is cleared, since cached values were
+            produced by the previous resolver.
+        """
+        self._set_resolver(new_resolver)
+
+    def _set_resolver(
+        self, new_resolver: Callable[[str, model.Tense], Iterator[str]], /
+    ) -> None:
+        """Sets new resolver, see `resolver` setter.
+        Subclasses that override the property call this method.
         """
         if not callable(new_resolver):
             raise ValueError("Resolver must be callable.")
         self._resolver = new_resolver
+        self._pair_resolver = resolvers.as_pair_resolver(new_resolver)
+        self.cache_clear()
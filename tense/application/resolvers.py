@@ -17,6 +17,18 @@ consists of two constant parameters: the first one takes a string to parse,
 the second one - a `model.Tense` object as a container for aliases.
 
 It's worth noting that resolvers must return a string iterator.
+Built-in resolvers also accept bytes-like objects (bytes, bytearray,
+memoryview) and then return an iterator of bytes, without decoding them.
+
+Parsers use a second, faster protocol: pair resolvers, that yield
+`(quantity, unit_index)` pairs of integers, where `unit_index` is the
+index of the unit in `model.Tense` iteration order. Built-in resolvers
+have native pair versions, any other resolver is adapted automatically
+by `as_pair_resolver()`.
+
+Validators, error reporters and parsers that need positions can use
+`tokenize_spans()`, which yields `(start, end, kind)` offsets into the
+original string instead of new substrings.
 
 How can I create my own resolver? You can see examples in:
     - https://github.com/Animatea/aiotense/tree/main/examples
@@ -26,18 +38,50 @@ from __future__ import annotations
 __all__ = [
     "basic_resolver",
     "smart_resolver",
+    "basic_pair_resolver",
+    "smart_pair_resolver",
+    "as_pair_resolver",
+    "tokenize_spans",
+    "SPAN_NUMBER",
+    "SPAN_WORD",
+    "SPAN_UNIT",
+    "SPAN_OTHER",
+    "RawString",
+    "PairResolver",
 ]
 
 import re
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Any, Callable, Final, Iterator, Optional, Union
 
 if TYPE_CHECKING:
     from tense.domain import model
 
+RawString = Union[str, bytes, bytearray, memoryview]
+PairResolver = Callable[[RawString, "model.Tense"], Iterator[tuple[int, int]]]
+
 DIGIT_PATTERN: re.Pattern[str] = re.compile(r"(\d+)")
+DIGIT_BYTES_PATTERN: re.Pattern[bytes] = re.compile(rb"(\d+)")
+
+# Span kinds yielded by tokenize_spans().
+SPAN_NUMBER: Final[int] = 0
+SPAN_WORD: Final[int] = 1
+SPAN_UNIT: Final[int] = 2
+SPAN_OTHER: Final[int] = 3
 
+# Group number of match is the kind of span: digits, letters, anything else.
+_SPAN_PATTERN: Final[re.Pattern[str]] = re.compile(r"(\d+)|([^\W\d_]+)|([^\w\s]+|_+)")
+_SPAN_BYTES_PATTERN: Final[re.Pattern[bytes]] = re.compile(
+    rb"(\d+)|([a-zA-Z]+)|([^0-9a-zA-Z\s]+)"
+)
+_SPAN_KINDS: Final[tuple[int, ...]] = (-1, SPAN_NUMBER, SPAN_WORD, SPAN_OTHER)
 
-def basic_resolver(raw_str: str, _: model.Tense) -> Iterator[str]:
+# Table for bytes.translate() that deletes every non-letter byte.
+_NON_ALPHA_BYTES: Final[bytes] = bytes(
+    byte for byte in range(256) if not bytes((byte,)).isalpha()
+)
+
+
+def basic_resolver(raw_str: RawString, _: model.Tense) -> Iterator[Any]:
     """Resolves simple strings.
 
     !!! note
@@ -56,19 +100,42 @@ def basic_resolver(raw_str: str, _: model.Tense) -> Iterator[str]:
     ['1', 'd', '1', 'min']
     >>> list(resolvers.basic_resolver("1d1min 2 seconds", tense))
     ['1', 'd', '1', 'min', '2', 'seconds']
+    >>> list(resolvers.basic_resolver(b"1d 1min", tense))
+    [b'1', b'd', b'1', b'min']
+    """
+    return filter(bool, _split_digits(raw_str))
+
+
+def _split_digits(raw_str: RawString, /) -> list[Any]:
+    """Removes spaces and splits string by digit groups.
+    Result alternates non-digit parts (even indexes) and digit parts
+    (odd indexes).
     """
-    return filter(
-        bool,
-        DIGIT_PATTERN.split(raw_str.replace(" ", "")),
-    )
+    if isinstance(raw_str, str):
+        return DIGIT_PATTERN.split(raw_str.replace(" ", ""))
+
+    if isinstance(raw_str, memoryview):
+        # Memoryview has no .replace(), bytes are copied, but not decoded.
+        raw_str = raw_str.tobytes()
+    return DIGIT_BYTES_PATTERN.split(raw_str.replace(b" ", b""))
+
+
+def _strip_non_alpha(part: Any, /) -> Any:
+    """Removes any non-letter char (string.punctuation, ...) of part."""
+    if isinstance(part, str):
+        return "".join(filter(str.isalpha, part))
+    return part.translate(None, _NON_ALPHA_BYTES)
 
 
-def smart_resolver(raw_str: str, tense: model.Tense) -> Iterator[str]:
+def smart_resolver(raw_str: RawString, tense: model.Tense) -> Iterator[Any]:
     """Resolves complex strings.
 
     !!! note
         Single letter aliases are not supported.
 
+    !!! note
+        Bytes-like strings are matched only against ASCII aliases.
+
     Examples (extends basic_resolver()):
     --------------------
     >>> from tense import model, resolvers
@@ -77,28 +144,169 @@ def smart_resolver(raw_str: str, tense: model.Tense) -> Iterator[str]:
     >>> tense = model.Tense.from_repository(repository.TenseRepository())
     >>> list(resolvers.smart_resolver("1year and 10 minutes + 5 seconds", tense))
     ['1', 'year', '10', 'min', '5', 'sec']
+    >>> list(resolvers.smart_resolver(b"1 Year, 10 minutes", tense))
+    [b'1', b'year', b'10', b'min']
     """
     basic_resolve = basic_resolver(raw_str, tense)
     if any(not p.isalpha() for p in basic_resolve if not p.isdigit()):
         # Removes any char of string.punctuation
-        def _resolve_p(p: str, /) -> str:
-            return p if p.isdigit() else "".join(filter(str.isalpha, p))
+        def _resolve_p(p: Any, /) -> Any:
+            return p if p.isdigit() else _strip_non_alpha(p)
 
         basic_resolve = (_resolve_p(p) for p in basic_resolver(raw_str, tense))
     else:
         basic_resolve = basic_resolver(raw_str, tense)
 
-    unit_aliases: list[str] = sum((u.aliases for u in tense), [])
+    search_alias = tense.alias_trie.search
     for part in basic_resolve:
         if part.isdigit():
             yield part
             continue
 
-        part = part.lower()  # case insensitive
-        for alias in unit_aliases:
-            if alias in part:
-                if len(alias) == 1 and len(part) > 1:
-                    # For 'd', 's', 'y', ... aliases.
-                    continue
-                yield alias
-                break
+        alias = search_alias(part.lower())  # case insensitive
+        if alias is not None:
+            yield alias
+
+
+def basic_pair_resolver(
+    raw_str: RawString, tense: model.Tense
+) -> Iterator[tuple[int, int]]:
+    """Pair version of `basic_resolver()`.
+
+    Examples:
+    ---------
+    >>> from tense import model, resolvers
+    >>> from tense.adapters import repository
+
+    >>> tense = model.Tense.from_repository(repository.TenseRepository())
+    >>> list(resolvers.basic_pair_resolver("1d 10min", tense))
+    [(1, 3), (10, 1)]
+    """
+    alias_units = tense.alias_units
+    parts = _split_digits(raw_str)
+    for idx in range(1, len(parts) - 1, 2):
+        units = alias_units.get(parts[idx + 1])
+        if units is None:
+            continue
+        quantity = int(parts[idx])
+        for unit_idx in units:
+            yield quantity, unit_idx
+
+
+def smart_pair_resolver(
+    raw_str: RawString, tense: model.Tense
+) -> Iterator[tuple[int, int]]:
+    """Pair version of `smart_resolver()`.
+
+    Examples:
+    ---------
+    >>> from tense import model, resolvers
+    >>> from tense.adapters import repository
+
+    >>> tense = model.Tense.from_repository(repository.TenseRepository())
+    >>> list(resolvers.smart_pair_resolver("1year and 10 minutes", tense))
+    [(1, 5), (10, 1)]
+    """
+    search_alias = tense.alias_trie.search
+    alias_units = tense.alias_units
+    last_num = None
+    for part in filter(bool, _split_digits(raw_str)):
+        if part.isdigit():
+            last_num = int(part)
+            continue
+        if last_num is None:
+            continue
+
+        if not part.isalpha():
+            part = _strip_non_alpha(part)
+        alias = search_alias(part.lower())  # case insensitive
+        if alias is None:
+            continue
+        for unit_idx in alias_units[alias]:
+            yield last_num, unit_idx
+
+
+_NATIVE_PAIR_RESOLVERS: Final[dict[Callable[..., Any], PairResolver]] = {
+    basic_resolver: basic_pair_resolver,
+    smart_resolver: smart_pair_resolver,
+}
+
+
+def as_pair_resolver(resolver: Callable[..., Iterator[Any]], /) -> PairResolver:
+    """Returns pair version of string resolver.
+
+    Native versions are returned for built-in resolvers, other resolvers
+    are wrapped: quantities are converted with `int()` and aliases are
+    looked up in `model.Tense.alias_units`.
+
+    Parameters:
+    -----------
+    resolver: :class:`Callable[[RawString, model.Tense], Iterator[str]]`, /
+        String resolver.
+    """
+    native = _NATIVE_PAIR_RESOLVERS.get(resolver)
+    if native is not None:
+        return native
+
+    def pair_resolver(
+        raw_str: RawString, tense: model.Tense
+    ) -> Iterator[tuple[int, int]]:
+        alias_units = tense.alias_units
+        last_num = None
+        for part in resolver(raw_str, tense):
+            if part.isdigit():
+                last_num = int(part)
+                continue
+            if last_num is None:
+                continue
+            for unit_idx in alias_units.get(part, ()):
+                yield last_num, unit_idx
+
+    pair_resolver.__wrapped__ = resolver  # type: ignore[attr-defined]
+    return pair_resolver
+
+
+def tokenize_spans(
+    raw_str: RawString, tense: Optional[model.Tense] = None
+) -> Iterator[tuple[int, int, int]]:
+    """Yields `(start, end, kind)` spans of tokens in `raw_str`.
+
+    Whitespace is skipped, `raw_str` is scanned once and no substrings
+    are created, so spans can be shared between parsers, validators and
+    error reporters (`raw_str[start:end]` gives the token back).
+
+    !!! note
+        If `tense` is passed, words that are exactly an alias are
+        yielded as `SPAN_UNIT` instead of `SPAN_WORD`.
+
+    Parameters:
+    -----------
+    raw_str: :class:`RawString`
+        String to tokenize.
+
+    tense: :class:`Optional[model.Tense]` = None
+        Container for aliases, used to recognize units.
+
+    Examples:
+    ---------
+    >>> from tense import model, resolvers
+    >>> from tense.adapters import repository
+
+    >>> tense = model.Tense.from_repository(repository.TenseRepository())
+    >>> list(resolvers.tokenize_spans("1d 10 minz!"))
+    [(0, 1, 0), (1, 2, 1), (3, 5, 0), (6, 10, 1), (10, 11, 3)]
+    >>> list(resolvers.tokenize_spans(b"1d 10min", tense))
+    [(0, 1, 0), (1, 2, 2), (3, 5, 0), (5, 8, 2)]
+    """
+    pattern = _SPAN_PATTERN if isinstance(raw_str, str) else _SPAN_BYTES_PATTERN
+    match_alias = None if tense is None else tense.alias_trie.match
+    for match in pattern.finditer(raw_str):  # type: ignore[arg-type]
+        kind = _SPAN_KINDS[match.lastindex]  # type: ignore[index]
+        start, end = match.span()
+        if (
+            kind == SPAN_WORD
+            and match_alias is not None
+            and match_alias(raw_str, start, end) is not None
+        ):
+            kind = SPAN_UNIT
+        yield start, end, kind
@@ -0,0 +1,342 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Multi-tenant parsers registry."""
+from __future__ import annotations
+
+__all__ = ["ParserRegistry", "RegistryInfo", "estimate_nbytes"]
+
+import collections
+import os
+import sys
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Type,
+    Union,
+)
+
+from tense.application.ports import repository as abc_repository
+
+from . import exceptions
+from .factory import TenseParser
+
+if TYPE_CHECKING:
+    from tense.domain import model
+
+    from .ports import parsers as abc_parsers
+
+TenantSource = Union[
+    abc_repository.AbstractTenseRepository,
+    dict[str, Any],
+    "model.Tense",
+    str,
+    "os.PathLike[str]",
+    Callable[[], "abc_parsers.AbstractParser"],
+]
+
+
+class RegistryInfo(NamedTuple):
+    """Statistics of `ParserRegistry`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+    nbytes: int
+
+
+def estimate_nbytes(parser: abc_parsers.AbstractParser, /) -> int:
+    """Returns estimated memory used by parser itself.
+
+    !!! note
+        Unit tables shared between tenses (see `registry.UnitTable`) are
+        not counted, only the state owned by the parser and its tense.
+
+    Parameters:
+    -----------
+    parser: :class:`abc_parsers.AbstractParser`, /
+        Parser to estimate.
+    """
+    nbytes = sys.getsizeof(parser)
+    state = getattr(parser, "__dict__", None)
+    if state is not None:
+        nbytes += sys.getsizeof(state)
+        nbytes += sum(map(sys.getsizeof, state.values()))
+    tense = getattr(parser, "_tense", None)
+    if tense is not None:
+        nbytes += sys.getsizeof(tense) + sys.getsizeof(vars(tense))
+        nbytes += tense.registry.nbytes
+    cache_info = getattr(parser, "cache_info", None)
+    if cache_info is not None:
+        # Rough size of an LRU cache entry: key, result and linked list node.
+        nbytes += cache_info().currsize * 200
+    return nbytes
+
+
+class ParserRegistry:
+    """Maps tenant keys to lazily built parsers.
+
+    Tenants are registered with a loader (a repository, a configuration
+    dictionary, a tense, a path to `.tense` file or a callable that returns
+    a parser),
+    their parsers are built on first `get()` and kept in an LRU order.
+    When there are more than `maxsize` parsers or their estimated memory
+    exceeds `max_memory` bytes, least recently used parsers are evicted.
+    Evicted parsers are rebuilt from their loaders on the next `get()`.
+
+    !!! info
+        Tenants that customise a shared tense can be registered with its
+        `model.Tense.overlay()`, their tenses then share the unit table of
+        the base tense and store only their differences.
+
+    !!! info
+        This class is thread-safe, a parser may be built twice by racing
+        threads, but only one of them is kept.
+
+    !!! warning
+        Parsers are shared between callers, don't change their state
+        (for example, their resolver).
+
+    Parameters:
+    -----------
+    maxsize: :class:`Optional[int]` = 128, *
+        Maximum number of built parsers. If None, the number is not limited.
+    max_memory: :class:`Optional[int]` = None, *
+        Maximum estimated memory of built parsers, in bytes.
+        If None, memory is not limited.
+    sizeof: :class:`Callable[[abc_parsers.AbstractParser], int]` = estimate_nbytes, *
+        Function that estimates memory of a parser.
+    parser_cls: :class:`Type[abc_parsers.AbstractParser]` = TenseParser.DIGIT, *
+        Default parser type of tenants.
+    **parser_options: :class:`Any`
+        Default keyword arguments of `TenseParser` for tenants.
+
+    Examples:
+    ---------
+    >>> from tense.application import ParserRegistry
+    >>> from tense.adapters import repository
+
+    >>> parsers = ParserRegistry(maxsize=2)
+    >>> parsers.register("guild-1", {"model.Tense": {"multiplier": 2, "virtual": []}})
+    >>> parsers.register("guild-2", repository.TenseRepository())
+    >>> parsers.get("guild-1").parse("1min")
+    120
+    >>> parsers.get("guild-2").parse("1min")
+    60
+    >>> parsers.info()[:3]  # hits, misses, evictions
+    (0, 2, 0)
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: Optional[int] = 128,
+        max_memory: Optional[int] = None,
+        sizeof: Callable[[abc_parsers.AbstractParser], int] = estimate_nbytes,
+        parser_cls: Type[abc_parsers.AbstractParser] = TenseParser.DIGIT,
+        **parser_options: Any,
+    ) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("Maximum size must be greater than or equal to zero.")
+        if max_memory is not None and max_memory < 0:
+            raise ValueError("Maximum memory must be greater than or equal to zero.")
+
+        self.maxsize = maxsize
+        self.max_memory = max_memory
+        self._sizeof = sizeof
+        self._parser_cls = parser_cls
+        self._parser_options = parser_options
+        self._loaders: dict[Hashable, Callable[[], abc_parsers.AbstractParser]] = {}
+        # Key -> (parser, estimated memory), in LRU order.
+        self._parsers: collections.OrderedDict[
+            Hashable, tuple[abc_parsers.AbstractParser, int]
+        ] = collections.OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._loaders
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def _loader(
+        self,
+        source: TenantSource,
+        parser_cls: Optional[Type[abc_parsers.AbstractParser]],
+        options: dict[str, Any],
+    ) -> Callable[[], abc_parsers.AbstractParser]:
+        if callable(source):
+            if parser_cls is not None or options:
+                raise TypeError("Parser options can't be used with parser loaders.")
+            return source
+
+        parser_options = {**self._parser_options, **options}
+        parser_type = self._parser_cls if parser_cls is None else parser_cls
+
+        def load() -> abc_parsers.AbstractParser:
+            tenses: Any = source
+            if isinstance(source, (str, os.PathLike)):
+                # Imported here: the service layer depends on the application layer.
+                from tense.service_layer.dot_tense import from_tense_file
+
+                tenses = from_tense_file(source)
+            return TenseParser(parser_type, tenses=tenses, **parser_options)
+
+        return load
+
+    def register(
+        self,
+        key: Hashable,
+        source: TenantSource,
+        /,
+        parser_cls: Optional[Type[abc_parsers.AbstractParser]] = None,
+        **parser_options: Any,
+    ) -> None:
+        """Registers tenant loader. The parser is built on first `get()`,
+        already built parser of the tenant is discarded.
+
+        Parameters:
+        -----------
+        key: :class:`Hashable`, /
+            Tenant key.
+        source: :class:`TenantSource`, /
+            Tense repository, configuration dictionary, tense, path to `.tense`
+            file or a callable without arguments that returns parser.
+        parser_cls: :class:`Optional[Type[abc_parsers.AbstractParser]]` = None
+            Parser type, defaults to the registry parser type.
+        **parser_options: :class:`Any`
+            Keyword arguments of `TenseParser`, override registry defaults.
+        """
+        loader = self._loader(source, parser_cls, parser_options)
+        with self._lock:
+            self._loaders[key] = loader
+            self._discard(key)
+
+    def unregister(self, key: Hashable, /) -> None:
+        """Removes tenant and its parser.
+
+        Parameters:
+        -----------
+        key: :class:`Hashable`, /
+            Tenant key.
+
+        Raises:
+        -------
+        :class:`exceptions.UnknownTenant`
+            Raises if tenant is not registered.
+        """
+        with self._lock:
+            if self._loaders.pop(key, None) is None:
+                raise exceptions.UnknownTenant(key)
+            self._discard(key)
+
+    def get(self, key: Hashable, /) -> abc_parsers.AbstractParser:
+        """Returns parser of tenant, building it if needed.
+
+        Parameters:
+        -----------
+        key: :class:`Hashable`, /
+            Tenant key.
+
+        Raises:
+        -------
+        :class:`exceptions.UnknownTenant`
+            Raises if tenant is not registered.
+        """
+        with self._lock:
+            entry = self._parsers.get(key)
+            if entry is not None:
+                self._parsers.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[0]
+            loader = self._loaders.get(key)
+            if loader is None:
+                raise exceptions.UnknownTenant(key)
+            self._stats["misses"] += 1
+
+        parser = loader()
+        nbytes = self._sizeof(parser)
+        with self._lock:
+            if self._loaders.get(key) is not loader:
+                # Tenant was re-registered or removed meanwhile.
+                return parser
+            entry = self._parsers.get(key)
+            if entry is not None:
+                # Another thread has built the same parser meanwhile.
+                self._parsers.move_to_end(key)
+                return entry[0]
+            self._parsers[key] = (parser, nbytes)
+            self._nbytes += nbytes
+            self._evict()
+        return parser
+
+    __getitem__ = get
+
+    def _discard(self, key: Hashable, /) -> None:
+        entry = self._parsers.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
+
+    def _evict(self) -> None:
+        """Evicts least recently used parsers while limits are exceeded."""
+        while self._parsers and (
+            (self.maxsize is not None and len(self._parsers) > self.maxsize)
+            or (self.max_memory is not None and self._nbytes > self.max_memory)
+        ):
+            _, (_, nbytes) = self._parsers.popitem(last=False)
+            self._nbytes -= nbytes
+            self._stats["evictions"] += 1
+
+    def evict(self, key: Hashable, /) -> bool:
+        """Evicts built parser of tenant, tenant stays registered.
+        Returns True if there was a parser to evict.
+
+        Parameters:
+        -----------
+        key: :class:`Hashable`, /
+            Tenant key.
+        """
+        with self._lock:
+            built = key in self._parsers
+            self._discard(key)
+            return built
+
+    def info(self) -> RegistryInfo:
+        """Returns statistics of registry."""
+        with self._lock:
+            return RegistryInfo(
+                hits=self._stats["hits"],
+                misses=self._stats["misses"],
+                evictions=self._stats["evictions"],
+                maxsize=self.maxsize,
+                currsize=len(self._parsers),
+                nbytes=self._nbytes,
+            )
+
+    def clear(self) -> None:
+        """Evicts all built parsers and resets statistics,
+        tenants stay registered.
+        """
+        with self._lock:
+            self._parsers.clear()
+            self._nbytes = 0
+            self._stats.update(hits=0, misses=0, evictions=0)
@@ -18,9 +18,9 @@ __all__ = ["Tense"]
 
 import warnings
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Iterator
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Optional, Union
 
-from tense.domain import units
+from tense.domain import registry, trie, units
 
 if TYPE_CHECKING:
     from tense.application.ports import repository
@@ -35,16 +35,25 @@ class Tense:
         or equal to zero, a warning will be issued to the console,
         since in this case the parsers may not work correctly.
 
-    !!! note
-        This class adds each virtual unit of time to `self.__dict__`,
-        as it filters values from there in `__iter__` ,method.
+    !!! info
+        Time units are collected once, in declaration order, into a
+        compact `registry.UnitRegistry` that is used for iteration.
+        Virtual units are stored there without creating objects for them.
+
+        Virtual units are also available as attributes named according to
+        the following pattern: `virtual_name` + `virtual_number`, their
+        `units.VirtualUnit` objects are created on first access.
 
-        For each virtual unit, a name is generated according to the
-        following pattern: `virtual_name` + `virtual_number`.
+    !!! info
+        The registry is frozen into a hash-consed `registry.UnitTable`, so
+        tenses with equal units (e.g. differing only in `multiplier`) share
+        one table. The alias trie and the alias index used by resolvers are
+        compiled from it on first access to `alias_trie` and `alias_units`
+        and reused by all these tenses.
 
     !!! info
-        This class caches time units in the `_cached_units` attribute
-        when iterating.
+        Per-tenant customisations of a shared tense are made with `overlay()`,
+        which stores only the differences.
 
     Parameters:
     -----------
@@ -74,30 +83,45 @@ class Tense:
     virtual: list[dict[str, Any]] = field(default_factory=list)
 
     def __post_init__(self) -> None:
-        self._cached_units: set[units.Unit] = set()
         if self.multiplier <= 0:
             warnings.warn(
                 "The time multiplier is less than zero, the work of "
                 "parsers may be incorrect. It is recommended to set "
                 "the value more than zero."
             )
+        self._registry = registry.UnitRegistry()
+        # Unit field name -> unit index in the registry.
+        self._unit_indexes: dict[str, int] = {}
+        for name, unit in list(self.__dict__.items()):
+            if isinstance(unit, units.Unit):
+                self._unit_indexes[name] = self._registry.add(unit)
+        self._virtual_offset = len(self._registry)
         if self.virtual:
             self._resolve_virtual()
+        self._registry.freeze()
 
     def __iter__(self) -> Iterator[units.Unit]:
-        _cached_units = self._cached_units
-        if _cached_units:
-            yield from _cached_units
-        else:
-            for unit in self.__dict__.values():
-                if isinstance(unit, units.Unit):
-                    self._cached_units.add(unit)
-                    yield unit
+        return iter(self._registry)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called if attribute was not found, e.g. for `virtualN`.
+        if name.startswith("virtual") and name[7:].isdigit():
+            n = int(name[7:])
+            if n < len(self.virtual):
+                # Kept, so that every access returns the same object.
+                unit = self.__dict__[name] = self._registry.unit(
+                    self._virtual_offset + n
+                )
+                return unit
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
 
     def _resolve_virtual(self) -> None:
-        """Adds virtual units to the current state of the class."""
-        for n, unit_dict in enumerate(self.virtual):
-            self.__dict__[f"virtual{n}"] = units.VirtualUnit(**unit_dict)
+        """Adds virtual units to the registry."""
+        add_virtual = self._registry.add_virtual
+        for unit_dict in self.virtual:
+            add_virtual(**unit_dict)
 
     @classmethod
     def from_dict(cls, tense_dict: dict[str, Any], /) -> Tense:
@@ -110,6 +134,10 @@ class Tense:
             other modules, these modules will need to be imported into this
             one, otherwise they simply will not be found.
 
+        !!! info
+            Virtual unit dictionaries are passed to the registry as they
+            are, no intermediate `units.VirtualUnit` objects are created.
+
         Parameters:
         -----------
         tense_dict: :class:`dict[str, Any]`, /
@@ -150,6 +178,99 @@ class Tense:
         """
         return cls.from_dict(repo.config)
 
+    def overlay(
+        self,
+        *,
+        multiplier: Optional[int] = None,
+        aliases: Optional[Mapping[str, Iterable[str]]] = None,
+        virtual: Optional[list[dict[str, Any]]] = None,
+    ) -> Tense:
+        """Returns tense that differs from this one only by the given changes.
+
+        The tense is layered over the unit table of this one (see
+        `registry.OverlayTable`): unchanged units are shared, and only
+        the additional aliases and units are stored, so per-tenant tenses
+        cost only their differences. Tenses with the same changes over the
+        same base share their table too.
+
+        Parameters:
+        -----------
+        multiplier: :class:`Optional[int]` = None, *
+            New time multiplier.
+        aliases: :class:`Optional[Mapping[str, Iterable[str]]]` = None, *
+            Additional aliases by unit field name ("second", "minute", ...).
+        virtual: :class:`Optional[list[dict[str, Any]]]` = None, *
+            Additional virtual units.
+
+        Raises:
+        -------
+        :class:`AttributeError`
+            Raises if there is no unit field with a name of `aliases`.
+
+        Examples:
+        ---------
+        >>> from tense import model
+        >>> from tense.adapters import repository
+
+        >>> tense = model.Tense.from_repository(repository.TenseRepository())
+        >>> custom = tense.overlay(multiplier=2, aliases={"minute": ["minuta"]})
+        >>> custom.second is tense.second
+        True
+        >>> custom.minute.aliases[-1]
+        'minuta'
+        >>> custom.registry.table.base is tense.registry.table
+        True
+        """
+        if multiplier is not None and multiplier <= 0:
+            warnings.warn(
+                "The time multiplier is less than zero, the work of "
+                "parsers may be incorrect. It is recommended to set "
+                "the value more than zero."
+            )
+        extra_aliases: dict[int, Iterable[str]] = {}
+        for name, unit_aliases in (aliases or {}).items():
+            idx = self._unit_indexes.get(name)
+            if idx is None:
+                raise AttributeError(
+                    f"{type(self).__name__!r} object has no unit {name!r}"
+                )
+            extra_aliases[idx] = unit_aliases
+        unit_registry = self._registry.overlay(extra_aliases, virtual or ())
+
+        # Bypasses __post_init__(), the registry is already built.
+        tense = object.__new__(type(self))
+        tense.__dict__.update(self.__dict__)
+        if multiplier is not None:
+            tense.multiplier = multiplier
+        if virtual:
+            tense.virtual = self.virtual + virtual
+        for name, idx in self._unit_indexes.items():
+            tense.__dict__[name] = unit_registry.unit(idx)
+        tense._registry = unit_registry
+        return tense
+
+    @property
+    def alias_trie(self) -> trie.AliasTrie:
+        """Non-data descriptor that returns compiled trie of all unit aliases.
+
+        !!! info
+            The trie is shared by all tenses with equal units.
+        """
+        return self._registry.table.alias_trie
+
+    @property
+    def alias_units(self) -> Mapping[Union[str, bytes], tuple[int, ...]]:
+        """Non-data descriptor that maps every alias to indexes of units
+        (in iteration order) that declare it. ASCII aliases are mapped as
+        bytes too.
+        """
+        return self._registry.table.alias_units
+
+    @property
+    def registry(self) -> registry.UnitRegistry:
+        """Non-data descriptor that returns compact registry of all units."""
+        return self._registry
+
     @property
     def all(self) -> list[str]:
-        return sum(u.aliases for u in self)
+        return [alias for _, alias in self._registry.iter_aliases()]
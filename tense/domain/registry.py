@@ -0,0 +1,784 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tense domain."""
+from __future__ import annotations
+
+__all__ = ["OverlayTable", "UnitRegistry", "UnitTable"]
+
+import collections
+import dataclasses
+import sys
+import threading
+import types
+import warnings
+import weakref
+from array import array
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from tense.domain import trie, units
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+# Hash-consed tables, see `UnitTable.intern()` and `UnitTable.overlay()`.
+_TABLES: weakref.WeakValueDictionary[bytes, UnitTable] = weakref.WeakValueDictionary()
+_TABLES_LOCK = threading.Lock()
+
+
+def _alias_keys(alias: str, /) -> tuple[Union[str, bytes], ...]:
+    """Returns keys of alias in indexes, ASCII aliases are keyed as bytes too."""
+    if alias.isascii():
+        return alias, alias.encode("ascii")
+    return (alias,)
+
+
+def _check_duration(duration: int, /) -> None:
+    if duration <= 0:
+        warnings.warn(
+            "The unit duration is less than zero, the work of "
+            "parsers may be incorrect. It is recommended to set "
+            "the value more than zero."
+        )
+
+
+def _new_digest() -> Any:
+    # Imported here: hashlib loads OpenSSL, which is slow to import,
+    # and tables are interned only when tenses are created.
+    import hashlib
+
+    return hashlib.blake2b(digest_size=16)
+
+
+def _update_digest(
+    digest: Any, durations: array[int], aliases: Sequence[str], offsets: array[int]
+) -> None:
+    digest.update(array("q", durations).tobytes())
+    digest.update(array("q", offsets).tobytes())
+    digest.update("\0".join(aliases).encode("utf-8", "surrogatepass"))
+
+
+class _LayeredMapping(Mapping[_K, _V]):
+    """Read-only mapping of a few `changes` layered over a shared `base`."""
+
+    __slots__ = ("_changes", "_base", "_len")
+
+    def __init__(self, changes: dict[_K, _V], base: Mapping[_K, _V], /) -> None:
+        self._changes = changes
+        self._base = base
+        self._len = len(base) + sum(key not in base for key in changes)
+
+    def __getitem__(self, key: _K) -> _V:
+        changes = self._changes
+        if key in changes:
+            return changes[key]
+        return self._base[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._changes or key in self._base
+
+    def __iter__(self) -> Iterator[_K]:
+        changes = self._changes
+        yield from changes
+        for key in self._base:
+            if key not in changes:
+                yield key
+
+    def __len__(self) -> int:
+        return self._len
+
+
+class _UnitStorage:
+    """Flat storage of unit durations and aliases, addressed by unit index."""
+
+    __slots__ = ("_durations", "_aliases", "_offsets")
+
+    _durations: array[int]
+    _aliases: Sequence[str]
+    # Aliases of unit `idx` are `_aliases[_offsets[idx]:_offsets[idx + 1]]`.
+    _offsets: array[int]
+
+    def __len__(self) -> int:
+        return len(self._durations)
+
+    @property
+    def durations(self) -> memoryview:
+        """Read-only view of unit durations, in index order."""
+        return memoryview(self._durations).toreadonly()
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory used by the storage (interned aliases
+        are not counted).
+        """
+        return (
+            sys.getsizeof(self._durations)
+            + sys.getsizeof(self._aliases)
+            + sys.getsizeof(self._offsets)
+        )
+
+    def duration(self, idx: int, /) -> int:
+        """Returns duration of unit by its index.
+
+        Parameters:
+        -----------
+        idx: :class:`int`, /
+            Unit index.
+        """
+        return self._durations[idx]
+
+    def aliases(self, idx: int, /) -> list[str]:
+        """Returns aliases of unit by its index.
+
+        Parameters:
+        -----------
+        idx: :class:`int`, /
+            Unit index.
+        """
+        return list(self._aliases[self._offsets[idx] : self._offsets[idx + 1]])
+
+    def iter_aliases(self) -> Iterator[tuple[int, str]]:
+        """Yields `(unit_index, alias)` pairs of all units, in index order."""
+        offsets = self._offsets
+        aliases = self._aliases
+        for idx in range(len(self._durations)):
+            for alias_idx in range(offsets[idx], offsets[idx + 1]):
+                yield idx, aliases[alias_idx]
+
+
+class _UnitBuffer(_UnitStorage):
+    """Growable storage of a registry that is not frozen yet."""
+
+    __slots__ = ()
+
+    _aliases: list[str]
+
+    def __init__(self) -> None:
+        self._durations = array("q")
+        self._aliases = []
+        self._offsets = array("q", (0,))
+
+    def append(self, aliases: Iterable[str], duration: int) -> int:
+        self._durations.append(duration)
+        self._aliases.extend(map(sys.intern, aliases))
+        self._offsets.append(len(self._aliases))
+        return len(self._durations) - 1
+
+
+class UnitTable(_UnitStorage):
+    """Immutable, hash-consed table of unit durations and aliases.
+
+    Tables are created with `intern()`, which returns the already existing
+    table for the same content, so any number of tenses (and parsers) with
+    equal units share one table and everything derived from it: the alias
+    trie, the alias index and the multiplied durations.
+
+    !!! info
+        Tables are kept in a weak dictionary and are freed as soon as
+        no tense uses them.
+
+    !!! info
+        Pickled tables are interned again on loading, derived trie
+        and indexes are not pickled.
+
+    Examples:
+    ---------
+    >>> from array import array
+    >>> table = UnitTable.intern(array("q", (1, 60)), ["s", "m"], array("q", (0, 1, 2)))
+    >>> table is UnitTable.intern(array("q", (1, 60)), ["s", "m"], array("q", (0, 1, 2)))
+    True
+    >>> table.scaled_durations(2)
+    (2, 120)
+    >>> dict(table.alias_durations(1))
+    {'s': 1, b's': 1, 'm': 60, b'm': 60}
+    """
+
+    __slots__ = ("_alias_trie", "_alias_units", "_scaled", "__weakref__")
+
+    _aliases: tuple[str, ...]
+
+    def __init__(
+        self,
+        durations: array[int],
+        aliases: Iterable[str],
+        offsets: array[int],
+        /,
+    ) -> None:
+        self._durations = array("q", durations)
+        self._aliases = tuple(map(sys.intern, aliases))
+        self._offsets = array("q", offsets)
+        self._alias_trie: Optional[trie.AliasTrie] = None
+        self._alias_units: Optional[Mapping[Union[str, bytes], tuple[int, ...]]] = None
+        # Multiplier -> (unit durations, alias durations).
+        self._scaled: dict[
+            int, tuple[tuple[int, ...], Mapping[Union[str, bytes], int]]
+        ] = {}
+
+    @classmethod
+    def intern(
+        cls,
+        durations: array[int],
+        aliases: Sequence[str],
+        offsets: array[int],
+        /,
+    ) -> UnitTable:
+        """Returns shared table with the given content.
+
+        Parameters:
+        -----------
+        durations: :class:`array[int]`, /
+            Unit durations.
+        aliases: :class:`Sequence[str]`, /
+            Aliases of all units, in unit order.
+        offsets: :class:`array[int]`, /
+            Offsets of the first alias of every unit, followed by `len(aliases)`.
+        """
+        digest = _new_digest()
+        _update_digest(digest, durations, aliases, offsets)
+        key = digest.digest()
+        with _TABLES_LOCK:
+            table = _TABLES.get(key)
+            if table is None or not table._equals(durations, aliases, offsets):
+                table = _TABLES[key] = cls(durations, aliases, offsets)
+            return table
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return UnitTable.intern, (self._durations, self._aliases, self._offsets)
+
+    def _equals(
+        self, durations: array[int], aliases: Sequence[str], offsets: array[int]
+    ) -> bool:
+        return (
+            self._durations.tolist() == list(durations)
+            and self._offsets.tolist() == list(offsets)
+            and self._aliases == tuple(aliases)
+        )
+
+    def overlay(
+        self,
+        extra: Mapping[int, Iterable[str]],
+        durations: array[int],
+        aliases: Sequence[str],
+        offsets: array[int],
+        /,
+    ) -> UnitTable:
+        """Returns shared table that layers changes over this one,
+        see `OverlayTable`. If there are no changes, this table is returned.
+
+        Parameters:
+        -----------
+        extra: :class:`Mapping[int, Iterable[str]]`, /
+            Additional aliases by unit index.
+        durations: :class:`array[int]`, /
+            Durations of additional units.
+        aliases: :class:`Sequence[str]`, /
+            Aliases of additional units, in unit order.
+        offsets: :class:`array[int]`, /
+            Offsets of the first alias of every additional unit,
+            followed by `len(aliases)`.
+
+        Raises:
+        -------
+        :class:`IndexError`
+            Raises if there is no unit with an index of `extra`.
+        """
+        changes: dict[int, tuple[str, ...]] = {}
+        for idx, extra_aliases in sorted(extra.items()):
+            if not 0 <= idx < len(self):
+                raise IndexError(f"Unit index {idx} is out of range.")
+            if extra_aliases := tuple(map(sys.intern, extra_aliases)):
+                changes[idx] = extra_aliases
+        if not changes and not len(durations):
+            return self
+
+        digest = _new_digest()
+        # The base is referenced by the overlay, so its id is not reused.
+        digest.update(b"overlay%d\0" % id(self))
+        for idx, extra_aliases in changes.items():
+            digest.update(b"%d:" % idx)
+            digest.update("\0".join(extra_aliases).encode("utf-8", "surrogatepass"))
+            digest.update(b"\1")
+        _update_digest(digest, durations, aliases, offsets)
+        key = digest.digest()
+        with _TABLES_LOCK:
+            table = _TABLES.get(key)
+            if not (
+                isinstance(table, OverlayTable)
+                and table._base is self
+                and table._extra == changes
+                and table._equals(durations, aliases, offsets)
+            ):
+                table = _TABLES[key] = OverlayTable(
+                    self, changes, durations, aliases, offsets
+                )
+            return table
+
+    @property
+    def alias_trie(self) -> trie.AliasTrie:
+        """Non-data descriptor that returns compiled trie of all unit aliases."""
+        if self._alias_trie is None:
+            self._alias_trie = trie.AliasTrie(self._aliases)
+        return self._alias_trie
+
+    @property
+    def alias_units(self) -> Mapping[Union[str, bytes], tuple[int, ...]]:
+        """Non-data descriptor that maps every alias to indexes of units
+        that declare it. ASCII aliases are mapped as bytes too.
+        """
+        if self._alias_units is None:
+            alias_units: dict[Union[str, bytes], tuple[int, ...]] = {}
+            for idx, alias in dict.fromkeys(self.iter_aliases()):
+                for key in _alias_keys(alias):
+                    alias_units[key] = alias_units.get(key, ()) + (idx,)
+            self._alias_units = types.MappingProxyType(alias_units)
+        return self._alias_units
+
+    def _scale(
+        self, multiplier: int, /
+    ) -> tuple[tuple[int, ...], Mapping[Union[str, bytes], int]]:
+        scaled = self._scaled.get(multiplier)
+        if scaled is None:
+            unit_durations = tuple(
+                duration * multiplier for duration in self._durations
+            )
+            alias_durations: dict[Union[str, bytes], int] = {}
+            for alias, unit_indexes in self.alias_units.items():
+                alias_durations[alias] = sum(
+                    unit_durations[idx] for idx in unit_indexes
+                )
+            scaled = self._scaled.setdefault(
+                multiplier,
+                (unit_durations, types.MappingProxyType(alias_durations)),
+            )
+        return scaled
+
+    def scaled_durations(self, multiplier: int, /) -> tuple[int, ...]:
+        """Returns unit durations multiplied by `multiplier`, in index order.
+
+        Parameters:
+        -----------
+        multiplier: :class:`int`, /
+            Time multiplier.
+        """
+        return self._scale(multiplier)[0]
+
+    def alias_durations(self, multiplier: int, /) -> Mapping[Union[str, bytes], int]:
+        """Maps every alias to the multiplied duration of its unit.
+        ASCII aliases are mapped both as strings and as bytes.
+
+        !!! note
+            An alias shared by several units counts for each of them.
+
+        Parameters:
+        -----------
+        multiplier: :class:`int`, /
+            Time multiplier.
+        """
+        return self._scale(multiplier)[1]
+
+
+class OverlayTable(UnitTable):
+    """Unit table that layers a few changes over a shared base table:
+    additional aliases of its units and additional units, which follow
+    the units of the base table.
+
+    Only the changes are stored, the alias trie and the indexes are derived
+    from those of the base table and store only the changed entries, so
+    memory grows with the number of distinct customisations, not with
+    the number of tables built on top of one base.
+
+    !!! info
+        Overlays are created with `UnitTable.overlay()` and are hash-consed
+        like other tables. An overlay of an overlay is layered over the
+        same base table.
+
+    !!! note
+        Additional aliases follow all aliases of the base table in
+        `iter_aliases()` and so have the lowest priority in the trie.
+
+    Examples:
+    ---------
+    >>> from array import array
+    >>> base = UnitTable.intern(array("q", (1, 60)), ["s", "m"], array("q", (0, 1, 2)))
+    >>> table = base.overlay({1: ["min"]}, array("q", (10,)), ["dec"], array("q", (0, 1)))
+    >>> table.aliases(1), table.aliases(2)
+    (['m', 'min'], ['dec'])
+    >>> table.alias_durations(1)["min"]
+    60
+    >>> table.alias_durations(1)["s"] is base.alias_durations(1)["s"]
+    True
+    """
+
+    __slots__ = ("_base", "_extra")
+
+    def __init__(
+        self,
+        base: UnitTable,
+        extra: dict[int, tuple[str, ...]],
+        durations: array[int],
+        aliases: Iterable[str],
+        offsets: array[int],
+        /,
+    ) -> None:
+        super().__init__(durations, aliases, offsets)
+        self._base = base
+        self._extra = extra
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self._base.overlay, (
+            self._extra,
+            self._durations,
+            self._aliases,
+            self._offsets,
+        )
+
+    def __len__(self) -> int:
+        return len(self._base) + len(self._durations)
+
+    @property
+    def base(self) -> UnitTable:
+        """Non-data descriptor that returns the shared base table."""
+        return self._base
+
+    @property
+    def durations(self) -> memoryview:
+        # <inherited docstring from :class:`_UnitStorage`> #
+        return memoryview(self._base._durations + self._durations).toreadonly()
+
+    @property
+    def nbytes(self) -> int:
+        # <inherited docstring from :class:`_UnitStorage`> #
+        return (
+            super().nbytes
+            + sys.getsizeof(self._extra)
+            + sum(map(sys.getsizeof, self._extra.values()))
+        )
+
+    def duration(self, idx: int, /) -> int:
+        # <inherited docstring from :class:`_UnitStorage`> #
+        base_size = len(self._base)
+        if idx < base_size:
+            return self._base.duration(idx)
+        return super().duration(idx - base_size)
+
+    def aliases(self, idx: int, /) -> list[str]:
+        # <inherited docstring from :class:`_UnitStorage`> #
+        base_size = len(self._base)
+        if idx < base_size:
+            return self._base.aliases(idx) + list(self._extra.get(idx, ()))
+        return super().aliases(idx - base_size)
+
+    def iter_aliases(self) -> Iterator[tuple[int, str]]:
+        # <inherited docstring from :class:`_UnitStorage`> #
+        yield from self._base.iter_aliases()
+        yield from self._iter_changed_aliases()
+
+    def _iter_changed_aliases(self) -> Iterator[tuple[int, str]]:
+        """Yields `(unit_index, alias)` pairs that are not in the base table."""
+        for idx, extra_aliases in self._extra.items():
+            for alias in extra_aliases:
+                yield idx, alias
+        base_size = len(self._base)
+        for idx, alias in super().iter_aliases():
+            yield base_size + idx, alias
+
+    def overlay(
+        self,
+        extra: Mapping[int, Iterable[str]],
+        durations: array[int],
+        aliases: Sequence[str],
+        offsets: array[int],
+        /,
+    ) -> UnitTable:
+        # <inherited docstring from :class:`UnitTable`> #
+        base_size = len(self._base)
+        changes = {
+            idx: list(extra_aliases) for idx, extra_aliases in self._extra.items()
+        }
+        own_extra: dict[int, list[str]] = {}
+        for idx, extra_aliases in extra.items():
+            if not 0 <= idx < len(self):
+                raise IndexError(f"Unit index {idx} is out of range.")
+            if idx < base_size:
+                changes.setdefault(idx, []).extend(extra_aliases)
+            else:
+                own_extra.setdefault(idx - base_size, []).extend(extra_aliases)
+
+        # Units of this overlay and the new ones are all added to the base.
+        buffer = _UnitBuffer()
+        for idx, duration in enumerate(self._durations):
+            buffer.append(super().aliases(idx) + own_extra.get(idx, []), duration)
+        for idx, duration in enumerate(durations):
+            buffer.append(aliases[offsets[idx] : offsets[idx + 1]], duration)
+        return self._base.overlay(
+            changes, buffer._durations, buffer._aliases, buffer._offsets
+        )
+
+    @property
+    def alias_trie(self) -> trie.AliasTrie:
+        # <inherited docstring from :class:`UnitTable`> #
+        if self._alias_trie is None:
+            self._alias_trie = self._base.alias_trie.extend(
+                (alias for _, alias in self._iter_changed_aliases()),
+                start=len(self._base._aliases),
+            )
+        return self._alias_trie
+
+    @property
+    def alias_units(self) -> Mapping[Union[str, bytes], tuple[int, ...]]:
+        # <inherited docstring from :class:`UnitTable`> #
+        if self._alias_units is None:
+            base_units = self._base.alias_units
+            changes: dict[Union[str, bytes], tuple[int, ...]] = {}
+            for idx, alias in self._iter_changed_aliases():
+                for key in _alias_keys(alias):
+                    unit_indexes = changes.get(key, base_units.get(key, ()))
+                    if idx not in unit_indexes:
+                        changes[key] = unit_indexes + (idx,)
+            self._alias_units = _LayeredMapping(changes, base_units)
+        return self._alias_units
+
+    def _scale(
+        self, multiplier: int, /
+    ) -> tuple[tuple[int, ...], Mapping[Union[str, bytes], int]]:
+        scaled = self._scaled.get(multiplier)
+        if scaled is None:
+            base_durations, base_alias_durations = self._base._scale(multiplier)
+            unit_durations = base_durations + tuple(
+                duration * multiplier for duration in self._durations
+            )
+            alias_units = self.alias_units
+            changes: dict[Union[str, bytes], int] = {}
+            for _, alias in self._iter_changed_aliases():
+                for key in _alias_keys(alias):
+                    changes[key] = sum(unit_durations[idx] for idx in alias_units[key])
+            scaled = self._scaled.setdefault(
+                multiplier,
+                (unit_durations, _LayeredMapping(changes, base_alias_durations)),
+            )
+        return scaled
+
+
+class UnitRegistry:
+    """Compact, index addressed storage of time units.
+
+    Durations are stored in an `array('q')` and aliases of all units
+    in one flat table of interned strings, addressed through an offsets
+    array, so a unit costs a few machine words instead of a dataclass
+    instance with its own `__dict__` and alias list.
+
+    !!! info
+        Units added with `add()` are also kept as objects and returned
+        as is, units added with `add_virtual()` are stored only compactly
+        and `units.VirtualUnit` objects are created for them on access.
+
+    !!! info
+        After `freeze()` the registry uses the storage of a hash-consed
+        `UnitTable`, so only unit objects remain per registry.
+        `overlay()` derives a frozen registry from a frozen one.
+
+    !!! warning
+        If the `duration` of a virtual unit is less than or equal to zero,
+        a warning will be issued to the console, just like on
+        `units.VirtualUnit` creation.
+
+    Examples:
+    ---------
+    >>> registry = UnitRegistry()
+    >>> registry.add(units.Second(["s", "sec"]))
+    0
+    >>> registry.add_virtual(aliases=["dec"], duration=10)
+    1
+    >>> registry.durations.tolist()
+    [1, 10]
+    >>> list(registry.iter_aliases())
+    [(0, 's'), (0, 'sec'), (1, 'dec')]
+    >>> registry.unit(1)
+    VirtualUnit(aliases=['dec'], duration=10)
+    """
+
+    __slots__ = ("_storage", "_objects")
+
+    def __init__(self) -> None:
+        self._storage: _UnitStorage = _UnitBuffer()
+        self._objects: MutableMapping[int, units.Unit] = {}
+
+    def __len__(self) -> int:
+        return len(self._storage)
+
+    def __iter__(self) -> Iterator[units.Unit]:
+        return map(self.unit, range(len(self)))
+
+    def _append(self, aliases: Iterable[str], duration: int) -> int:
+        storage = self._storage
+        if not isinstance(storage, _UnitBuffer):
+            raise TypeError("Frozen unit registry can't be changed.")
+        return storage.append(aliases, duration)
+
+    def add(self, unit: units.Unit, /) -> int:
+        """Registers unit object and returns its index.
+
+        Parameters:
+        -----------
+        unit: :class:`units.Unit`, /
+            Unit of time.
+        """
+        idx = self._append(unit.aliases, unit.duration)
+        self._objects[idx] = unit
+        return idx
+
+    def add_virtual(self, aliases: Iterable[str], duration: int) -> int:
+        """Registers virtual unit without creating an object for it
+        and returns its index. Accepts the same arguments as `units.VirtualUnit`.
+
+        Parameters:
+        -----------
+        aliases: :class:`Iterable[str]`
+            Aliases of unit of time.
+        duration: :class:`int`
+            Unit of time duration.
+        """
+        _check_duration(duration)
+        return self._append(aliases, duration)
+
+    def freeze(self) -> UnitTable:
+        """Replaces own storage with the shared `UnitTable` of the same
+        content and returns it. Frozen registry can't be changed.
+        """
+        storage = self._storage
+        if isinstance(storage, UnitTable):
+            return storage
+        table = self._storage = UnitTable.intern(
+            storage._durations, storage._aliases, storage._offsets
+        )
+        return table
+
+    def overlay(
+        self,
+        aliases: Optional[Mapping[int, Iterable[str]]] = None,
+        virtual: Iterable[Mapping[str, Any]] = (),
+    ) -> UnitRegistry:
+        """Returns frozen registry with additional aliases and virtual units,
+        layered over the table of this registry (see `OverlayTable`).
+        This registry is frozen if needed.
+
+        !!! info
+            Unit objects are shared, only units with additional aliases
+            are copied.
+
+        Parameters:
+        -----------
+        aliases: :class:`Optional[Mapping[int, Iterable[str]]]` = None
+            Additional aliases by unit index.
+        virtual: :class:`Iterable[Mapping[str, Any]]` = ()
+            Additional virtual units, as keyword arguments of `add_virtual()`.
+
+        Raises:
+        -------
+        :class:`IndexError`
+            Raises if there is no unit with an index of `aliases`.
+        """
+        buffer = _UnitBuffer()
+        for unit_dict in virtual:
+            _check_duration(unit_dict["duration"])
+            buffer.append(**unit_dict)
+        aliases = {idx: list(extra) for idx, extra in (aliases or {}).items()}
+        table = self.freeze().overlay(
+            aliases, buffer._durations, buffer._aliases, buffer._offsets
+        )
+
+        changed: dict[int, units.Unit] = {}
+        for idx in aliases:
+            unit = self._objects.get(idx)
+            if unit is not None:
+                changed[idx] = dataclasses.replace(unit, aliases=table.aliases(idx))
+        objects = self._objects
+        registry = UnitRegistry.__new__(UnitRegistry)
+        registry._storage = table
+        registry._objects = collections.ChainMap(
+            changed,
+            *(
+                objects.maps
+                if isinstance(objects, collections.ChainMap)
+                else (objects,)
+            ),
+        )
+        return registry
+
+    @property
+    def table(self) -> UnitTable:
+        """Non-data descriptor that returns shared table of the registry,
+        freezing it if needed.
+        """
+        return self.freeze()
+
+    @property
+    def durations(self) -> memoryview:
+        """Read-only view of unit durations, in index order."""
+        return self._storage.durations
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory used by the registry (interned aliases
+        and unit objects shared with other registries are not counted).
+        """
+        objects = self._objects
+        if isinstance(objects, collections.ChainMap):
+            # Objects of the base registry are shared.
+            objects = objects.maps[0]
+        if isinstance(self._storage, UnitTable):
+            # Storage is shared with the table.
+            return sys.getsizeof(objects)
+        return self._storage.nbytes + sys.getsizeof(objects)
+
+    def aliases(self, idx: int, /) -> list[str]:
+        """Returns aliases of unit by its index.
+
+        Parameters:
+        -----------
+        idx: :class:`int`, /
+            Unit index.
+        """
+        return self._storage.aliases(idx)
+
+    def iter_aliases(self) -> Iterator[tuple[int, str]]:
+        """Yields `(unit_index, alias)` pairs of all units, in index order."""
+        return self._storage.iter_aliases()
+
+    def unit(self, idx: int, /) -> units.Unit:
+        """Returns unit by its index.
+
+        Parameters:
+        -----------
+        idx: :class:`int`, /
+            Unit index.
+        """
+        unit = self._objects.get(idx)
+        if unit is not None:
+            return unit
+
+        # Bypasses __post_init__(), duration was already checked in add_virtual().
+        virtual = object.__new__(units.VirtualUnit)
+        virtual.aliases = self._storage.aliases(idx)
+        virtual.duration = self._storage.duration(idx)
+        return virtual
@@ -0,0 +1,208 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tense domain."""
+from __future__ import annotations
+
+__all__ = ["AliasTrie"]
+
+import functools
+from typing import Any, Callable, Final, Iterable, Optional, Union
+
+# Key under which a trie node stores `(priority, alias)` of the alias ending there.
+# Aliases consist of characters or bytes, so `None` can never clash with them.
+_TERMINAL: None = None
+# Number of distinct parts whose search results are remembered.
+_SEARCH_CACHE_SIZE: Final[int] = 4096
+
+
+class AliasTrie:
+    """Prefix tree compiled from unit aliases.
+
+    Used by resolvers to find the alias contained in a token without
+    scanning every alias of every unit.
+
+    !!! info
+        Each alias keeps the priority of its first occurrence in `aliases`.
+        When a token contains several aliases, the one with the lowest
+        priority wins.
+
+    !!! info
+        Tokens repeat a lot in practice, so results of `search()` are kept
+        in a bounded LRU cache.
+
+    !!! info
+        ASCII aliases are also inserted as bytes (iterating bytes yields
+        ints, so these paths never clash with characters), which allows
+        to search in bytes tokens without decoding them.
+
+    Parameters:
+    -----------
+    aliases: :class:`Iterable[str]`
+        Aliases in priority order.
+
+    Examples:
+    ---------
+    >>> trie = AliasTrie(["s", "sec", "m", "min"])
+    >>> trie.search("minutes")
+    'min'
+    >>> trie.search("s")
+    's'
+    >>> trie.search("xyz") is None
+    True
+    >>> trie.search(b"minutes")
+    b'min'
+    >>> trie.match("10minutes", 2, 5)
+    'min'
+    """
+
+    __slots__ = ("_root", "search")
+
+    def __init__(self, aliases: Iterable[str], /) -> None:
+        root: dict[Any, Any] = {}
+        for priority, alias in enumerate(aliases):
+            if not alias:
+                continue
+            self._insert(root, alias, priority)
+            if alias.isascii():
+                self._insert(root, alias.encode("ascii"), priority)
+        self._root = root
+        self.search: Callable[
+            [Union[str, bytes]], Optional[Union[str, bytes]]
+        ] = functools.lru_cache(maxsize=_SEARCH_CACHE_SIZE)(self._search)
+
+    @staticmethod
+    def _insert(root: dict[Any, Any], alias: Union[str, bytes], priority: int) -> None:
+        node = root
+        for char in alias:
+            node = node.setdefault(char, {})
+        node.setdefault(_TERMINAL, (priority, alias))
+
+    def extend(self, aliases: Iterable[str], /, start: int = 0) -> AliasTrie:
+        """Returns trie that also contains `aliases`, this trie is not changed.
+
+        !!! info
+            Nodes are shared with this trie, only nodes on the paths of
+            the new aliases are copied.
+
+        Parameters:
+        -----------
+        aliases: :class:`Iterable[str]`, /
+            Aliases in priority order.
+
+        start: :class:`int` = 0
+            Priority of the first alias, usually the number of aliases
+            this trie was compiled from, so that new aliases come last.
+
+        Examples:
+        ---------
+        >>> trie = AliasTrie(["s", "sec"])
+        >>> extended = trie.extend(["sek"], start=2)
+        >>> extended.search("2sek"), trie.search("2sek")
+        ('sek', None)
+        """
+        root = dict(self._root)
+        copied = {id(root)}
+        for priority, alias in enumerate(aliases, start):
+            if not alias:
+                continue
+            self._insert_copy(root, alias, priority, copied)
+            if alias.isascii():
+                self._insert_copy(root, alias.encode("ascii"), priority, copied)
+
+        extended = AliasTrie(())
+        extended._root = root
+        return extended
+
+    @staticmethod
+    def _insert_copy(
+        root: dict[Any, Any],
+        alias: Union[str, bytes],
+        priority: int,
+        copied: set[int],
+    ) -> None:
+        """Inserts alias, copying shared nodes on its path (ids of nodes
+        owned by the new trie are kept in `copied`).
+        """
+        node = root
+        for char in alias:
+            child = node.get(char)
+            if child is None or id(child) not in copied:
+                child = {} if child is None else dict(child)
+                copied.add(id(child))
+                node[char] = child
+            node = child
+        node.setdefault(_TERMINAL, (priority, alias))
+
+    def match(
+        self, text: Any, start: int = 0, end: Optional[int] = None, /
+    ) -> Optional[Union[str, bytes]]:
+        """Returns the alias equal to `text[start:end]`, without slicing `text`.
+
+        !!! note
+            Unlike `search()`, the whole span must be an alias and
+            the match is case sensitive.
+
+        Parameters:
+        -----------
+        text: :class:`Union[str, bytes, bytearray, memoryview]`, /
+            Text that contains the span.
+
+        start: :class:`int` = 0, /
+            Span start offset.
+
+        end: :class:`Optional[int]` = None, /
+            Span end offset, defaults to the end of `text`.
+        """
+        node: Any = self._root
+        for idx in range(start, len(text) if end is None else end):
+            node = node.get(text[idx])
+            if node is None:
+                return None
+        found = node.get(_TERMINAL)
+        return None if found is None else found[1]
+
+    def _search(self, part: Union[str, bytes], /) -> Optional[Union[str, bytes]]:
+        """Returns the highest priority alias contained in `part`.
+
+        !!! note
+            Single letter aliases match only single letter parts.
+
+        !!! note
+            For bytes parts the alias is returned as bytes.
+
+        Parameters:
+        -----------
+        part: :class:`Union[str, bytes]`, /
+            Token to search aliases in.
+        """
+        root = self._root
+        size = len(part)
+        min_depth = 2 if size > 1 else 1
+        best: Optional[tuple[int, Union[str, bytes]]] = None
+        for start in range(size):
+            node: Any = root
+            depth = 0
+            for char in part[start:]:
+                node = node.get(char)
+                if node is None:
+                    break
+                depth += 1
+                found = node.get(_TERMINAL)
+                if found is None or depth < min_depth:
+                    continue
+                if best is None or found[0] < best[0]:
+                    best = found
+                    if not best[0]:
+                        return best[1]
+        return None if best is None else best[1]
@@ -11,8 +11,53 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Service layer package."""
-from .dot_tense import __all__ as dot_tense_all
-from .unit_of_work import *
+"""Service layer package.
 
-__all__ = dot_tense_all + unit_of_work.__all__
+Submodules are imported on first attribute access, see PEP 562.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "from_tense_file",
+    "from_tense_file_source",
+    "AbstractTenseUnitOfWork",
+    "TenseUnitOfWork",
+]
+
+import importlib
+from typing import TYPE_CHECKING, Any, Final, Optional
+
+if TYPE_CHECKING:
+    from . import directory, dot_tense, safe_eval, unit_of_work
+    from .dot_tense import from_tense_file, from_tense_file_source
+    from .unit_of_work import AbstractTenseUnitOfWork, TenseUnitOfWork
+
+# Lazy attribute name -> (module, attribute or None for the module itself).
+_LAZY_ATTRS: Final[dict[str, tuple[str, Optional[str]]]] = {
+    "dot_tense": (".dot_tense", None),
+    "unit_of_work": (".unit_of_work", None),
+    "directory": (".directory", None),
+    "safe_eval": (".safe_eval", None),
+    "from_tense_file": (".dot_tense", "from_tense_file"),
+    "from_tense_file_source": (".dot_tense", "from_tense_file_source"),
+    "AbstractTenseUnitOfWork": (".unit_of_work", "AbstractTenseUnitOfWork"),
+    "TenseUnitOfWork": (".unit_of_work", "TenseUnitOfWork"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = importlib.import_module(module_name, __name__)
+    if attr is not None:
+        value = getattr(value, attr)
+    # Cached, so that next lookups don't call this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
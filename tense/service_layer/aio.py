@@ -0,0 +1,188 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Asyncio parsing with executor offload and micro-batching."""
+from __future__ import annotations
+
+__all__ = ["AsyncParser"]
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+if TYPE_CHECKING:
+    import concurrent.futures
+
+    from tense.application.ports import parsers as abc_parsers
+
+
+def _parse_batch(
+    parse: Callable[[Any], Any], raw_strs: list[Any]
+) -> list[tuple[bool, Any]]:
+    """Parses a batch in executor. Errors are returned, not raised, so that
+    each string gets its own result.
+    """
+    results: list[tuple[bool, Any]] = []
+    for raw_str in raw_strs:
+        try:
+            results.append((True, parse(raw_str)))
+        except Exception as exc:
+            results.append((False, exc))
+    return results
+
+
+class AsyncParser:
+    """Asyncio wrapper over parsers.
+
+    Concurrent `parse()` calls from many tasks are coalesced into batches,
+    which are parsed on an executor, so CPU work does not block the event
+    loop. Every awaiter gets its own result (or exception) back.
+
+    !!! note
+        An instance must be used from one event loop.
+
+    Parameters:
+    -----------
+    parser: :class:`abc_parsers.AbstractParser`, /
+        Parser that does the actual work.
+    executor: :class:`Optional[concurrent.futures.Executor]` = None, *
+        Executor to run batches on. If None, the default executor of the
+        event loop is used.
+    max_batch_size: :class:`int` = 256, *
+        A batch is sent to the executor as soon as it has this many strings.
+    max_delay: :class:`float` = 0.0, *
+        How long (in seconds) to wait for more strings before a batch is sent.
+        If 0, the batch is sent on the next iteration of the event loop.
+
+    Examples:
+    ---------
+    >>> import asyncio
+    >>> from tense import TenseParser
+
+    >>> async def main() -> list[int]:
+    ...     parser = AsyncParser(TenseParser())
+    ...     return await asyncio.gather(parser.parse("1m"), parser.parse("1h"))
+    >>> asyncio.run(main())
+    [60, 3600]
+    """
+
+    __slots__ = (
+        "_parser",
+        "_executor",
+        "_max_batch_size",
+        "_max_delay",
+        "_pending",
+        "_flush_handle",
+    )
+
+    def __init__(
+        self,
+        parser: abc_parsers.AbstractParser,
+        /,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_batch_size: int = 256,
+        max_delay: float = 0.0,
+    ) -> None:
+        if max_batch_size <= 0:
+            raise ValueError("Max batch size must be greater than zero.")
+        if max_delay < 0:
+            raise ValueError("Max delay must be greater than or equal to zero.")
+
+        self._parser = parser
+        self._executor = executor
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._pending: list[tuple[Any, asyncio.Future[Any]]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+
+    @property
+    def parser(self) -> abc_parsers.AbstractParser:
+        """Non-data descriptor that returns wrapped parser."""
+        return self._parser
+
+    async def parse(self, raw_str: Any, /) -> Any:
+        """Asynchronous version of `AbstractParser.parse()`.
+
+        Parameters:
+        -----------
+        raw_str: :class:`RawString`, /
+            Raw string to parse.
+        """
+        return await self._enqueue(asyncio.get_running_loop(), raw_str)
+
+    async def parse_many(self, raw_strs: Iterable[Any], /) -> list[Any]:
+        """Asynchronous version of `AbstractParser.parse_many()`.
+
+        Parameters:
+        -----------
+        raw_strs: :class:`Iterable[RawString]`, /
+            Raw strings to parse.
+        """
+        loop = asyncio.get_running_loop()
+        futures = [self._enqueue(loop, raw_str) for raw_str in raw_strs]
+        return list(await asyncio.gather(*futures))
+
+    def _enqueue(
+        self, loop: asyncio.AbstractEventLoop, raw_str: Any
+    ) -> asyncio.Future[Any]:
+        future = loop.create_future()
+        self._pending.append((raw_str, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush(loop)
+        elif self._flush_handle is None:
+            if self._max_delay:
+                self._flush_handle = loop.call_later(self._max_delay, self._flush, loop)
+            else:
+                self._flush_handle = loop.call_soon(self._flush, loop)
+        return future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        results = loop.run_in_executor(
+            self._executor,
+            _parse_batch,
+            self._parser.parse,
+            [raw_str for raw_str, _ in batch],
+        )
+        results.add_done_callback(
+            lambda done: self._set_results(done, [future for _, future in batch])
+        )
+
+    @staticmethod
+    def _set_results(
+        done: asyncio.Future[list[tuple[bool, Any]]],
+        futures: list[asyncio.Future[Any]],
+    ) -> None:
+        exc = asyncio.CancelledError() if done.cancelled() else done.exception()
+        if exc is not None:
+            # The executor itself failed, e.g. it was shut down.
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for future, (ok, value) in zip(futures, done.result()):
+            if future.done():
+                # Awaiter was cancelled.
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
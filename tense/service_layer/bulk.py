@@ -0,0 +1,137 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Bulk parsing of newline-delimited duration files."""
+from __future__ import annotations
+
+__all__ = ["BulkParseReport", "parse_file"]
+
+import array
+import mmap
+import pathlib
+import re
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
+
+from tense.adapters import parsers
+from tense.application import TenseParser
+
+if TYPE_CHECKING:
+    from tense.application.ports import parsers as abc_parsers
+
+# Whitespace, except of newline, between quantity and alias.
+_LINE_GAP: str = r"[^\S\n]*"
+
+
+@dataclass(frozen=True)
+class BulkParseReport:
+    """Throughput report of a bulk parse.
+
+    Parameters:
+    -----------
+    records: :class:`int`
+        Number of parsed lines.
+    elapsed: :class:`float`
+        Parse time in seconds.
+    """
+
+    records: int
+    elapsed: float
+
+    @property
+    def records_per_second(self) -> float:
+        """Non-data descriptor that returns parse throughput."""
+        if not self.elapsed:
+            return 0.0
+        return self.records / self.elapsed
+
+
+def _compile_line_pattern(parser: abc_parsers.AbstractParser) -> re.Pattern[bytes]:
+    """Compiles bytes pattern that matches either a quantity with alias, or a newline."""
+    aliases = [alias for alias in parser._durations if isinstance(alias, bytes)]
+    source = parsers._alias_pattern_source(
+        (alias.decode("ascii") for alias in aliases), gap=_LINE_GAP
+    )
+    return re.compile((source + r"|(\n)").encode("ascii"))
+
+
+def parse_file(
+    path: Union[pathlib.Path, str],
+    /,
+    *,
+    parser: Optional[abc_parsers.AbstractParser] = None,
+    out: Literal["array", "numpy"] = "array",
+) -> tuple[Any, BulkParseReport]:
+    """Parses a file of newline-delimited durations, one value per line.
+
+    The file is memory-mapped and scanned by one bytes pattern compiled
+    from the alias table of the parser, so lines are never materialised
+    as Python strings and the data is read straight from the page cache.
+
+    !!! note
+        Lines are parsed like `parsers.RegexParser` does, converters are
+        not applied, values are always integers.
+
+    Parameters:
+    -----------
+    path: :class:`Union[pathlib.Path, str]`, /
+        Path to the file.
+    parser: :class:`Optional[abc_parsers.AbstractParser]` = None, *
+        Parser to take the alias table and multiplier from. If None,
+        the default `TenseParser()` is used.
+    out: :class:`Literal["array", "numpy"]` = "array", *
+        Type of result: `array.array("q")`, or a NumPy `int64` array
+        (requires optional `numpy` dependency).
+
+    Returns:
+    --------
+    :class:`tuple[Any, BulkParseReport]`
+        Values of lines and the throughput report.
+    """
+    if out not in ("array", "numpy"):
+        raise ValueError('Out must be one of ("array", "numpy").')
+    if parser is None:
+        parser = TenseParser()
+
+    pattern = _compile_line_pattern(parser)
+    durations = parser._durations
+    values = array.array("q")
+    append = values.append
+
+    started = time.perf_counter()
+    with open(path, "rb") as file:
+        size = file.seek(0, 2)
+        if size:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                duration = 0
+                line_start = 0
+                for match in pattern.finditer(mapped):
+                    if match.lastindex == 3:
+                        append(duration)
+                        duration = 0
+                        line_start = match.end()
+                        continue
+                    duration += int(match[1]) * durations[match[2]]
+
+                if line_start < size:
+                    # Last line is not terminated by a newline.
+                    append(duration)
+    elapsed = time.perf_counter() - started
+
+    report = BulkParseReport(records=len(values), elapsed=elapsed)
+    if out == "numpy":
+        import numpy as np
+
+        return np.frombuffer(values, dtype=np.int64), report
+    return values, report
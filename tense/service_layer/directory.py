@@ -0,0 +1,206 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Batch compilation of directories of .tense files."""
+from __future__ import annotations
+
+__all__ = ["from_tense_directory", "DirectoryReport"]
+
+import concurrent.futures
+import pathlib
+import pickle
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final, Optional, Type, Union
+
+from tense.application import TenseParser
+from tense.service_layer.dot_tense import from_tense_file
+
+if TYPE_CHECKING:
+    from tense.application.ports import parsers as abc_parsers
+
+_PATTERN: Final[str] = "*.tense"
+# Number of files sent to a worker at once.
+_CHUNKSIZE: Final[int] = 16
+
+
+@dataclass(frozen=True)
+class DirectoryReport:
+    """Report of a directory compilation.
+
+    Parameters:
+    -----------
+    configs: :class:`dict[str, Any]`
+        Compiled configurations (or parsers) by name, in path order.
+    errors: :class:`dict[str, Exception]`
+        Errors of files that failed to compile, by name.
+    timings: :class:`dict[str, float]`
+        Compile time of every file in seconds, by name.
+    elapsed: :class:`float`
+        Total compile time in seconds.
+    """
+
+    configs: dict[str, Any]
+    errors: dict[str, Exception]
+    timings: dict[str, float]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        """Non-data descriptor that returns True if every file has compiled."""
+        return not self.errors
+
+
+def _name(path: pathlib.Path, root: pathlib.Path, /) -> str:
+    """Returns name of file: path relative to root, without `.tense` suffix.
+    A file named just `.tense` is named by its directory.
+    """
+    relative = path.relative_to(root)
+    if relative.name == ".tense":
+        relative = relative.parent
+    elif relative.suffix == ".tense":
+        relative = relative.with_suffix("")
+    return relative.as_posix()
+
+
+def _compile(
+    path: str, encoding: str, cache_dir: Optional[str]
+) -> tuple[Any, Optional[Exception], float]:
+    """Compiles a file, errors are returned, not raised, so that each
+    file gets its own result.
+    """
+    started = time.perf_counter()
+    try:
+        config = from_tense_file(path, encoding, cache_dir=cache_dir)
+    except Exception as exc:
+        return None, exc, time.perf_counter() - started
+    return config, None, time.perf_counter() - started
+
+
+def _compile_in_worker(
+    path: str, encoding: str, cache_dir: Optional[str]
+) -> tuple[Any, Optional[Exception], float]:
+    """Same as `_compile()`, but errors that can't be sent back to the
+    calling process are replaced with `RuntimeError`.
+    """
+    config, error, elapsed = _compile(path, encoding, cache_dir)
+    if error is not None:
+        try:
+            # Exceptions with custom `__init__` signatures may pickle,
+            # but fail to unpickle in the calling process.
+            pickle.loads(pickle.dumps(error))
+        except Exception:
+            error = RuntimeError(f"{type(error).__name__}: {error}")
+    return config, error, elapsed
+
+
+def from_tense_directory(
+    path: Union[pathlib.Path, str],
+    /,
+    *,
+    workers: Optional[int] = None,
+    pattern: str = _PATTERN,
+    encoding: str = "utf-8",
+    cache_dir: Optional[Union[pathlib.Path, str]] = None,
+    parser_cls: Optional[Type[abc_parsers.AbstractParser]] = None,
+    **parser_options: Any,
+) -> DirectoryReport:
+    """Compiles every `.tense` file in a directory tree concurrently.
+
+    Files are compiled on a pool of processes, as compilation is CPU-bound.
+    Each file is named by its path relative to `path` without the `.tense`
+    suffix (a file named just `.tense` is named by its directory, `.` for
+    the root).
+
+    !!! info
+        If `parser_cls` is specified, parsers are built from compiled
+        configurations in the calling process (parsers aren't sent between
+        processes), otherwise configurations are returned.
+
+    Parameters:
+    -----------
+    path: :class:`Union[pathlib.Path, str]`, /
+        Root directory.
+    workers: :class:`Optional[int]` = None, *
+        Number of worker processes. If None, the number of CPUs is used.
+        If 1, files are compiled in the calling process.
+    pattern: :class:`str` = "*.tense", *
+        Glob pattern of configuration files, matched recursively.
+    encoding: :class:`str` = "utf-8", *
+        Files encoding.
+    cache_dir: :class:`Optional[Union[pathlib.Path, str]]` = None, *
+        Directory of compiled configurations cache, see `from_tense_file()`.
+    parser_cls: :class:`Optional[Type[abc_parsers.AbstractParser]]` = None, *
+        Parser type to build from configurations.
+    **parser_options: :class:`Any`
+        Keyword arguments of `TenseParser`, used with `parser_cls`.
+
+    Examples:
+    ---------
+    >>> report = from_tense_directory("tests/e2e", workers=1)
+    >>> report.configs["."]["model.Tense"]["multiplier"]
+    2
+    >>> report.ok
+    True
+    """
+    if workers is not None and workers <= 0:
+        raise ValueError("Number of workers must be greater than zero.")
+    if parser_options and parser_cls is None:
+        raise TypeError("Parser options can be used only with `parser_cls`.")
+
+    started = time.perf_counter()
+    root = pathlib.Path(path)
+    if not root.is_dir():
+        raise NotADirectoryError(f"{str(root)!r} is not a directory.")
+
+    paths = sorted(p for p in root.rglob(pattern) if p.is_file())
+    args = (
+        [str(p) for p in paths],
+        [encoding] * len(paths),
+        [None if cache_dir is None else str(cache_dir)] * len(paths),
+    )
+    if workers == 1 or len(paths) <= 1:
+        results = list(map(_compile, *args))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(_compile_in_worker, *args, chunksize=_CHUNKSIZE)
+            )
+
+    configs: dict[str, Any] = {}
+    errors: dict[str, Exception] = {}
+    timings: dict[str, float] = {}
+    for file_path, (config, error, elapsed) in zip(paths, results):
+        name = _name(file_path, root)
+        timings[name] = elapsed
+        if error is not None:
+            errors[name] = error
+            continue
+
+        if parser_cls is None:
+            configs[name] = config
+            continue
+
+        build_started = time.perf_counter()
+        try:
+            configs[name] = TenseParser(parser_cls, tenses=config, **parser_options)
+        except Exception as exc:
+            errors[name] = exc
+        timings[name] += time.perf_counter() - build_started
+
+    return DirectoryReport(
+        configs=configs,
+        errors=errors,
+        timings=timings,
+        elapsed=time.perf_counter() - started,
+    )
@@ -0,0 +1,166 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""On-disk cache of compiled .tense configurations.
+
+Entries are JSON files named by a key: a hash of the (decoded) file source,
+of the cache format and of the library version, so editing a file or
+upgrading the library never returns a stale configuration. Any unreadable,
+corrupted or foreign entry is treated as a miss and overwritten.
+"""
+from __future__ import annotations
+
+__all__ = ["new_digest", "file_key", "source_key", "load", "store"]
+
+import functools
+import hashlib
+import json
+import os
+import pathlib
+from typing import Any, Final, Optional, Union
+
+# Bumped when the layout of cache entries changes.
+_CACHE_FORMAT: Final[int] = 1
+_SUFFIX: Final[str] = ".tense.json"
+_CHUNK_SIZE: Final[int] = 1 << 16
+
+
+@functools.lru_cache(maxsize=None)
+def _library_version() -> str:
+    """Returns version of the installed library. For source checkouts
+    without package metadata, a hash of the compiler sources is used,
+    so that changes of the compiler invalidate the cache.
+    """
+    # Imported here: package metadata is slow to import and is only
+    # needed once a cache directory is used.
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("tense")
+    except importlib.metadata.PackageNotFoundError:
+        pass
+
+    digest = hashlib.blake2b(digest_size=16)
+    package_dir = pathlib.Path(__file__).parent
+    for path in sorted(package_dir.glob("*.py")) + [
+        package_dir.parent / "safe_eval.py"
+    ]:
+        digest.update(path.read_bytes())
+    return "dev-" + digest.hexdigest()
+
+
+def new_digest() -> Any:
+    """Returns hash object of a key, feed it with UTF-8 encoded source
+    and use its `hexdigest()` as key.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{_CACHE_FORMAT}:{_library_version()}:".encode())
+    return digest
+
+
+def file_key(path: Union[pathlib.Path, str], encoding: str = "utf-8", /) -> str:
+    """Returns cache key of configuration file, the file is hashed in chunks.
+
+    Parameters:
+    -----------
+    path: :class:`Union[pathlib.Path, str]`, /
+        Path to configuration file.
+    encoding: :class:`str` = "utf-8", /
+        File encoding.
+    """
+    digest = new_digest()
+    with open(path, "r", encoding=encoding) as file:
+        for chunk in iter(functools.partial(file.read, _CHUNK_SIZE), ""):
+            digest.update(chunk.encode("utf-8", "surrogatepass"))
+    return str(digest.hexdigest())
+
+
+def source_key(source: str, /) -> str:
+    """Returns cache key of configuration source.
+
+    Parameters:
+    -----------
+    source: :class:`str`, /
+        Config file string representation.
+    """
+    digest = new_digest()
+    digest.update(source.encode("utf-8", "surrogatepass"))
+    return str(digest.hexdigest())
+
+
+def _entry_path(cache_dir: Union[pathlib.Path, str], key: str, /) -> pathlib.Path:
+    return pathlib.Path(cache_dir) / (key + _SUFFIX)
+
+
+def load(cache_dir: Union[pathlib.Path, str], key: str, /) -> Optional[Any]:
+    """Returns cached compiled configuration by key or None.
+
+    Parameters:
+    -----------
+    cache_dir: :class:`Union[pathlib.Path, str]`, /
+        Cache directory.
+    key: :class:`str`, /
+        Cache key, see `file_key()` and `source_key()`.
+    """
+    try:
+        with open(_entry_path(cache_dir, key), "rb") as file:
+            entry = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(entry, dict)
+        or entry.get("format") != _CACHE_FORMAT
+        or entry.get("version") != _library_version()
+        or not isinstance(entry.get("config"), dict)
+    ):
+        return None
+    return entry["config"]
+
+
+def store(cache_dir: Union[pathlib.Path, str], key: str, config: Any, /) -> bool:
+    """Stores compiled configuration by key. Returns False if it
+    can't be cached (it isn't JSON serializable or the directory isn't
+    writable), the cache is only an optimization, so errors aren't raised.
+
+    !!! info
+        The entry is written to a temporary file and renamed, so concurrent
+        readers never see a partially written entry.
+
+    Parameters:
+    -----------
+    cache_dir: :class:`Union[pathlib.Path, str]`, /
+        Cache directory.
+    key: :class:`str`, /
+        Cache key, see `file_key()` and `source_key()`.
+    config: :class:`Any`, /
+        Compiled configuration.
+    """
+    import tempfile
+
+    entry = {"format": _CACHE_FORMAT, "version": _library_version(), "config": config}
+    try:
+        dumped = json.dumps(entry)
+        path = _entry_path(cache_dir, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(dumped)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        return False
+    return True
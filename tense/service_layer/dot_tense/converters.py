@@ -28,7 +28,8 @@ __all__ = [
 import abc
 from typing import Any, Hashable
 
-from tense.service_layer.safe_eval import SafelyExpEvalute
+from tense.service_layer.dot_tense import exceptions
+from tense.service_layer.safe_eval import evaluate_arithmetic
 
 VCONVERTER_CONSTS: dict[str, int] = {
     "second": 1,
@@ -128,8 +129,11 @@ class ExpressionValueConverter(AbstractParticleValueConverter):
         return value.startswith("exp(") and value.endswith(")")
 
     def convert(self, value: str) -> Any:
-        exp = value[value.find("(") + 1 : value.find(")")]
-        return SafelyExpEvalute(exp, eval_locals=VCONVERTER_CONSTS).safe_evalute()
+        exp = value[value.find("(") + 1 : value.rfind(")")]
+        try:
+            return evaluate_arithmetic(exp, VCONVERTER_CONSTS)
+        except ValueError as exc:
+            raise exceptions.ExpressionError(f"Invalid value {value!r}: {exc}") from exc
 
 
 PARTICLE_CONVERTERS: frozenset[AbstractParticleConverter] = frozenset(
@@ -31,9 +31,16 @@ class HashableParticle(abc.ABC):
     def __hash__(self) -> int:
         return hash(self.target)
 
-    @abc.abstractmethod
     def matches(self) -> bool:
         """Returns True if particle matches to current value (target)."""
+        return self.matches_target(self.target)
+
+    @classmethod
+    @abc.abstractmethod
+    def matches_target(cls, target: str) -> bool:
+        """Returns True if particle matches to target,
+        without creating a particle.
+        """
         ...
 
     @classmethod
@@ -54,9 +61,10 @@ class HeaderParticle(HashableParticle):
 
     __slots__ = ("target",)
 
-    def matches(self) -> bool:
+    @classmethod
+    def matches_target(cls, target: str) -> bool:
         # <inherited docstring from :class:`HashableParticle` #
-        return self.target.startswith("[") and self.target.endswith("]")
+        return target.startswith("[") and target.endswith("]")
 
     @staticmethod
     def strip_header(header: str) -> str:
@@ -72,6 +80,7 @@ class GetattributeParticle(HashableParticle):
 
     __slots__ = ("target",)
 
-    def matches(self) -> bool:
+    @classmethod
+    def matches_target(cls, target: str) -> bool:
         # <inherited docstring from :class:`HashableParticle` #
-        return len(self.target.split("=")) > 1
+        return "=" in target
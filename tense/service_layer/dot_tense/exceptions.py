@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Dot_tense service exceptions."""
-__all__ = ["DotTenseError", "AnalyzeError"]
+__all__ = ["DotTenseError", "AnalyzeError", "ExpressionError"]
 
 
 class DotTenseError(Exception):
@@ -25,3 +25,9 @@ class AnalyzeError(DotTenseError):
     """Raises on configuration analyze step."""
 
     pass
+
+
+class ExpressionError(DotTenseError, ValueError):
+    """Raises if `exp()` value can't be evaluated."""
+
+    pass
@@ -18,23 +18,28 @@ __all__ = ["from_tense_file", "from_tense_file_source"]
 
 import abc
 import difflib
+import functools
 import inspect
+import io
 import pathlib
+import types
 from typing import (
     Any,
     Final,
     Generic,
     Hashable,
     Iterable,
+    Iterator,
+    Mapping,
     Optional,
     Type,
     TypeVar,
-    cast,
+    Union,
     final,
 )
 
 from tense.domain import model, units
-from tense.service_layer.dot_tense import converters, domain, exceptions
+from tense.service_layer.dot_tense import cache, converters, domain, exceptions
 
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
@@ -42,7 +47,6 @@ T_co = TypeVar("T_co", covariant=True)
 _COMMENT: Final[str] = "#"
 _BASE_SETTING_PATH: Final[str] = "model.Tense"
 _VIRTUAL_PREFIX: Final[str] = "virtual"
-_VIRTUALS: list[dict[str, Any]] = []
 
 _ONEWORD_HEADER_MATCHES: Final[tuple[str, ...]] = (_VIRTUAL_PREFIX,)
 _MODULE_HEADER_MATCHES: Final[tuple[str, ...]] = (
@@ -52,9 +56,21 @@ _MODULE_HEADER_MATCHES: Final[tuple[str, ...]] = (
 _OBJTYPE_MATCHES: Final[list[str]] = model.__all__ + units.__all__
 
 
+# Concrete particle types in `domain.__all__` order, tried one by one by `sorting_hat()`.
+_PARTICLE_TYPES: Final[tuple[Type[domain.HashableParticle], ...]] = tuple(
+    particle
+    for particle in map(domain.__dict__.__getitem__, domain.__all__)
+    if not inspect.isabstract(particle)
+)
+
+
 def sorting_hat(initial: str, /) -> domain.HashableParticle:
     """Converts a string to a particle (token) for further parsing.
-    Checks all domain names, if the class is abstract then skips it.
+    Checks all domain names, abstract classes are skipped.
+
+    !!! info
+        Candidate particle types are collected once, on import, and only
+        the matching particle is created.
 
     Parameters
     -----------
@@ -66,37 +82,39 @@ def sorting_hat(initial: str, /) -> domain.HashableParticle:
     :class:`KeyError`
         If particle for string is not found.
     """
-    for pname in domain.__all__:
-        particle = getattr(domain, pname)
-        if inspect.isabstract(particle):
-            continue
-
-        particle = particle(initial)
-        if particle.matches():
-            return cast(domain.HashableParticle, particle)
+    for particle_type in _PARTICLE_TYPES:
+        if particle_type.matches_target(initial):
+            return particle_type(initial)
 
     raise KeyError(f"Particle not found for {initial!s}.")
 
 
-def inject_particle_converters() -> dict[
+@functools.lru_cache(maxsize=None)
+def _particle_converters() -> Mapping[
     Type[domain.HashableParticle],
     converters.AbstractParticleConverter,
 ]:
-    """Injects converters for particles.
-    Abstract particles are skipped.
-    """
     injected = {}
-    for pname in domain.__all__:
-        particle = getattr(domain, pname)
-        if inspect.isabstract(particle):
-            continue
-
+    for particle in _PARTICLE_TYPES:
         for converter in converters.PARTICLE_CONVERTERS:
             if particle.matches_converter(converter):
                 injected[particle] = converter
                 continue
 
-    return injected
+    return types.MappingProxyType(injected)
+
+
+def inject_particle_converters() -> dict[
+    Type[domain.HashableParticle],
+    converters.AbstractParticleConverter,
+]:
+    """Injects converters for particles.
+    Abstract particles are skipped.
+
+    !!! info
+        Converters are matched once and reused, a copy is returned.
+    """
+    return dict(_particle_converters())
 
 
 class AbstractStepChain(abc.ABC, Generic[T, T_co]):
@@ -129,10 +147,14 @@ class AbstractStepChain(abc.ABC, Generic[T, T_co]):
         return self._next_handler
 
 
-class LexingStep(AbstractStepChain[str, dict[str, Any]]):
+class LexingStep(AbstractStepChain[Union[str, Iterable[str]], dict[str, Any]]):
     """At this step, a string representation of the configuration is received.
     Breaks the string config into particles (tokens) for further parsing.
 
+    !!! info
+        The configuration may also be an iterable of lines (e.g. an open
+        file), which is consumed lazily, one line at a time.
+
     !!! Note:
         * The parser goes through the configuration from top to bottom, one line
           at a time. Therefore, it is important to observe the order of settings.
@@ -146,13 +168,14 @@ class LexingStep(AbstractStepChain[str, dict[str, Any]]):
             return line[: line.find(_COMMENT)]
         return line
 
-    def take_a_step(self, target: str) -> dict[str, Any]:
+    def take_a_step(self, target: Union[str, Iterable[str]]) -> dict[str, Any]:
         # <inherited docstring from :class:`AbstractStepChain`> #
         groups: dict[str, Any] = {}
         last_section = ""
-        pconverters = inject_particle_converters()
+        pconverters = _particle_converters()
 
-        for line in target.split("\n"):
+        lines = io.StringIO(target) if isinstance(target, str) else target
+        for line in lines:
             line = self._trim_comment(line).strip()
             if not line:
                 # Line is empty.
@@ -215,10 +238,10 @@ class AnalyzeStep(AbstractStepChain[dict[str, Any], dict[str, Any]]):
                     raise exceptions.AnalyzeError(
                         self._with_suggest_to(key, matches=_ONEWORD_HEADER_MATCHES)
                     )
-                # Currently, supports only one one-word header.
+                # Currently, supports only one one-word header,
+                # it's moved to its place by `CompilingStep`.
                 if key == _VIRTUAL_PREFIX:
-                    _VIRTUALS.append(value)
-                    target.pop(key)
+                    target[_VIRTUAL_PREFIX] = target.pop(key_parts[0])
                     continue
 
             key_type, obj_type = key_parts
@@ -244,12 +267,19 @@ class AnalyzeStep(AbstractStepChain[dict[str, Any], dict[str, Any]]):
 
 
 class CompilingStep(AbstractStepChain[dict[str, Any], dict[str, Any]]):
-    """At this step, virtual values are added to the already converted dictionary."""
+    """At this step, virtual values are added to the already converted dictionary.
+
+    !!! info
+        Steps keep no state between calls, everything is carried by the
+        converted dictionary itself, so any number of configurations can be
+        compiled concurrently.
+    """
 
     def take_a_step(self, target: dict[str, Any]) -> dict[str, Any]:
         # <inherited docstring from :class:`AbstractStepChain`> #
-        if _VIRTUALS:
-            target[_BASE_SETTING_PATH][_VIRTUAL_PREFIX] = _VIRTUALS
+        virtual = target.pop(_VIRTUAL_PREFIX, None)
+        if virtual is not None:
+            target[_BASE_SETTING_PATH][_VIRTUAL_PREFIX] = [virtual]
         return target
 
 
@@ -261,13 +291,13 @@ class _ShadowStep(AbstractStepChain[dict[Hashable, Any], dict[Hashable, Any]]):
         return target
 
 
-def from_tense_file_source(file_source: str, /) -> Any:
+def from_tense_file_source(file_source: Union[str, Iterable[str]], /) -> Any:
     """Parses a configuration file into a dictionary.
 
     Parameters:
     -----------
-    file_source: :class:`str`, /
-        Config file string representation.
+    file_source: :class:`Union[str, Iterable[str]]`, /
+        Config file string representation or iterable of its lines.
     """
     (
         (first_step := LexingStep())
@@ -288,15 +318,46 @@ def from_tense_file(
     path: pathlib.Path | str,
     /,
     encoding: str = "utf-8",
+    *,
+    cache_dir: Optional[pathlib.Path | str] = None,
 ) -> Any:
     """Opens the configuration file and parses source into a dictionary.
 
+    !!! info
+        If `cache_dir` is specified, compiled configurations are cached
+        there, keyed by the file source and the library version, and the
+        whole step chain is skipped on a cache hit. Corrupted entries are
+        ignored and rewritten.
+
     Parameters:
     -----------
     path: :class:`Union[pathlib.Path, str]`, /
         Path to configuration file.
     encoding: :class:`Optional[str]` = None
         File encoding.
+    cache_dir: :class:`Optional[Union[pathlib.Path, str]]` = None, *
+        Directory of compiled configurations cache.
     """
+    if cache_dir is not None:
+        config = cache.load(cache_dir, cache.file_key(path, encoding))
+        if config is not None:
+            return config
+
     with open(path, "r", encoding=encoding) as file:
-        return from_tense_file_source(file.read())
+        if cache_dir is None:
+            # The file is lexed line by line, without reading it whole.
+            return from_tense_file_source(file)
+
+        # The key is computed again from the lines actually compiled,
+        # in case the file has changed since it was hashed.
+        digest = cache.new_digest()
+
+        def hashed_lines() -> Iterator[str]:
+            for line in file:
+                digest.update(line.encode("utf-8", "surrogatepass"))
+                yield line
+
+        config = from_tense_file_source(hashed_lines())
+
+    cache.store(cache_dir, digest.hexdigest(), config)
+    return config
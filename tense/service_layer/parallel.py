@@ -0,0 +1,140 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Parallel parsing on a process pool."""
+from __future__ import annotations
+
+__all__ = ["parse_parallel"]
+
+import concurrent.futures
+import itertools
+import pathlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Final,
+    Iterable,
+    Iterator,
+    Optional,
+    Type,
+    Union,
+)
+
+from tense.application import TenseParser
+from tense.service_layer.dot_tense import from_tense_file
+
+if TYPE_CHECKING:
+    from tense.application.ports import converters as abc_converters
+    from tense.application.ports import parsers as abc_parsers
+    from tense.application.ports import repository as abc_repository
+    from tense.domain import model
+
+_DEFAULT_CHUNKSIZE: Final[int] = 4096
+
+# Parser of the current worker process, built once by `_init_worker`.
+_WORKER_PARSER: Optional[abc_parsers.AbstractParser] = None
+
+
+def _init_worker(
+    parser_cls: Type[abc_parsers.AbstractParser],
+    tenses: Optional[dict[str, Any]],
+    tense_file: Optional[Union[pathlib.Path, str]],
+    converter: Optional[abc_converters.AbstractConverter[Any]],
+    time_resolver: Optional[Callable[[str, model.Tense], Iterator[str]]],
+) -> None:
+    """Pool initializer, builds the parser of worker process."""
+    global _WORKER_PARSER
+    if tense_file is not None:
+        tenses = from_tense_file(tense_file)
+
+    _WORKER_PARSER = TenseParser(
+        parser_cls,
+        tenses=tenses,
+        converter=converter,
+        time_resolver=time_resolver,
+    )
+
+
+def _parse_chunk(chunk: list[Any]) -> list[Any]:
+    assert _WORKER_PARSER is not None, "Worker is not initialized."
+    return _WORKER_PARSER.parse_many(chunk)
+
+
+def _chunked(items: Iterable[Any], chunksize: int) -> Iterator[list[Any]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, chunksize)):
+        yield chunk
+
+
+def parse_parallel(
+    items: Iterable[Any],
+    /,
+    *,
+    workers: Optional[int] = None,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+    parser_cls: Type[abc_parsers.AbstractParser] = TenseParser.DIGIT,
+    tenses: Optional[
+        Union[abc_repository.AbstractTenseRepository, dict[str, Any]]
+    ] = None,
+    tense_file: Optional[Union[pathlib.Path, str]] = None,
+    converter: Optional[abc_converters.AbstractConverter[Any]] = None,
+    time_resolver: Optional[Callable[[str, model.Tense], Iterator[str]]] = None,
+) -> list[Any]:
+    """Parses strings on a pool of processes, preserving their order.
+
+    Every worker builds its own parser once, in the pool initializer,
+    from the same configuration, so parsers are never pickled per task.
+    Strings are sent to workers in chunks.
+
+    !!! note
+        `converter` and `time_resolver` are sent to workers, so they
+        must be picklable (module-level functions, plain instances, ...).
+
+    Parameters:
+    -----------
+    items: :class:`Iterable[Any]`, /
+        Raw strings to parse.
+    workers: :class:`Optional[int]` = None, *
+        Number of worker processes. If None, the number of CPUs is used.
+    chunksize: :class:`int` = 4096, *
+        Number of strings sent to a worker at once.
+    parser_cls: :class:`Type[abc_parsers.AbstractParser]` = TenseParser.DIGIT, *
+        Concrete parser type.
+    tenses: :class:`Optional[Union[abc_repository.AbstractTenseRepository, dict[str, Any]]]` = None, *
+        Configuration repository (or its config) for time parser.
+    tense_file: :class:`Optional[Union[pathlib.Path, str]]` = None, *
+        Path to `.tense` configuration file, read by every worker.
+        Can't be used together with `tenses`.
+    converter: :class:`Optional[abc_converters.AbstractConverter]` = None, *
+        Value converter.
+    time_resolver: :class:`Optional[Callable[[str, model.Tense], Iterator[str]]]` = None, *
+        Raw string resolver.
+    """
+    if chunksize <= 0:
+        raise ValueError("Chunksize must be greater than zero.")
+    if tenses is not None and tense_file is not None:
+        raise ValueError("Only one of `tenses` and `tense_file` can be specified.")
+    if tenses is not None and not isinstance(tenses, dict):
+        tenses = tenses.config
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(parser_cls, tenses, tense_file, converter, time_resolver),
+    ) as executor:
+        return list(
+            itertools.chain.from_iterable(
+                executor.map(_parse_chunk, _chunked(items, chunksize))
+            )
+        )
@@ -0,0 +1,243 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Hot-reload of .tense configuration files."""
+from __future__ import annotations
+
+__all__ = ["ReloadingParser"]
+
+import os
+import pathlib
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Optional, Type, Union
+
+from tense.application import TenseParser
+from tense.service_layer.dot_tense import from_tense_file
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from tense.application.ports import parsers as abc_parsers
+
+# (st_mtime_ns, st_size, st_ino) of configuration file, st_ino detects
+# files replaced by rename (as editors and deploy tools do).
+_FileSignature = tuple[int, int, int]
+
+
+def _signature(path: Union[pathlib.Path, str], /) -> Optional[_FileSignature]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _watch(
+    ref: weakref.ReferenceType[ReloadingParser],
+    stopped: threading.Event,
+    interval: float,
+) -> None:
+    """Watcher thread loop. Only a weak reference to the parser is held,
+    so the thread exits once the parser is garbage collected.
+    """
+    while not stopped.wait(interval):
+        parser = ref()
+        if parser is None:
+            return
+        parser.check()
+        # Not kept alive while waiting.
+        del parser
+
+
+class ReloadingParser:
+    """Parser proxy that follows changes of a `.tense` file.
+
+    The file is polled with `os.stat()` every `interval` seconds on a
+    daemon thread. When its modification time, size or inode changes, a
+    new parser (with its own `model.Tense` and compiled tables) is built
+    on that thread and then swapped in by replacing a single reference.
+
+    Every call reads the reference once, so in-flight parses never block
+    and always use one complete parser, either old or new.
+
+    !!! info
+        If the file can't be read or compiled, the current parser is kept
+        and the error is stored in `last_error` until the next successful
+        reload.
+
+    !!! info
+        The watcher thread doesn't keep the proxy alive, it stops when
+        the proxy is garbage collected even if `stop()` wasn't called.
+
+    !!! note
+        Polling is used instead of inotify, as it works on every platform
+        and file system (including network and container mounts).
+
+    Parameters:
+    -----------
+    path: :class:`Union[pathlib.Path, str]`, /
+        Path to configuration file.
+    parser_cls: :class:`Type[abc_parsers.AbstractParser]` = TenseParser.DIGIT, *
+        Parser type.
+    interval: :class:`float` = 1.0, *
+        Polling interval in seconds.
+    start: :class:`bool` = True, *
+        If True, the watcher thread is started immediately, otherwise
+        call `start()` or `check()` manually.
+    **parser_options: :class:`Any`
+        Keyword arguments of `TenseParser`.
+
+    Examples:
+    ---------
+    >>> with ReloadingParser("tests/e2e/.tense", start=False) as parser:
+    ...     parser.parse("1m")
+    120
+    """
+
+    __slots__ = (
+        "_path",
+        "_parser_cls",
+        "_parser_options",
+        "_interval",
+        "_parser",
+        "_signature",
+        "_lock",
+        "_stopped",
+        "_thread",
+        "version",
+        "last_error",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        path: Union[pathlib.Path, str],
+        /,
+        *,
+        parser_cls: Type[abc_parsers.AbstractParser] = TenseParser.DIGIT,
+        interval: float = 1.0,
+        start: bool = True,
+        **parser_options: Any,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("Polling interval must be greater than zero.")
+
+        self._path = path
+        self._parser_cls = parser_cls
+        self._parser_options = parser_options
+        self._interval = interval
+        # Serializes reloads, parsing never takes it.
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        # Wakes the watcher thread up when the proxy is collected.
+        weakref.finalize(self, self._stopped.set)
+        self._thread: Optional[threading.Thread] = None
+        self.version = 0
+        self.last_error: Optional[Exception] = None
+
+        # The first load must succeed, there is no parser to fall back to.
+        self._signature = _signature(path)
+        self._parser = self._load()
+        if start:
+            self.start()
+
+    def __enter__(self) -> ReloadingParser:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called if attribute was not found, e.g. for `parse_many`.
+        if name == "_parser":
+            raise AttributeError(name)
+        return getattr(self._parser, name)
+
+    @property
+    def parser(self) -> abc_parsers.AbstractParser:
+        """Non-data descriptor that returns current parser."""
+        return self._parser
+
+    def parse(self, raw_str: Any, /) -> Any:
+        """Parses string with the current parser, see `AbstractParser.parse()`.
+
+        Parameters:
+        -----------
+        raw_str: :class:`RawString`, /
+            String to parse.
+        """
+        return self._parser.parse(raw_str)
+
+    def _load(self) -> abc_parsers.AbstractParser:
+        parser: abc_parsers.AbstractParser = TenseParser(
+            self._parser_cls,
+            tenses=from_tense_file(self._path),
+            **self._parser_options,
+        )
+        return parser
+
+    def reload(self) -> bool:
+        """Rebuilds parser from the file and swaps it in.
+        Returns False (keeping the current parser) if it has failed.
+        """
+        with self._lock:
+            signature = _signature(self._path)
+            try:
+                parser = self._load()
+            except Exception as exc:
+                # Not retried until the file changes again.
+                self._signature = signature
+                self.last_error = exc
+                return False
+            # A single reference assignment is atomic.
+            self._parser = parser
+            self._signature = signature
+            self.version += 1
+            self.last_error = None
+            return True
+
+    def check(self) -> bool:
+        """Reloads parser if the file has changed since the last load.
+        Returns True if the parser was swapped.
+        """
+        signature = _signature(self._path)
+        if signature is None or signature == self._signature:
+            return False
+        return self.reload()
+
+    def start(self) -> None:
+        """Starts the watcher thread, if it isn't running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=_watch,
+            args=(weakref.ref(self), self._stopped, self._interval),
+            name=f"tense-reload:{self._path}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the watcher thread and waits for it."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -11,19 +11,47 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Safely expression execution tool."""
-__all__ = ["SafelyExpEvalute"]
+"""Safely expression execution tools."""
+__all__ = ["SafelyExpEvalute", "evaluate_arithmetic"]
 
+import ast
 import copy
+import functools
+import math
+import operator
 import sys
 import textwrap
 import traceback
 import types
 from dataclasses import dataclass, field
-from typing import Any, Final
+from typing import Any, Callable, Final, Mapping, Optional, Union
 
 _TAB: Final[str] = " " * 4
 
+Number = Union[int, float]
+
+_BINARY_OPERATORS: Final[
+    dict[type[ast.operator], Callable[[Number, Number], Number]]
+] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPERATORS: Final[dict[type[ast.unaryop], Callable[[Number], Number]]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+# Guard against expressions like `9 ** 9 ** 9` or `((2 ** 128) ** 128) ** 128`,
+# which would never finish: exponents and sizes of integer results are bounded.
+_MAX_EXPONENT: Final[int] = 128
+_MAX_RESULT_BITS: Final[int] = 4096
+_MAX_EXPRESSION_LENGTH: Final[int] = 1024
+_EXPRESSION_CACHE_SIZE: Final[int] = 1024
+
 
 def _base_exc_format(exc: BaseException) -> str:
     return "\n".join(
@@ -103,3 +131,89 @@ class SafelyExpEvalute:
     @property
     def func_name(self) -> str:
         return "__" + self.__class__.__name__.lower()
+
+
+def _fold(node: ast.AST, names: Mapping[str, Number], /) -> Number:
+    """Evaluates restricted arithmetic AST node to a constant."""
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return node.value
+        raise ValueError(f"Unsupported constant {node.value!r}.")
+
+    if isinstance(node, ast.Name):
+        try:
+            return names[node.id]
+        except KeyError:
+            raise ValueError(f"Undefined name {node.id!r}.") from None
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](_fold(node.operand, names))
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        left = _fold(node.left, names)
+        right = _fold(node.right, names)
+        if isinstance(node.op, ast.Pow):
+            if abs(right) > _MAX_EXPONENT:
+                raise ValueError(f"Exponent {right!r} is too large.")
+            # Estimated before computing, as computing is what takes long.
+            if abs(left) > 1 and right * math.log2(abs(left)) > _MAX_RESULT_BITS:
+                raise ValueError(f"Result of {left!r} ** {right!r} is too large.")
+        try:
+            result = _BINARY_OPERATORS[type(node.op)](left, right)
+        except ArithmeticError as exc:
+            raise ValueError(str(exc)) from None
+        if isinstance(result, int) and result.bit_length() > _MAX_RESULT_BITS:
+            raise ValueError("Result is too large.")
+        return result
+
+    raise ValueError(f"Unsupported syntax {type(node).__name__!r}.")
+
+
+@functools.lru_cache(maxsize=_EXPRESSION_CACHE_SIZE)
+def _evaluate_cached(exp: str, names: tuple[tuple[str, Number], ...], /) -> Number:
+    if len(exp) > _MAX_EXPRESSION_LENGTH:
+        raise ValueError("Expression is too long.")
+    try:
+        tree = ast.parse(exp.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise ValueError(f"Invalid expression {exp!r}: {exc.msg}.") from None
+    return _fold(tree.body, dict(names))
+
+
+def evaluate_arithmetic(
+    exp: str, /, names: Optional[Mapping[str, Number]] = None
+) -> Number:
+    """Evaluates arithmetic expression of numbers and names.
+
+    Unlike `SafelyExpEvalute`, nothing is executed: the expression is
+    parsed into an AST, which is checked against a small set of allowed
+    nodes (numbers, names, `+ - * / // % **` and parentheses) and folded
+    into a constant. Results are kept in a bounded LRU cache keyed by the
+    expression text and the names.
+
+    Parameters:
+    -----------
+    exp: :class:`str`, /
+        Expression string.
+    names: :class:`Optional[Mapping[str, Union[int, float]]]` = None
+        Values of names used in the expression.
+
+    Raises:
+    -------
+    :class:`ValueError`
+        If the expression is invalid, uses anything but allowed nodes
+        and names, can't be evaluated (e.g. division by zero) or its
+        result would be too large (over 4096 bits).
+
+    Examples:
+    ---------
+    >>> evaluate_arithmetic("2 + 2 * 2")
+    6
+    >>> evaluate_arithmetic("(minute * 60) // 2", names={"minute": 60})
+    1800
+    >>> evaluate_arithmetic("__import__('os')")
+    Traceback (most recent call last):
+    ...
+    ValueError: Unsupported syntax 'Call'.
+    """
+    return _evaluate_cached(exp, () if names is None else tuple(names.items()))
@@ -0,0 +1,161 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""NumPy integration for bulk duration parsing.
+
+!!! note
+    This module requires `numpy`, which is an optional dependency:
+    `pip install tense[numpy]`.
+"""
+from __future__ import annotations
+
+__all__ = ["parse_array"]
+
+from typing import TYPE_CHECKING, Any, Callable, Final, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "tense.service_layer.vectorized requires numpy, "
+        "install it with `pip install tense[numpy]`."
+    ) from exc
+
+from tense.application import TenseParser
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from tense.application.ports import parsers as abc_parsers
+
+_DEFAULT_CHUNK_SIZE: Final[int] = 65_536
+_STRING_KINDS: Final[str] = "US"
+
+
+def _duration_parse_function(
+    parser: abc_parsers.AbstractParser, /
+) -> Callable[[Any], int]:
+    """Returns function that parses a string to an integer duration.
+
+    Parsers without a converter are called through `.parse()`, so their
+    result cache is used. Converted values may not be integers, so for
+    other parsers `._parse()` is called: it is the step `.parse()` takes
+    before converting, only the cache of converted values is skipped.
+    Both raise the same errors for invalid strings.
+    """
+    if parser._converter is None:
+        return parser.parse
+    return parser._parse
+
+
+def _parse_chunk(
+    chunk: npt.NDArray[Any],
+    parser: abc_parsers.AbstractParser,
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.bool_]]:
+    """Parses one chunk. Each distinct string is parsed only once, and values
+    are scattered back with a NumPy index array.
+    """
+    seconds = np.zeros(len(chunk), dtype=np.int64)
+    if chunk.dtype.kind in _STRING_KINDS:
+        # Bytes arrays are parsed as is, without decoding.
+        valid = np.ones(len(chunk), dtype=np.bool_)
+        strings = chunk
+    else:
+        # Object arrays may hold None, NaN or any other non-string value.
+        valid = np.fromiter(
+            (isinstance(value, str) for value in chunk),
+            dtype=np.bool_,
+            count=len(chunk),
+        )
+        strings = chunk[valid].astype(str)
+
+    distinct, inverse = np.unique(strings, return_inverse=True)
+    distinct_seconds = np.zeros(len(distinct), dtype=np.int64)
+    distinct_valid = np.ones(len(distinct), dtype=np.bool_)
+    parse = _duration_parse_function(parser)
+    for idx, raw_str in enumerate(distinct.tolist()):
+        try:
+            distinct_seconds[idx] = parse(raw_str)
+        except (ValueError, TypeError, OverflowError):
+            distinct_valid[idx] = False
+
+    seconds[valid] = distinct_seconds[inverse]
+    valid[valid] = distinct_valid[inverse]
+    return seconds, valid
+
+
+def parse_array(
+    values: Union[npt.ArrayLike, Sequence[Any]],
+    /,
+    *,
+    parser: Optional[abc_parsers.AbstractParser] = None,
+    with_mask: bool = False,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Union[npt.NDArray[np.int64], tuple[npt.NDArray[np.int64], npt.NDArray[np.bool_]]]:
+    """Parses an array of duration strings to an `int64` array of durations.
+
+    Aliases and multiplier are taken from the `model.Tense` of the parser.
+    Data is processed in chunks, and inside each chunk every distinct
+    string is parsed only once.
+
+    !!! note
+        Converters are not applied, values are always integers.
+
+    !!! info
+        Entries that are not strings, or that the parser fails on, are
+        set to 0 and marked as invalid in the mask.
+
+    Parameters:
+    -----------
+    values: :class:`Union[npt.ArrayLike, Sequence[Any]]`, /
+        NumPy string/object array or any sequence of strings. The shape
+        of the result matches the shape of the array.
+    parser: :class:`Optional[abc_parsers.AbstractParser]` = None, *
+        Parser to take the configuration from. If None, the default
+        `TenseParser()` is used.
+    with_mask: :class:`bool` = False, *
+        If True, returns a tuple of values and a boolean validity mask.
+    chunk_size: :class:`int` = 65_536, *
+        Number of entries processed at once.
+
+    Examples:
+    ---------
+    >>> parse_array(["1m", "1h", "1m"])
+    array([  60, 3600,   60])
+    >>> parse_array(["1m", None], with_mask=True)
+    (array([60,  0]), array([ True, False]))
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be greater than zero.")
+
+    if parser is None:
+        parser = TenseParser()
+
+    if isinstance(values, np.ndarray):
+        array = values if values.dtype.kind in _STRING_KINDS else values.astype(object)
+    else:
+        # NumPy would silently turn numbers of mixed sequences into strings.
+        array = np.asarray(values, dtype=object)
+    shape = array.shape
+    array = array.ravel()
+
+    seconds = np.empty(len(array), dtype=np.int64)
+    valid = np.empty(len(array), dtype=np.bool_)
+    for start in range(0, len(array), chunk_size):
+        stop = start + chunk_size
+        seconds[start:stop], valid[start:stop] = _parse_chunk(array[start:stop], parser)
+
+    seconds, valid = seconds.reshape(shape), valid.reshape(shape)
+    if with_mask:
+        return seconds, valid
+    return seconds
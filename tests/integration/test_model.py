@@ -11,13 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import pickle
 from typing import Iterator
 
 import pytest
-from hamcrest import assert_that, greater_than, has_length, instance_of, is_
+from hamcrest import assert_that, equal_to, greater_than, has_length, instance_of, is_
 
 from tense.adapters import repository
-from tense.domain import model
+from tense.domain import model, registry, units
 
 from ..pyhamcrest import is_dataclass, subclass_of
 
@@ -36,12 +37,24 @@ class TestTense:
 
     def test_cache(self, tense_repository: repository.TenseRepository) -> None:
         tense = model.Tense.from_repository(tense_repository)
-        assert_that(tense._cached_units, has_length(0))
+        assert_that(tense.registry, instance_of(registry.UnitRegistry))
+        assert_that(len(tense.registry), greater_than(0))
+        assert_that(list(tense)[0], is_(tense.second))
 
-        for _ in tense:
-            continue
+        # Units are iterated in declaration order.
+        assert_that(
+            [type(unit).__name__ for unit in tense],
+            equal_to(["Second", "Minute", "Hour", "Day", "Week", "Year"]),
+        )
 
-        assert_that(len(tense._cached_units), greater_than(0))
+    def test_cache_virtual(self, tense_repository: repository.TenseRepository) -> None:
+        config = tense_repository.get_config()
+        config["model.Tense"]["virtual"] = [{"duration": 10, "aliases": ["dec"]}]
+        tense = model.Tense.from_dict(config)
+        assert_that(list(tense), has_length(7))
+        assert_that(tense.virtual0, equal_to(units.VirtualUnit(["dec"], 10)))
+        assert_that(tense.virtual0, is_(tense.virtual0))
+        assert_that(tense.registry.durations[-1], equal_to(10))
 
     def test_from_dict(self, tense_repository: repository.TenseRepository) -> None:
         assert_that(
@@ -54,3 +67,55 @@ class TestTense:
         assert_that(
             model.Tense.from_repository(tense_repository), instance_of(model.Tense)
         )
+
+    def test_shared_table(self, tense_repository: repository.TenseRepository) -> None:
+        tense = model.Tense.from_repository(tense_repository)
+        config = tense_repository.get_config()
+        config["model.Tense"]["multiplier"] = 2
+        custom = model.Tense.from_dict(config)
+        # Equal units share unit table and everything derived from it.
+        assert_that(custom.registry.table, is_(tense.registry.table))
+        assert_that(custom.alias_trie, is_(tense.alias_trie))
+
+    def test_pickle(self, tense_repository: repository.TenseRepository) -> None:
+        config = tense_repository.get_config()
+        config["model.Tense"]["virtual"] = [{"duration": 10, "aliases": ["dec"]}]
+        tense = model.Tense.from_dict(config)
+        loaded = pickle.loads(pickle.dumps(tense))
+        assert_that(loaded, equal_to(tense))
+        assert_that(loaded.virtual0, equal_to(tense.virtual0))
+        # Unpickled tense is interned into the same table.
+        assert_that(loaded.registry.table, is_(tense.registry.table))
+
+    def test_overlay(self, tense_repository: repository.TenseRepository) -> None:
+        tense = model.Tense.from_repository(tense_repository)
+        virtual = [{"duration": 10, "aliases": ["dec"]}]
+        custom = tense.overlay(multiplier=2, aliases={"hour": ["hr"]}, virtual=virtual)
+        assert_that(custom.multiplier, equal_to(2))
+        assert_that(custom.second, is_(tense.second))
+        assert_that(custom.hour.aliases[-1], equal_to("hr"))
+        assert_that("hr" in tense.hour.aliases, is_(False))
+        assert_that(custom.virtual0, equal_to(units.VirtualUnit(["dec"], 10)))
+        assert_that(custom.alias_units["hr"], equal_to(custom.alias_units["hour"]))
+        assert_that("hr" in tense.alias_units, is_(False))
+
+        # Only the differences are stored, over the table of the base tense.
+        table = custom.registry.table
+        assert_that(table, instance_of(registry.OverlayTable))
+        assert_that(table.base, is_(tense.registry.table))
+        assert_that(
+            tense.overlay(aliases={"hour": ["hr"]}, virtual=virtual).registry.table,
+            is_(table),
+        )
+        assert_that(tense.overlay(multiplier=3).alias_trie, is_(tense.alias_trie))
+
+        # Same durations as a tense built with the changes.
+        config = tense_repository.get_config()
+        config["model.Tense"].update(multiplier=2, virtual=virtual)
+        config["units.Hour"]["aliases"].append("hr")
+        built = model.Tense.from_dict(config)
+        assert_that(custom, equal_to(built))
+        assert_that(
+            dict(table.alias_durations(2)),
+            equal_to(dict(built.registry.table.alias_durations(2))),
+        )
@@ -0,0 +1,84 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import concurrent.futures
+from typing import Any
+
+from hamcrest import assert_that, calling, equal_to, instance_of, raises
+
+from tense import TenseParser
+from tense.application.ports import converters as abc_converters
+from tense.service_layer import aio
+
+
+class _FailingConverter(abc_converters.AbstractConverter[int]):
+    def convert(self, value: Any) -> int:
+        if not value:
+            raise ValueError("Empty duration.")
+        return int(value)
+
+
+class _CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+    submitted = 0
+
+    def submit(self, *args: Any, **kwargs: Any) -> concurrent.futures.Future[Any]:
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def test_parse_coalesces_requests() -> None:
+    async def main(parser: aio.AsyncParser) -> list[Any]:
+        return await asyncio.gather(*(parser.parse(s) for s in ("1m", "1h") * 5))
+
+    with _CountingExecutor(max_workers=1) as executor:
+        parser = aio.AsyncParser(TenseParser(), executor=executor, max_batch_size=4)
+        assert_that(asyncio.run(main(parser)), equal_to([60, 3600] * 5))
+        # 10 strings in batches of 4.
+        assert_that(executor.submitted, equal_to(3))
+
+
+def test_parse_many() -> None:
+    parser = aio.AsyncParser(TenseParser(), max_delay=0.001)
+    assert_that(
+        asyncio.run(parser.parse_many(["1m", "", "1h"])), equal_to([60, 0, 3600])
+    )
+
+
+def test_parse_errors_are_per_awaiter() -> None:
+    async def main(parser: aio.AsyncParser) -> list[Any]:
+        return await asyncio.gather(
+            parser.parse("1m"), parser.parse("foo"), return_exceptions=True
+        )
+
+    parser = aio.AsyncParser(TenseParser(converter=_FailingConverter()))
+    ok, error = asyncio.run(main(parser))
+    assert_that(ok, equal_to(60))
+    assert_that(error, instance_of(ValueError))
+
+
+def test_invalid_arguments() -> None:
+    assert_that(
+        calling(aio.AsyncParser).with_args(TenseParser(), max_batch_size=0),
+        raises(ValueError),
+    )
+    assert_that(
+        calling(aio.AsyncParser).with_args(TenseParser(), max_delay=-1),
+        raises(ValueError),
+    )
+
+
+def test_process_executor() -> None:
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+        parser = aio.AsyncParser(TenseParser(), executor=executor)
+        assert_that(asyncio.run(parser.parse_many(["1m", "1h"])), equal_to([60, 3600]))
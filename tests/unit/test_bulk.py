@@ -0,0 +1,53 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+
+import pytest
+from hamcrest import assert_that, equal_to, greater_than
+
+from tense import TenseParser
+from tense.service_layer import bulk
+
+_LINES = ("1d1min", "1 day 2 seconds", "", "5m", "3 weeks 4 h", "2years")
+
+
+@pytest.mark.parametrize("ending", ("\n", "\r\n", ""))
+def test_parse_file(tmp_path: pathlib.Path, ending: str) -> None:
+    path = tmp_path / "durations.txt"
+    path.write_bytes(("\n".join(_LINES) + ending).encode())
+    parser = TenseParser(TenseParser.REGEX)
+
+    values, report = bulk.parse_file(path, parser=parser)
+    assert_that(values.typecode, equal_to("q"))
+    assert_that(values.tolist(), equal_to(parser.parse_many(_LINES)))
+    assert_that(report.records, equal_to(len(_LINES)))
+    assert_that(report.records_per_second, greater_than(0))
+
+
+def test_parse_file_empty(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "durations.txt"
+    path.write_bytes(b"")
+    values, report = bulk.parse_file(path)
+    assert_that((len(values), report.records), equal_to((0, 0)))
+
+
+def test_parse_file_numpy(tmp_path: pathlib.Path) -> None:
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "durations.txt"
+    path.write_bytes(b"1m\n1h\n")
+    parser = TenseParser(tenses={"model.Tense": {"multiplier": 2}})
+
+    values, _ = bulk.parse_file(path, parser=parser, out="numpy")
+    assert_that(values.dtype, equal_to(np.int64))
+    assert_that(values.tolist(), equal_to([120, 7200]))
@@ -0,0 +1,110 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+from typing import Any
+
+import pytest
+from hamcrest import (
+    assert_that,
+    calling,
+    equal_to,
+    greater_than_or_equal_to,
+    instance_of,
+    is_,
+    raises,
+)
+
+from tense import TenseParser, from_tense_directory
+from tense.adapters import parsers
+from tense.service_layer import directory
+from tense.service_layer.dot_tense import exceptions
+
+_CONFIG = "[model.Tense]\nmultiplier = {}\n"
+
+
+@pytest.fixture(name="tense_dir")
+def tense_dir_fixture(tmp_path: pathlib.Path) -> pathlib.Path:
+    (tmp_path / "eu").mkdir()
+    (tmp_path / "guild").mkdir()
+    for n in range(1, 6):
+        (tmp_path / f"tenant{n}.tense").write_text(_CONFIG.format(n))
+    (tmp_path / "eu" / "tenant6.tense").write_text(_CONFIG.format(6))
+    (tmp_path / "guild" / ".tense").write_text(_CONFIG.format(7))
+    (tmp_path / "broken.tense").write_text("[modl.Tense]\nmultiplier = 1\n")
+    (tmp_path / "notes.txt").write_text("not a config")
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_from_tense_directory(tense_dir: pathlib.Path, workers: int) -> None:
+    report = from_tense_directory(tense_dir, workers=workers)
+    assert_that(
+        {
+            name: config["model.Tense"]["multiplier"]
+            for name, config in report.configs.items()
+        },
+        equal_to(
+            {**{f"tenant{n}": n for n in range(1, 6)}, "eu/tenant6": 6, "guild": 7}
+        ),
+    )
+    assert_that(report.ok, is_(False))
+    assert_that(list(report.errors), equal_to(["broken"]))
+    assert_that(report.errors["broken"], instance_of(exceptions.AnalyzeError))
+    assert_that(len(report.timings), equal_to(8))
+    assert_that(report.elapsed, greater_than_or_equal_to(max(report.timings.values())))
+
+
+def test_from_tense_directory_parsers(tense_dir: pathlib.Path) -> None:
+    report = from_tense_directory(
+        tense_dir, workers=2, parser_cls=TenseParser.REGEX, cache_size=8
+    )
+    assert_that(report.configs["eu/tenant6"], instance_of(parsers.RegexParser))
+    assert_that(report.configs["eu/tenant6"].parse("1m"), equal_to(360))
+
+
+def test_from_tense_directory_invalid_arguments(tense_dir: pathlib.Path) -> None:
+    assert_that(
+        calling(from_tense_directory).with_args(tense_dir, workers=0),
+        raises(ValueError),
+    )
+    assert_that(
+        calling(from_tense_directory).with_args(tense_dir, cache_size=8),
+        raises(TypeError),
+    )
+    assert_that(
+        calling(from_tense_directory).with_args(tense_dir / "notes.txt"),
+        raises(NotADirectoryError),
+    )
+
+
+class _TenantError(Exception):
+    # Pickles, but can't be unpickled: `__init__` takes two arguments.
+    def __init__(self, tenant: str, reason: str) -> None:
+        super().__init__(f"{tenant}: {reason}")
+
+
+def test_errors_sent_from_workers(
+    tense_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise _TenantError("tenant1", "failed")
+
+    monkeypatch.setattr(directory, "from_tense_file", fail)
+    path = str(tense_dir / "tenant1.tense")
+
+    _, error, _ = directory._compile(path, "utf-8", None)
+    assert_that(error, instance_of(_TenantError))
+    _, error, _ = directory._compile_in_worker(path, "utf-8", None)
+    assert_that(error, instance_of(RuntimeError))
+    assert_that(str(error), equal_to("_TenantError: tenant1: failed"))
@@ -0,0 +1,124 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import concurrent.futures
+import pathlib
+from typing import Iterator
+
+import pytest
+from hamcrest import assert_that, calling, equal_to, instance_of, is_not, raises
+
+from tense import from_tense_file, from_tense_file_source
+from tense.service_layer.dot_tense import domain, exceptions, step_chain
+
+_SOURCE = """
+# Comment
+[model.Tense]
+multiplier = 2  # Inline comment
+
+[units.Minute]
+duration = exp(minute * 2)
+aliases = m, min, minute
+"""
+
+
+@pytest.mark.parametrize(
+    "line,particle_type",
+    (
+        ("[units.Minute]", domain.HeaderParticle),
+        ("duration = 60", domain.GetattributeParticle),
+    ),
+)
+def test_sorting_hat(line: str, particle_type: type) -> None:
+    particle = step_chain.sorting_hat(line)
+    assert_that(particle, instance_of(particle_type))
+    assert_that(particle.matches(), equal_to(True))
+
+
+def test_sorting_hat_unknown() -> None:
+    assert_that(calling(step_chain.sorting_hat).with_args("word"), raises(KeyError))
+
+
+def test_inject_particle_converters() -> None:
+    converters = step_chain.inject_particle_converters()
+    assert_that(list(converters), equal_to([domain.GetattributeParticle]))
+    # A copy is returned, precomputed converters can't be changed.
+    converters.clear()
+    assert_that(step_chain.inject_particle_converters(), is_not(equal_to({})))
+
+
+def test_lines_source() -> None:
+    def lines() -> Iterator[str]:
+        yield from _SOURCE.splitlines(keepends=True)
+
+    config = from_tense_file_source(_SOURCE)
+    assert_that(config["units.Minute"]["duration"], equal_to(120))
+    assert_that(from_tense_file_source(lines()), equal_to(config))
+
+
+def test_large_tense_file(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / ".tense"
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("[model.Tense]\nmultiplier = 1\n")
+        for n in range(10_000):
+            file.write(f"[units.Second]\naliases = s, sec{n}\r\n")
+    config = from_tense_file(path)
+    assert_that(config["units.Second"], equal_to({"aliases": ["s", "sec9999"]}))
+
+
+_VIRTUAL_SOURCE = """
+[model.Tense]
+multiplier = 1
+
+[Virtual]
+duration = exp(year * {0})
+aliases = v{0}, virt{0}
+"""
+
+
+def test_virtual_units_not_accumulated() -> None:
+    for _ in range(3):
+        config = from_tense_file_source(_VIRTUAL_SOURCE.format(10))
+        assert_that(
+            config["model.Tense"]["virtual"],
+            equal_to([{"duration": 315360000, "aliases": ["v10", "virt10"]}]),
+        )
+
+
+def test_concurrent_compilation() -> None:
+    sources = [_VIRTUAL_SOURCE.format(n) for n in range(1, 65)]
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        configs = list(executor.map(from_tense_file_source, sources))
+    assert_that(
+        [config["model.Tense"]["virtual"][0]["aliases"][0] for config in configs],
+        equal_to([f"v{n}" for n in range(1, 65)]),
+    )
+
+
+def test_expression_values() -> None:
+    config = from_tense_file_source(
+        "[model.Tense]\nmultiplier = 1\n[units.Hour]\nduration = exp((1 + 1) * hour)\n"
+    )
+    assert_that(config["units.Hour"]["duration"], equal_to(7200))
+    assert_that(
+        calling(from_tense_file_source).with_args(
+            "[units.Hour]\nduration = exp(open('x'))\n"
+        ),
+        raises(exceptions.ExpressionError),
+    )
+    assert_that(
+        calling(from_tense_file_source).with_args(
+            "[units.Hour]\nduration = exp(1 / 0)\n"
+        ),
+        raises(exceptions.DotTenseError, "division by zero"),
+    )
@@ -0,0 +1,117 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import subprocess
+import sys
+
+import pytest
+from hamcrest import (
+    assert_that,
+    calling,
+    empty,
+    equal_to,
+    has_items,
+    is_,
+    raises,
+    same_instance,
+)
+
+import tense
+from tense import service_layer
+from tense.service_layer import dot_tense, unit_of_work
+
+_OPTIONAL_MODULES = (
+    "tense.service_layer.dot_tense",
+    "tense.service_layer.directory",
+    "tense.service_layer.safe_eval",
+    "tense.service_layer.unit_of_work",
+    "concurrent.futures",
+    "difflib",
+    "hashlib",
+    "importlib.metadata",
+    "json",
+)
+
+
+def _loaded_after(code: str) -> list[str]:
+    """Runs code in a fresh interpreter and returns loaded optional modules."""
+    script = (
+        f"import sys\n{code}\n"
+        f"print(*[m for m in {_OPTIONAL_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+def test_import_is_lazy() -> None:
+    assert_that(_loaded_after("import tense"), is_(empty()))
+
+
+def test_attribute_imports_subsystem() -> None:
+    assert_that(
+        _loaded_after("import tense\ntense.from_tense_file"),
+        has_items("tense.service_layer.dot_tense", "tense.service_layer.safe_eval"),
+    )
+
+
+@pytest.mark.parametrize(
+    ["name", "expected"],
+    [
+        ["from_tense_file", dot_tense.from_tense_file],
+        ["from_tense_file_source", dot_tense.from_tense_file_source],
+        ["unit_of_work", unit_of_work],
+    ],
+)
+def test_lazy_attributes(name: str, expected: object) -> None:
+    assert_that(getattr(tense, name), same_instance(expected))
+    assert_that(name in dir(tense), is_(True))
+
+
+@pytest.mark.parametrize(
+    "name", ("dot_tense", "unit_of_work", "directory", "safe_eval")
+)
+def test_service_layer_submodules(name: str) -> None:
+    module = getattr(service_layer, name)
+    assert_that(module, same_instance(sys.modules[f"tense.service_layer.{name}"]))
+    assert_that(name in dir(service_layer), is_(True))
+
+
+def test_submodules_after_import() -> None:
+    script = (
+        "import tense\n"
+        "print(tense.service_layer.dot_tense.from_tense_file is tense.from_tense_file,"
+        " hasattr(tense.service_layer, 'unit_of_work'))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert_that(result.stdout.split(), equal_to(["True", "True"]))
+
+
+def test_service_layer_lazy_attributes() -> None:
+    assert_that(
+        service_layer.TenseUnitOfWork, same_instance(unit_of_work.TenseUnitOfWork)
+    )
+    assert_that(
+        sorted(service_layer.__all__),
+        equal_to(sorted(dot_tense.__all__ + unit_of_work.__all__)),
+    )
+
+
+def test_unknown_attribute() -> None:
+    assert_that(calling(getattr).with_args(tense, "missing"), raises(AttributeError))
+    assert_that(
+        calling(getattr).with_args(service_layer, "missing"), raises(AttributeError)
+    )
@@ -0,0 +1,57 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+from hamcrest import assert_that, calling, equal_to, raises
+
+from tense import TenseParser, resolvers
+from tense.service_layer import parallel
+
+_TENSE_FILEDIR = "tests/e2e/.tense"
+_STRINGS = ["1d1min", "1 day 2 seconds", "", "5m", "2 decades"] * 10
+
+
+def test_parse_parallel() -> None:
+    parser = TenseParser(TenseParser.DIGIT, time_resolver=resolvers.smart_resolver)
+    assert_that(
+        parallel.parse_parallel(
+            iter(_STRINGS),
+            workers=2,
+            chunksize=7,
+            time_resolver=resolvers.smart_resolver,
+        ),
+        equal_to(parser.parse_many(_STRINGS)),
+    )
+
+
+def test_parse_parallel_tense_file() -> None:
+    # The file sets `multiplier = 2` and a decade virtual unit.
+    assert_that(
+        parallel.parse_parallel(
+            ["1m", "1h", "1 decade"], workers=2, tense_file=_TENSE_FILEDIR
+        ),
+        equal_to([120, 7200, 60 * 60 * 24 * 365 * 10 * 2]),
+    )
+
+
+def test_parse_parallel_invalid_arguments() -> None:
+    assert_that(
+        calling(parallel.parse_parallel).with_args(_STRINGS, chunksize=0),
+        raises(ValueError),
+    )
+    assert_that(
+        calling(parallel.parse_parallel).with_args(
+            _STRINGS, tenses={}, tense_file=_TENSE_FILEDIR
+        ),
+        raises(ValueError),
+    )
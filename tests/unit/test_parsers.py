@@ -0,0 +1,339 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import gc
+import io
+import linecache
+import pickle
+from typing import Any
+
+import pytest
+from hamcrest import assert_that, calling, equal_to, instance_of, is_, raises
+
+from tense import TenseParser, resolvers
+from tense.adapters import parsers
+from tense.application import factory
+from tense.application.ports import converters as abc_converters
+
+_STRINGS = (
+    "1d1min",
+    "1d 1min",
+    "1 day 2 seconds",
+    "1day 2seconds",
+    "3 weeks 4 h",
+    "2years",
+    "10",
+    "",
+    "1dayz 5s",
+)
+
+
+def test_regex_parser_type() -> None:
+    assert_that(TenseParser(TenseParser.REGEX), instance_of(parsers.RegexParser))
+
+
+@pytest.mark.parametrize("string_to_parse", _STRINGS)
+def test_regex_parser_matches_digit_parser(string_to_parse: str) -> None:
+    digit_parser = TenseParser(TenseParser.DIGIT)
+    regex_parser = TenseParser(TenseParser.REGEX)
+    assert_that(
+        regex_parser.parse(string_to_parse),
+        equal_to(digit_parser.parse(string_to_parse)),
+    )
+
+
+def test_regex_parser_multiplier() -> None:
+    parser = TenseParser(TenseParser.REGEX, tenses={"model.Tense": {"multiplier": 2}})
+    assert_that(parser.parse("1min 1s"), equal_to(122))
+
+
+def test_tenant_parsers_share_unit_tables() -> None:
+    parser = TenseParser(TenseParser.DIGIT)
+    tenant_parser = TenseParser(
+        TenseParser.DIGIT, tenses={"model.Tense": {"multiplier": 2, "virtual": []}}
+    )
+    assert_that(tenant_parser.parse("1min 1s"), equal_to(parser.parse("1min 1s") * 2))
+    assert_that(
+        tenant_parser._tense.alias_trie, is_(parser._tense.alias_trie)  # type: ignore[attr-defined]
+    )
+
+
+def test_cache_disabled() -> None:
+    parser = TenseParser(TenseParser.DIGIT)
+    parser.parse("5m")
+    assert_that(parser.cache_info(), equal_to((0, 0, 0, 0)))
+
+
+def test_cache_lru_eviction() -> None:
+    parser = TenseParser(TenseParser.TIMEDELTA, cache_size=2)
+    for string_to_parse in ("5m", "1h", "5m", "30 seconds", "5m"):
+        parser.parse(string_to_parse)
+
+    # "1h" was the least recently used value when "30 seconds" came.
+    info = parser.cache_info()
+    assert_that((info.hits, info.misses, info.currsize), equal_to((2, 3, 2)))
+    parser.parse("1h")
+    assert_that(parser.cache_info().misses, equal_to(4))
+
+
+def test_cache_cleared_on_resolver_set() -> None:
+    parser = TenseParser(TenseParser.DIGIT, cache_size=8)
+    assert_that(parser.parse("1 minute + 1 second"), equal_to(1))
+
+    parser.resolver = resolvers.smart_resolver
+    assert_that(parser.cache_info().currsize, equal_to(0))
+    assert_that(parser.parse("1 minute + 1 second"), equal_to(61))
+
+
+def test_cache_invalid_size() -> None:
+    assert_that(
+        calling(TenseParser).with_args(TenseParser.DIGIT, cache_size=-1),
+        raises(ValueError),
+    )
+
+
+@pytest.mark.parametrize("unique", (False, True))
+def test_parse_many(unique: bool) -> None:
+    parser = TenseParser(TenseParser.TIMEDELTA)
+    assert_that(
+        parser.parse_many(iter(_STRINGS + _STRINGS), unique=unique),
+        equal_to([parser.parse(s) for s in _STRINGS + _STRINGS]),
+    )
+
+
+def test_parse_many_unique_parses_once() -> None:
+    parser = TenseParser(TenseParser.DIGIT, cache_size=8)
+    parser.parse_many(["5m", "1h", "5m", "5m"], unique=True)
+    assert_that(parser.cache_info().misses, equal_to(2))
+    assert_that(parser.cache_info().hits, equal_to(0))
+
+
+class _FailingConverter(abc_converters.AbstractConverter[int]):
+    def convert(self, value: Any) -> int:
+        if not value:
+            raise ValueError("Empty duration.")
+        return int(value)
+
+
+@pytest.mark.parametrize("buffer_size", (1, 3, 1024))
+def test_iter_parse_text_and_binary(buffer_size: int) -> None:
+    parser = TenseParser(TenseParser.DIGIT)
+    text = "1d1min\r\n1 day 2 seconds\n5m\n2years"
+    expected = parser.parse_many(["1d1min", "1 day 2 seconds", "5m", "2years"])
+
+    for stream in (io.StringIO(text), io.BytesIO(text.encode())):
+        assert_that(
+            list(parser.iter_parse(stream, buffer_size=buffer_size)),
+            equal_to(expected),
+        )
+
+
+@pytest.mark.parametrize(
+    "errors,result",
+    (("skip", [60, 3600]), ("sentinel", [60, -1, 3600])),
+)
+def test_iter_parse_errors(errors: str, result: list[int]) -> None:
+    parser = TenseParser(TenseParser.DIGIT, converter=_FailingConverter())
+    stream = io.StringIO("1m\nfoo\n1h\n")
+    assert_that(
+        list(parser.iter_parse(stream, errors=errors, sentinel=-1)),  # type: ignore[arg-type]
+        equal_to(result),
+    )
+    assert_that(
+        calling(list).with_args(parser.iter_parse(io.StringIO("foo"))),
+        raises(ValueError),
+    )
+
+
+@pytest.mark.parametrize("parser_cls", (TenseParser.DIGIT, TenseParser.REGEX))
+@pytest.mark.parametrize("wrapper", (bytes, bytearray, memoryview))
+def test_parse_bytes(parser_cls: type, wrapper: type) -> None:
+    parser = TenseParser(parser_cls, cache_size=4)
+    for string_to_parse in _STRINGS:
+        assert_that(
+            parser.parse(wrapper(string_to_parse.encode())),
+            equal_to(parser.parse(string_to_parse)),
+        )
+    assert_that(
+        parser.parse_many([wrapper(b"5m"), b"5m"], unique=True), equal_to([300, 300])
+    )
+
+
+def test_iter_parse_without_decoding() -> None:
+    parser = TenseParser(TenseParser.DIGIT, time_resolver=resolvers.smart_resolver)
+    stream = io.BytesIO(b"1 Hour\r\n5 minutes\n")
+    assert_that(
+        list(parser.iter_parse(stream, encoding=None, buffer_size=4)),
+        equal_to([3600, 300]),
+    )
+
+
+class TestMemoize:
+    def setup_method(self) -> None:
+        TenseParser.clear_memo()
+
+    def teardown_method(self) -> None:
+        TenseParser.clear_memo()
+
+    def test_memoize(self) -> None:
+        parser = TenseParser(TenseParser.DIGIT, memoize=True)
+        assert_that(TenseParser(TenseParser.DIGIT, memoize=True) is parser)
+        assert_that(
+            TenseParser(
+                TenseParser.DIGIT,
+                tenses={"model.Tense": {"multiplier": 1, "virtual": []}},
+                memoize=True,
+            )
+            is parser
+        )
+        assert_that(TenseParser(TenseParser.DIGIT) is not parser)
+        assert_that(TenseParser(TenseParser.REGEX, memoize=True) is not parser)
+        assert_that(
+            TenseParser(
+                TenseParser.DIGIT,
+                tenses={"model.Tense": {"multiplier": 2}},
+                memoize=True,
+            )
+            is not parser
+        )
+
+        info = TenseParser.memo_info()
+        assert_that((info.hits, info.misses, info.currsize), equal_to((2, 3, 3)))
+
+    def test_memoize_skips_fingerprint_on_hit(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        tenses = {"model.Tense": {"multiplier": 2, "virtual": []}}
+        parser = TenseParser(TenseParser.DIGIT, tenses=tenses, memoize=True)
+
+        def fail(_: Any) -> str:
+            raise AssertionError("Fingerprint computed on a hit.")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(factory, "_config_fingerprint", fail)
+            assert_that(
+                TenseParser(TenseParser.DIGIT, tenses=tenses, memoize=True) is parser
+            )
+
+        # Changed configuration is fingerprinted again.
+        tenses["model.Tense"]["multiplier"] = 3
+        changed = TenseParser(TenseParser.DIGIT, tenses=tenses, memoize=True)
+        assert_that(changed is not parser)
+        assert_that(changed.parse("1s"), equal_to(3))
+
+    def test_memoize_unhashable_converter(self) -> None:
+        class UnhashableConverter(abc_converters.AbstractConverter[int]):
+            __hash__ = None  # type: ignore[assignment]
+
+            def convert(self, value: Any, /) -> int:
+                return int(value)
+
+        converter = UnhashableConverter()
+        parser = TenseParser(TenseParser.DIGIT, converter=converter, memoize=True)
+        assert_that(
+            TenseParser(TenseParser.DIGIT, converter=converter, memoize=True) is parser
+        )
+
+    def test_memoize_eviction(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(TenseParser, "memo_maxsize", 1)
+        digit_parser = TenseParser(TenseParser.DIGIT, memoize=True)
+        TenseParser(TenseParser.REGEX, memoize=True)
+
+        assert_that(TenseParser.memo_info().currsize, equal_to(1))
+        assert_that(TenseParser(TenseParser.DIGIT, memoize=True) is not digit_parser)
+
+
+class TestCompiledParser:
+    @pytest.mark.parametrize(
+        "time_resolver", (resolvers.basic_resolver, resolvers.smart_resolver)
+    )
+    @pytest.mark.parametrize("cache_size", (0, 4))
+    def test_matches_digit_parser(self, time_resolver: Any, cache_size: int) -> None:
+        strings = _STRINGS + ("1 year and 10 minutes + 5 seconds",)
+        digit_parser = TenseParser(TenseParser.TIMEDELTA, time_resolver=time_resolver)
+        compiled_parser = TenseParser(
+            TenseParser.COMPILED,
+            converter=digit_parser._converter,
+            time_resolver=time_resolver,
+            cache_size=cache_size,
+        )
+        for string_to_parse in strings:
+            for raw_str in (string_to_parse, string_to_parse.encode()):
+                assert_that(
+                    compiled_parser.parse(raw_str),
+                    equal_to(digit_parser.parse(raw_str)),
+                )
+        assert_that(
+            compiled_parser.parse_many(strings),
+            equal_to(digit_parser.parse_many(strings)),
+        )
+
+    def test_source(self) -> None:
+        parser = TenseParser(TenseParser.COMPILED)
+        assert_that("_DURATIONS = {'s': 1" in parser.source)  # type: ignore[attr-defined]
+        assert_that("_split(" in parser.source)  # type: ignore[attr-defined]
+
+    def test_recompiled_on_resolver_set(self) -> None:
+        parser = TenseParser(TenseParser.COMPILED)
+        assert_that(parser.parse("1 minute + 1 second"), equal_to(1))
+
+        parser.resolver = resolvers.smart_resolver
+        assert_that("_resolver(" in parser.source)  # type: ignore[attr-defined]
+        assert_that(parser.parse("1 minute + 1 second"), equal_to(61))
+
+    def test_linecache_entry(self) -> None:
+        parser = TenseParser(TenseParser.COMPILED)
+        filename = parser._filename  # type: ignore[attr-defined]
+        assert_that(linecache.getline(filename, 1), equal_to(parser.source.splitlines(True)[0]))  # type: ignore[attr-defined]
+
+        # Recompiles reuse the entry of the parser.
+        entries = len(linecache.cache)
+        for _ in range(3):
+            parser.resolver = resolvers.smart_resolver
+        assert_that(len(linecache.cache), equal_to(entries))
+
+        del parser
+        gc.collect()
+        assert_that(filename in linecache.cache, is_(False))
+
+
+@pytest.mark.filterwarnings("error")
+def test_iteration_speedup_no_op() -> None:
+    parser = TenseParser(TenseParser.DIGIT, iteration_speedup=True)
+    assert_that(parser.parse("1m"), equal_to(60))
+
+
+@pytest.mark.parametrize(
+    "parser_type",
+    (
+        TenseParser.DIGIT,
+        TenseParser.TIMEDELTA,
+        TenseParser.REGEX,
+        TenseParser.COMPILED,
+    ),
+)
+def test_pickle(parser_type: Any) -> None:
+    parser = TenseParser(
+        parser_type, time_resolver=resolvers.smart_resolver, cache_size=4
+    )
+    parser.parse("1 minute + 1 second")
+    loaded = pickle.loads(pickle.dumps(parser))
+    assert_that(loaded, instance_of(type(parser)))
+    assert_that(loaded.cache_info().maxsize, equal_to(4))
+    assert_that(loaded.cache_info().currsize, equal_to(0))
+    for string_to_parse in _STRINGS + ("1 minute + 1 second",):
+        assert_that(
+            loaded.parse(string_to_parse), equal_to(parser.parse(string_to_parse))
+        )
+    # Tables are shared through the interned tense table.
+    assert_that(loaded._durations, is_(parser._durations))
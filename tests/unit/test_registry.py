@@ -0,0 +1,163 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import gc
+import pickle
+import sys
+import weakref
+from array import array
+
+import pytest
+from hamcrest import (
+    assert_that,
+    calling,
+    equal_to,
+    has_length,
+    instance_of,
+    is_,
+    less_than,
+    none,
+    raises,
+)
+
+from tense.domain import registry, units
+
+
+@pytest.fixture(name="unit_registry")
+def unit_registry_fixture() -> registry.UnitRegistry:
+    unit_registry = registry.UnitRegistry()
+    unit_registry.add(units.Minute(["m", "min"]))
+    for n in range(1000):
+        unit_registry.add_virtual(aliases=[f"v{n}", "virt"], duration=n + 1)
+    return unit_registry
+
+
+def test_registry(unit_registry: registry.UnitRegistry) -> None:
+    assert_that(unit_registry, has_length(1001))
+    assert_that(unit_registry.durations[0], equal_to(60))
+    assert_that(unit_registry.aliases(1), equal_to(["v0", "virt"]))
+    assert_that(
+        list(unit_registry)[-1], equal_to(units.VirtualUnit(["v999", "virt"], 1000))
+    )
+    # Equal aliases share one interned string.
+    assert_that(unit_registry.aliases(1)[1], is_(unit_registry.aliases(2)[1]))
+
+
+def test_registry_read_only(unit_registry: registry.UnitRegistry) -> None:
+    with pytest.raises(TypeError):
+        unit_registry.durations[0] = 1
+
+
+def test_registry_add_virtual_warning() -> None:
+    with pytest.warns(UserWarning):
+        registry.UnitRegistry().add_virtual(aliases=["x"], duration=0)
+
+
+def test_registry_add_virtual_invalid() -> None:
+    with pytest.raises(TypeError):
+        registry.UnitRegistry().add_virtual(**{"aliases": ["x"], "dur": 1})
+
+
+def test_registry_nbytes(unit_registry: registry.UnitRegistry) -> None:
+    objects = [units.VirtualUnit([f"v{n}", "virt"], n + 1) for n in range(1000)]
+    objects_nbytes = sum(
+        sys.getsizeof(unit) + sys.getsizeof(unit.__dict__) + sys.getsizeof(unit.aliases)
+        for unit in objects
+    )
+    assert_that(unit_registry.nbytes, less_than(objects_nbytes))
+
+
+def test_registry_frozen(unit_registry: registry.UnitRegistry) -> None:
+    table = unit_registry.freeze()
+    assert_that(unit_registry.table, is_(table))
+    assert_that(unit_registry.aliases(1), equal_to(table.aliases(1)))
+    with pytest.raises(TypeError):
+        unit_registry.add_virtual(aliases=["x"], duration=1)
+
+
+def test_table_hash_consing(unit_registry: registry.UnitRegistry) -> None:
+    other = registry.UnitRegistry()
+    other.add(units.Minute(["m", "min"]))
+    for n in range(1000):
+        other.add_virtual(aliases=[f"v{n}", "virt"], duration=n + 1)
+
+    table = unit_registry.freeze()
+    assert_that(other.freeze(), is_(table))
+    assert_that(other.table.alias_trie, is_(table.alias_trie))
+    assert_that(table.scaled_durations(2)[0], equal_to(120))
+    assert_that(table.alias_durations(2)["virt"], equal_to(sum(range(1, 1001)) * 2))
+
+
+def test_registry_pickle(unit_registry: registry.UnitRegistry) -> None:
+    loaded = pickle.loads(pickle.dumps(unit_registry))
+    assert_that(list(loaded), equal_to(list(unit_registry)))
+    loaded.add_virtual(aliases=["x"], duration=1)
+
+    table = unit_registry.freeze()
+    assert_that(pickle.loads(pickle.dumps(unit_registry)).table, is_(table))
+    assert_that(pickle.loads(pickle.dumps(table)), is_(table))
+
+
+def test_overlay(unit_registry: registry.UnitRegistry) -> None:
+    overlay = unit_registry.overlay(
+        {0: ["minute"], 1: ["zero"]}, [{"aliases": ["dec"], "duration": 10}]
+    )
+    table = overlay.table
+    assert_that(table, instance_of(registry.OverlayTable))
+    assert_that(table.base, is_(unit_registry.table))
+    assert_that(overlay, has_length(1002))
+    assert_that(overlay.unit(0), equal_to(units.Minute(["m", "min", "minute"])))
+    assert_that(overlay.unit(1), equal_to(units.VirtualUnit(["v0", "virt", "zero"], 1)))
+    assert_that(overlay.unit(2), equal_to(unit_registry.unit(2)))
+    assert_that(overlay.unit(1001), equal_to(units.VirtualUnit(["dec"], 10)))
+    assert_that(overlay.durations[-1], equal_to(10))
+    assert_that(table.alias_durations(1)["minute"], equal_to(60))
+    assert_that(table.alias_durations(1)["virt"], equal_to(sum(range(1, 1001))))
+    assert_that(table.alias_units["zero"], equal_to((1,)))
+    assert_that(table.alias_trie.search("10minutes"), equal_to("min"))
+    # Only the differences are stored.
+    assert_that(overlay.nbytes + table.nbytes, less_than(unit_registry.table.nbytes))
+
+
+def test_overlay_of_overlay(unit_registry: registry.UnitRegistry) -> None:
+    overlay = unit_registry.overlay(
+        {0: ["minute"]}, [{"aliases": ["x"], "duration": 2}]
+    )
+    nested = overlay.overlay({1001: ["y"]}, [{"aliases": ["z"], "duration": 3}])
+    # Layered over the same base table.
+    assert_that(nested.table.base, is_(unit_registry.table))
+    assert_that(nested.aliases(1001), equal_to(["x", "y"]))
+    assert_that(nested.aliases(1002), equal_to(["z"]))
+    assert_that(
+        unit_registry.overlay(
+            {0: ["minute"]},
+            [{"aliases": ["x", "y"], "duration": 2}, {"aliases": ["z"], "duration": 3}],
+        ).table,
+        is_(nested.table),
+    )
+    assert_that(calling(overlay.overlay).with_args({2000: ["x"]}), raises(IndexError))
+
+
+def test_overlay_pickle(unit_registry: registry.UnitRegistry) -> None:
+    overlay = unit_registry.overlay({0: ["minute"]})
+    loaded = pickle.loads(pickle.dumps(overlay))
+    assert_that(loaded.table, is_(overlay.table))
+    assert_that(list(loaded), equal_to(list(overlay)))
+
+
+def test_table_freed() -> None:
+    table = registry.UnitTable.intern(array("q", (7,)), ["x"], array("q", (0, 1)))
+    ref = weakref.ref(table)
+    del table
+    gc.collect()
+    assert_that(ref(), is_(none()))
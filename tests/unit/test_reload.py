@@ -0,0 +1,96 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import gc
+import os
+import pathlib
+import time
+import weakref
+
+import pytest
+from hamcrest import assert_that, equal_to, instance_of, is_, none
+
+from tense import TenseParser
+from tense.adapters import parsers
+from tense.service_layer import reload
+
+_CONFIG = "[model.Tense]\nmultiplier = {}\n"
+
+
+def _write(path: pathlib.Path, source: str) -> None:
+    # Writes to a new file and renames it over the old one, as deploy tools do.
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(source)
+    os.replace(tmp_path, path)
+
+
+@pytest.fixture(name="tense_file")
+def tense_file_fixture(tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / ".tense"
+    _write(path, _CONFIG.format(2))
+    return path
+
+
+def test_check(tense_file: pathlib.Path) -> None:
+    parser = reload.ReloadingParser(
+        tense_file, start=False, parser_cls=TenseParser.REGEX
+    )
+    assert_that(parser.parse("1m"), equal_to(120))
+    assert_that(parser.check(), is_(False))
+
+    old_parser = parser.parser
+    _write(tense_file, _CONFIG.format(3))
+    assert_that(parser.check(), is_(True))
+    assert_that(parser.parse("1m"), equal_to(180))
+    assert_that(parser.parse_many(["1m"]), equal_to([180]))
+    assert_that(parser.parser, instance_of(parsers.RegexParser))
+    assert_that(parser.version, equal_to(1))
+    # Old parser is left intact for in-flight parses.
+    assert_that(old_parser.parse("1m"), equal_to(120))
+
+
+def test_broken_file_keeps_parser(tense_file: pathlib.Path) -> None:
+    parser = reload.ReloadingParser(tense_file, start=False)
+    _write(tense_file, "[model.Tense]\nmultiplier = (\n")
+    assert_that(parser.check(), is_(False))
+    assert_that(parser.last_error, instance_of(Exception))
+    assert_that(parser.parse("1m"), equal_to(120))
+    # Broken file is not recompiled until it changes.
+    assert_that(parser.check(), is_(False))
+
+    _write(tense_file, _CONFIG.format(4))
+    assert_that(parser.check(), is_(True))
+    assert_that(parser.last_error, is_(none()))
+    assert_that(parser.parse("1m"), equal_to(240))
+
+
+def test_watcher_thread(tense_file: pathlib.Path) -> None:
+    with reload.ReloadingParser(tense_file, interval=0.01) as parser:
+        _write(tense_file, _CONFIG.format(5))
+        deadline = time.monotonic() + 5
+        while parser.version == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert_that(parser.parse("1m"), equal_to(300))
+
+
+def test_watcher_thread_stops_when_collected(tense_file: pathlib.Path) -> None:
+    parser = reload.ReloadingParser(tense_file, interval=0.01)
+    thread = parser._thread
+    assert thread is not None
+    ref = weakref.ref(parser)
+
+    del parser
+    gc.collect()
+    thread.join(timeout=5)
+    assert_that(ref(), is_(none()))
+    assert_that(thread.is_alive(), is_(False))
@@ -11,10 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterator
+from typing import Any, Iterator
 
 import pytest
-from hamcrest import assert_that, equal_to
+from hamcrest import assert_that, equal_to, is_, is_not
 
 from tense import model, resolvers
 from tense.adapters import repository
@@ -59,3 +59,92 @@ def test_basic_resolver(
     assert_that(
         list(resolvers.basic_resolver(string_to_parse, tense)), equal_to(result)
     )
+
+
+@pytest.mark.parametrize(
+    "string_to_parse,result",
+    (
+        ("1year and 10 minutes + 5 seconds", ["1", "year", "10", "min", "5", "sec"]),
+        ("2 HOURS, 3 Days", ["2", "hour", "3", "day"]),
+        ("7 fortnights", ["7"]),
+    ),
+)
+def test_smart_resolver_complex(
+    string_to_parse: str, result: list[str], tense: model.Tense
+) -> None:
+    assert_that(
+        list(resolvers.smart_resolver(string_to_parse, tense)), equal_to(result)
+    )
+
+
+@pytest.mark.parametrize("wrapper", (bytes, bytearray, memoryview))
+def test_resolvers_bytes(wrapper: type, tense: model.Tense) -> None:
+    raw_str = wrapper(b"1year and 10 Minutes + 5 seconds")
+    assert_that(
+        list(resolvers.basic_resolver(raw_str, tense)),
+        equal_to([b"1", b"yearand", b"10", b"Minutes+", b"5", b"seconds"]),
+    )
+    assert_that(
+        list(resolvers.smart_resolver(raw_str, tense)),
+        equal_to([b"1", b"year", b"10", b"min", b"5", b"sec"]),
+    )
+
+
+@pytest.mark.parametrize(
+    "string_to_parse",
+    (
+        "1d1min",
+        "1d 1min 2 seconds",
+        "1year and 10 minutes + 5 seconds",
+        "2 HOURS, 3 Days",
+        "fortnight 7",
+        "",
+    ),
+)
+@pytest.mark.parametrize(
+    "resolver", (resolvers.basic_resolver, resolvers.smart_resolver)
+)
+def test_native_pair_resolvers(
+    string_to_parse: str, resolver: Any, tense: model.Tense
+) -> None:
+    native = resolvers.as_pair_resolver(resolver)
+    adapted = resolvers.as_pair_resolver(lambda s, t: resolver(s, t))
+    assert_that(native, is_not(adapted))
+    for raw_str in (string_to_parse, string_to_parse.encode()):
+        assert_that(
+            list(native(raw_str, tense)), equal_to(list(adapted(raw_str, tense)))
+        )
+
+
+def test_pair_resolver_unit_indexes(tense: model.Tense) -> None:
+    units = list(tense)
+    pairs = list(resolvers.basic_pair_resolver("2h30min", tense))
+    assert_that(
+        [(quantity, type(units[idx]).__name__) for quantity, idx in pairs],
+        equal_to([(2, "Hour"), (30, "Minute")]),
+    )
+
+
+@pytest.mark.parametrize(
+    "string_to_parse",
+    ("1d 10min", "  2 hours, 3 Days!!", "1year_and__10 мин", "", "   "),
+)
+def test_tokenize_spans(string_to_parse: str, tense: model.Tense) -> None:
+    spans = list(resolvers.tokenize_spans(string_to_parse, tense))
+    tokens = [string_to_parse[start:end] for start, end, _ in spans]
+    assert_that("".join(tokens), equal_to("".join(string_to_parse.split())))
+    for token, (_, _, kind) in zip(tokens, spans):
+        if kind == resolvers.SPAN_NUMBER:
+            assert_that(token.isdigit(), is_(True))
+        elif kind == resolvers.SPAN_UNIT:
+            assert_that(token in tense.alias_units, is_(True))
+        elif kind == resolvers.SPAN_WORD:
+            assert_that(token.isalpha() and token not in tense.alias_units, is_(True))
+
+
+def test_tokenize_spans_bytes(tense: model.Tense) -> None:
+    raw_str = memoryview(b"2 hours, 3 days")
+    assert_that(
+        list(resolvers.tokenize_spans(raw_str, tense)),
+        equal_to(list(resolvers.tokenize_spans(raw_str.tobytes().decode(), tense))),
+    )
@@ -13,7 +13,8 @@
 # limitations under the License.
 from typing import Final
 
-from hamcrest import assert_that, equal_to, is_in
+import pytest
+from hamcrest import assert_that, calling, equal_to, is_in, raises
 
 from tense.service_layer import safe_eval
 
@@ -42,3 +43,49 @@ def test_eval_safety() -> None:
 
     safe_eval.SafelyExpEvalute("delattr(__builtins__, 'int')")
     assert_that(itemgetter("int")(__builtins__), equal_to(int))
+
+
+@pytest.mark.parametrize(
+    "exp,result",
+    (
+        ("2 + 2 * 2", 6),
+        (" (minute + 1) * 2 ", 122),
+        ("-year // 2 % 7", -(60 * 60 * 24 * 365) // 2 % 7),
+        ("2 ** 10 / 4", 256.0),
+        ("year * 10", 60 * 60 * 24 * 365 * 10),
+    ),
+)
+def test_evaluate_arithmetic(exp: str, result: float) -> None:
+    names = {"minute": 60, "year": 60 * 60 * 24 * 365}
+    assert_that(safe_eval.evaluate_arithmetic(exp, names), equal_to(result))
+
+
+@pytest.mark.parametrize(
+    "exp",
+    (
+        "__import__('os').getcwd()",
+        "globals()",
+        "minute.__class__",
+        "[1, 2]",
+        "'1' * 2",
+        "True + 1",
+        "unknown * 2",
+        "1 / 0",
+        "9 ** 9 ** 9",
+        "(((((2 ** 128) ** 128) ** 128) ** 128) ** 128)",
+        "(2 ** 64) ** 64",
+        "2 ** 100 * 2 ** 100 * 2 ** 100" + " * 2 ** 100" * 40,
+        "2 +",
+        "1" * 2000,
+    ),
+)
+def test_evaluate_arithmetic_errors(exp: str) -> None:
+    assert_that(
+        calling(safe_eval.evaluate_arithmetic).with_args(exp, {"minute": 60}),
+        raises(ValueError),
+    )
+
+
+def test_evaluate_arithmetic_names_in_cache_key() -> None:
+    assert_that(safe_eval.evaluate_arithmetic("x * 2", {"x": 1}), equal_to(2))
+    assert_that(safe_eval.evaluate_arithmetic("x * 2", {"x": 2}), equal_to(4))
@@ -0,0 +1,121 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+
+import pytest
+from hamcrest import assert_that, calling, equal_to, instance_of, is_, is_not, raises
+
+from tense import TenseParser
+from tense.adapters import parsers, repository
+from tense.application import ParserRegistry, exceptions
+from tense.domain import model
+
+_TENSE_FILEDIR = "tests/e2e/.tense"
+
+
+def test_lazy_build_and_counters() -> None:
+    registry = ParserRegistry()
+    registry.register("tenant", repository.TenseRepository())
+    assert_that(registry.info().currsize, equal_to(0))
+
+    parser = registry.get("tenant")
+    assert_that(registry["tenant"], is_(parser))
+    info = registry.info()
+    assert_that((info.hits, info.misses, info.currsize), equal_to((1, 1, 1)))
+
+
+@pytest.mark.parametrize("source", (_TENSE_FILEDIR, pathlib.Path(_TENSE_FILEDIR)))
+def test_tense_file_loader(source: object) -> None:
+    registry = ParserRegistry(parser_cls=TenseParser.REGEX)
+    registry.register("tenant", source)
+    # The file sets `multiplier = 2`.
+    assert_that(registry.get("tenant").parse("1m"), equal_to(120))
+    assert_that(registry.get("tenant"), instance_of(parsers.RegexParser))
+
+
+def test_tense_loader() -> None:
+    tense = model.Tense.from_repository(repository.TenseRepository())
+    registry = ParserRegistry()
+    registry.register("tenant", tense.overlay(aliases={"minute": ["minuta"]}))
+    parser = registry.get("tenant")
+    assert_that(parser.parse("2minuta"), equal_to(120))
+    assert_that(parser._tense.registry.table.base, is_(tense.registry.table))  # type: ignore[attr-defined]
+
+
+def test_callable_loader() -> None:
+    registry = ParserRegistry()
+    parser = TenseParser()
+    registry.register("tenant", lambda: parser)
+    assert_that(registry.get("tenant"), is_(parser))
+    assert_that(
+        calling(registry.register).with_args("other", lambda: parser, cache_size=1),
+        raises(TypeError),
+    )
+
+
+def test_lru_eviction_by_count() -> None:
+    registry = ParserRegistry(maxsize=2)
+    for key in "abc":
+        registry.register(key, {})
+
+    first = registry.get("a")
+    registry.get("b")
+    registry.get("a")
+    registry.get("c")  # Evicts "b".
+    info = registry.info()
+    assert_that((info.evictions, info.currsize), equal_to((1, 2)))
+    assert_that(registry.get("a"), is_(first))
+
+    registry.get("b")  # Rebuilt, evicts "c".
+    assert_that(registry.info().misses, equal_to(4))
+    assert_that(len(registry), equal_to(3))
+
+
+def test_eviction_by_memory() -> None:
+    registry = ParserRegistry(maxsize=None, max_memory=250, sizeof=lambda _: 100)
+    for key in "abc":
+        registry.register(key, {})
+        registry.get(key)
+    info = registry.info()
+    assert_that((info.evictions, info.currsize, info.nbytes), equal_to((1, 2, 200)))
+
+
+def test_register_discards_built_parser() -> None:
+    registry = ParserRegistry()
+    registry.register("tenant", {})
+    parser = registry.get("tenant")
+    registry.register("tenant", {"model.Tense": {"multiplier": 2, "virtual": []}})
+    assert_that(registry.get("tenant"), is_not(parser))
+    assert_that(registry.get("tenant").parse("1m"), equal_to(120))
+
+
+def test_unknown_tenant() -> None:
+    registry = ParserRegistry()
+    assert_that(calling(registry.get).with_args("x"), raises(exceptions.UnknownTenant))
+    assert_that(calling(registry.get).with_args("x"), raises(KeyError))
+    assert_that(
+        calling(registry.unregister).with_args("x"), raises(exceptions.UnknownTenant)
+    )
+
+
+def test_evict_and_clear() -> None:
+    registry = ParserRegistry()
+    registry.register("tenant", {})
+    registry.get("tenant")
+    assert_that(registry.evict("tenant"), is_(True))
+    assert_that(registry.evict("tenant"), is_(False))
+    registry.get("tenant")
+    registry.clear()
+    assert_that(registry.info(), equal_to((0, 0, 0, 128, 0, 0)))
+    assert_that("tenant" in registry, is_(True))
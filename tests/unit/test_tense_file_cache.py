@@ -0,0 +1,78 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+from typing import Any
+
+import pytest
+from hamcrest import assert_that, equal_to, has_length
+
+from tense import from_tense_file
+from tense.service_layer.dot_tense import cache, step_chain
+
+_CONFIG = "[model.Tense]\nmultiplier = {}\n"
+
+
+@pytest.fixture(name="tense_file")
+def tense_file_fixture(tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / ".tense"
+    path.write_text(_CONFIG.format(2))
+    return path
+
+
+def _fail(*_: Any) -> Any:
+    raise AssertionError("The step chain must be skipped.")
+
+
+def test_cache_hit_skips_step_chain(
+    tense_file: pathlib.Path, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_dir = tmp_path / "cache"
+    config = from_tense_file(tense_file, cache_dir=cache_dir)
+    assert_that(list(cache_dir.iterdir()), has_length(1))
+
+    monkeypatch.setattr(step_chain, "from_tense_file_source", _fail)
+    assert_that(from_tense_file(tense_file, cache_dir=cache_dir), equal_to(config))
+
+
+def test_cache_keyed_by_source(
+    tense_file: pathlib.Path, tmp_path: pathlib.Path
+) -> None:
+    from_tense_file(tense_file, cache_dir=tmp_path)
+    tense_file.write_text(_CONFIG.format(3))
+    config = from_tense_file(tense_file, cache_dir=tmp_path)
+    assert_that(config["model.Tense"]["multiplier"], equal_to(3))
+
+
+@pytest.mark.parametrize(
+    "content",
+    (b"", b"{not json", b"[]", b'{"format": 1, "version": "other", "config": {}}'),
+)
+def test_corrupted_cache(
+    tense_file: pathlib.Path, tmp_path: pathlib.Path, content: bytes
+) -> None:
+    cache_dir = tmp_path / "cache"
+    config = from_tense_file(tense_file, cache_dir=cache_dir)
+    (entry,) = cache_dir.iterdir()
+    entry.write_bytes(content)
+
+    assert_that(from_tense_file(tense_file, cache_dir=cache_dir), equal_to(config))
+    # Corrupted entry is rewritten.
+    assert_that(cache.load(cache_dir, cache.file_key(tense_file)), equal_to(config))
+
+
+def test_unwritable_cache(tense_file: pathlib.Path) -> None:
+    cache_dir = tense_file / "cache"  # A file can't contain a directory.
+    config = from_tense_file(tense_file, cache_dir=cache_dir)
+    assert_that(config["model.Tense"]["multiplier"], equal_to(2))
+    assert_that(cache.store(cache_dir, cache.source_key(""), {}), equal_to(False))
@@ -0,0 +1,78 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Any
+
+import pytest
+from hamcrest import assert_that, equal_to, is_, none
+
+from tense.domain import trie
+
+
+@pytest.fixture(name="alias_trie")
+def alias_trie_fixture() -> trie.AliasTrie:
+    return trie.AliasTrie(["s", "sec", "seconds", "m", "min", "minute", "h", "hour"])
+
+
+@pytest.mark.parametrize(
+    "part,alias",
+    (
+        ("s", "s"),
+        ("sec", "sec"),
+        ("seconds", "sec"),
+        ("minutes", "min"),
+        ("thehourafter", "hour"),
+        ("hminute", "min"),
+    ),
+)
+def test_search(alias_trie: trie.AliasTrie, part: str, alias: str) -> None:
+    assert_that(alias_trie.search(part), equal_to(alias))
+
+
+@pytest.mark.parametrize("part", ("", "x", "ms", "sh"))
+def test_search_miss(alias_trie: trie.AliasTrie, part: str) -> None:
+    # Single letter aliases never match longer parts.
+    assert_that(alias_trie.search(part), is_(none()))
+
+
+def test_search_priority() -> None:
+    # The first declared alias wins regardless of its position in the part.
+    alias_trie = trie.AliasTrie(["hour", "min", "min"])
+    assert_that(alias_trie.search("minhour"), equal_to("hour"))
+
+
+@pytest.mark.parametrize(
+    "text,start,end,alias",
+    (
+        ("10min", 2, 5, "min"),
+        ("10minutes", 2, 5, "min"),
+        ("10minutes", 2, None, None),
+        ("sec", 0, None, "sec"),
+        (b"10sec", 2, 5, b"sec"),
+        ("10Sec", 2, 5, None),
+    ),
+)
+def test_match(
+    alias_trie: trie.AliasTrie, text: Any, start: int, end: Any, alias: Any
+) -> None:
+    assert_that(alias_trie.match(text, start, end), equal_to(alias))
+
+
+def test_extend(alias_trie: trie.AliasTrie) -> None:
+    extended = alias_trie.extend(["sek", "minuta"], start=8)
+    assert_that(extended.search("5sek"), equal_to("sek"))
+    assert_that(extended.search(b"minuta"), equal_to(b"min"))
+    assert_that(extended.search("hour"), equal_to("hour"))
+    # The original trie is not changed, untouched nodes are shared.
+    assert_that(alias_trie.search("5sek"), is_(none()))
+    assert_that(extended._root["h"], is_(alias_trie._root["h"]))
@@ -0,0 +1,55 @@
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+from hamcrest import assert_that, equal_to
+
+from tense import TenseParser
+
+np = pytest.importorskip("numpy")
+
+from tense.service_layer import vectorized  # noqa: E402
+
+
+def test_parse_array_matches_parser() -> None:
+    strings = ["1d1min", "1 day 2 seconds", "", "5m", "5m", "2years"]
+    parser = TenseParser(TenseParser.DIGIT)
+    result = vectorized.parse_array(np.array(strings), chunk_size=4)
+
+    assert_that(result.dtype, equal_to(np.int64))
+    assert_that(result.tolist(), equal_to(parser.parse_many(strings)))
+
+
+def test_parse_array_mask() -> None:
+    seconds, valid = vectorized.parse_array(
+        ["1m", None, float("nan"), 5, "1h"], with_mask=True
+    )
+    assert_that(seconds.tolist(), equal_to([60, 0, 0, 0, 3600]))
+    assert_that(valid.tolist(), equal_to([True, False, False, False, True]))
+
+
+def test_parse_array_uses_parser_tense() -> None:
+    parser = TenseParser(
+        TenseParser.TIMEDELTA, tenses={"model.Tense": {"multiplier": 2}}
+    )
+    result = vectorized.parse_array(np.array([[b"1m", b"1h"]]), parser=parser)
+    assert_that(result.tolist(), equal_to([[120, 7200]]))
+
+
+def test_parse_array_uses_parser_cache() -> None:
+    parser = TenseParser(TenseParser.DIGIT, cache_size=8)
+    parser.parse("1m")
+    vectorized.parse_array(["1m", "1h", "1m"], parser=parser)
+    # Distinct strings are parsed once: "1m" is a hit, "1h" a miss.
+    info = parser.cache_info()
+    assert_that((info.hits, info.misses), equal_to((1, 2)))